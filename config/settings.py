@@ -563,6 +563,23 @@ GDPR_COOKIE_NAME = "accept-cookies"
 
 DEFAULT_PAGE_SIZE = 30
 
+# Max number of most recent matches ranked in site-wide searches
+
+SEARCH_MAX_CANDIDATES = env.int("SEARCH_MAX_CANDIDATES", 1000)
+
+# Max number of feeds not already in the database added as new podcasts by a
+# single OPML import. Further unknown feeds in the document are ignored.
+
+OPML_IMPORT_MAX_NEW_PODCASTS = env.int("OPML_IMPORT_MAX_NEW_PODCASTS", 2000)
+
+# Local directory for memory-mapped copies of recommender TF-IDF indexes.
+# Indexes are stored in the database and copied here by each process on first use.
+
+RECOMMENDER_INDEX_DIR = env.path(
+    "RECOMMENDER_INDEX_DIR",
+    default=BASE_DIR / "recommender",
+)
+
 # Default language for Discover feed
 
 DISCOVER_FEED_LANGUAGE = env("DISCOVER_FEED_LANGUAGE", default="en")
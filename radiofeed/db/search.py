@@ -1,9 +1,14 @@
+import contextlib
 import functools
+import hashlib
 import operator
-from typing import TYPE_CHECKING, TypeAlias
+import time
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, TypeAlias, overload
 
 from django.contrib.postgres.search import SearchQuery, SearchRank
-from django.db.models import F, Q, QuerySet
+from django.core.cache import cache
+from django.db.models import F, Model, Q, QuerySet
 
 if TYPE_CHECKING:
     Base: TypeAlias = QuerySet
@@ -17,6 +22,9 @@ class Searchable(Base):
 
     default_search_fields: tuple[str, ...] = ()
 
+    # Ordering of candidates if `max_candidates` set: should be indexed
+    search_candidates_ordering: tuple[str, ...] = ("-pk",)
+
     def search(
         self,
         value: str,
@@ -24,8 +32,14 @@ class Searchable(Base):
         annotation: str = "rank",
         config: str = "simple",
         search_type: str = "websearch",
+        max_candidates: int | None = None,
     ) -> QuerySet:
-        """Search the model's default manager queryset using full-text search."""
+        """Search the model's default manager queryset using full-text search.
+
+        If `max_candidates` is set, only this number of matches, ordered by
+        `search_candidates_ordering` (e.g. most recent first), are ranked. This
+        bounds the cost of broad searches, as older matches are not included.
+        """
         if not value:
             return self.none()
 
@@ -53,4 +67,113 @@ class Searchable(Base):
             ),
         )
 
+        if max_candidates:
+            candidates = (
+                self.filter(q)
+                .order_by(*self.search_candidates_ordering)
+                .values("pk")[:max_candidates]
+            )
+            return self.annotate(**{annotation: rank}).filter(pk__in=candidates)
+
         return self.annotate(**{annotation: rank}).filter(q)
+
+    def search_cached(
+        self,
+        value: str,
+        *search_fields: str,
+        order_by: Sequence[str] = ("-rank",),
+        **kwargs,
+    ) -> SearchResults:
+        """Search as `search`, caching IDs of results for each page.
+
+        Cached IDs are invalidated by `bump_search_generation`, e.g. when the
+        feed parser updates searchable fields of the model.
+        """
+        # websearch syntax is case-insensitive, so normalizing the value only
+        # makes more queries share the same cache key
+        value = " ".join(value.lower().split())
+
+        return SearchResults(
+            self,
+            self.search(value, *search_fields, **kwargs).order_by(*order_by),
+        )
+
+
+class SearchResults(Sequence):
+    """Lazily evaluated search results.
+
+    Each slice (usually a page) of IDs is cached with a key based on the
+    search SQL, including the search value, fields, filters and ordering.
+    If found, only the objects are fetched, by primary key.
+    """
+
+    def __init__(self, queryset: QuerySet, search_queryset: QuerySet) -> None:
+        self.queryset = queryset
+        self.search_queryset = search_queryset
+
+    @overload
+    def __getitem__(self, index: int) -> Model: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Model]: ...
+
+    def __getitem__(self, index: int | slice) -> Model | list[Model]:
+        """Returns item or slice of items."""
+        if isinstance(index, int):
+            return self[index : index + 1][0]
+
+        if self.search_queryset.query.is_empty():
+            return []
+
+        start, stop = index.start or 0, index.stop
+        cache_key = f"{self.cache_key}:{start}:{stop}"
+
+        if (pks := cache.get(cache_key)) is None:
+            pks = list(self.search_queryset.values_list("pk", flat=True)[start:stop])
+            cache.set(cache_key, pks)
+
+        objects = self.queryset.in_bulk(pks)
+        return [objects[pk] for pk in pks if pk in objects]
+
+    def __len__(self) -> int:
+        """Returns total number of results."""
+        if self.search_queryset.query.is_empty():
+            return 0
+
+        cache_key = f"{self.cache_key}:count"
+
+        if (count := cache.get(cache_key)) is None:
+            count = self.search_queryset.count()
+            cache.set(cache_key, count)
+
+        return count
+
+    @functools.cached_property
+    def cache_key(self) -> str:
+        """Returns cache key prefix for these results."""
+        digest = hashlib.sha256(str(self.search_queryset.query).encode()).hexdigest()
+        generation = get_search_generation(self.queryset.model)
+        return f"search:{self.queryset.model._meta.label_lower}:{generation}:{digest}"
+
+
+def get_search_generation(model: type[Model]) -> int:
+    """Returns generation of cached search results for the model."""
+    # Counters start from current time rather than zero, so results cached
+    # before a counter is evicted are never reused.
+    return cache.get_or_set(
+        _get_generation_cache_key(model),
+        time.time_ns,
+        timeout=None,
+    )
+
+
+def bump_search_generation(*models: type[Model]) -> None:
+    """Invalidates cached search results for the models."""
+    for model in models:
+        # counter not found: there are no cached results to invalidate
+        with contextlib.suppress(ValueError):
+            cache.incr(_get_generation_cache_key(model))
+
+
+def _get_generation_cache_key(model: type[Model]) -> str:
+    return f"search:generation:{model._meta.label_lower}"
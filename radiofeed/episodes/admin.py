@@ -8,6 +8,7 @@ from radiofeed.episodes.models import AudioLog, Episode, EpisodeQuerySet
 
 if TYPE_CHECKING:
     from django.db.models import QuerySet
+    from django.forms import ModelForm
     from django.http import HttpRequest
 
 
@@ -30,6 +31,21 @@ class EpisodeAdmin(FastCountAdminMixin, admin.ModelAdmin):
         """Render truncated podcast title."""
         return truncatechars(obj.podcast.title, 30)
 
+    def save_model(
+        self,
+        request: HttpRequest,
+        obj: Episode,
+        form: ModelForm,
+        change: bool,  # noqa: FBT001
+    ) -> None:
+        """Clears stored sanitized copies of an edited title or description, so they
+        are rendered from the new values until the feed is next parsed."""
+        if "title" in form.changed_data:
+            obj.title_text = ""
+        if "description" in form.changed_data:
+            obj.description_text = obj.description_html = ""
+        super().save_model(request, obj, form, change)
+
     def get_search_results(
         self,
         request: HttpRequest,
@@ -0,0 +1,30 @@
+# Generated by Django 6.0.2 on 2026-10-19 08:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("episodes", "0031_alter_audiolog_current_time_alter_audiolog_duration"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="episode",
+            name="description_html",
+            field=models.TextField(blank=True, default="", editable=False),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="episode",
+            name="description_text",
+            field=models.TextField(blank=True, default="", editable=False),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="episode",
+            name="title_text",
+            field=models.TextField(blank=True, default="", editable=False),
+            preserve_default=False,
+        ),
+    ]
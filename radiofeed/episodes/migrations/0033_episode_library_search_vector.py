@@ -0,0 +1,113 @@
+# Generated by Django 6.0.2 on 2026-10-19 08:30
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+from django.db.models import Max
+
+timeout_statement = "SET statement_timeout = 0;"
+
+backfill_batch_size = 5000
+
+
+def backfill_library_search_vector(apps, schema_editor):
+    Episode = apps.get_model("episodes", "Episode")
+
+    # Setting the column fires the trigger, which fills in the search vector.
+    # Rows are updated in ranges of ids, each committed separately as the
+    # migration is not atomic, so that no single update rewrites the whole
+    # table. Rows inserted from now on are filled in by the trigger.
+    max_id = Episode.objects.aggregate(max_id=Max("pk"))["max_id"] or 0
+
+    for start in range(1, max_id + 1, backfill_batch_size):
+        Episode.objects.filter(
+            pk__range=(start, start + backfill_batch_size - 1),
+        ).update(library_search_vector=None)
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("episodes", "0032_episode_description_html_and_more"),
+        ("podcasts", "0115_podcast_autocomplete_text"),
+    ]
+
+    operations = [
+        migrations.RunSQL(timeout_statement, reverse_sql=timeout_statement),
+        migrations.AddField(
+            model_name="episode",
+            name="library_search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        # Episode title and keywords are weighted A, podcast search vector B.
+        # Episodes are updated when the search vector of their podcast changes.
+        migrations.RunSQL(
+            sql="""
+CREATE OR REPLACE FUNCTION episode_library_search_vector_update()
+RETURNS trigger AS $$
+BEGIN
+    NEW.library_search_vector :=
+        setweight(
+            to_tsvector(
+                'pg_catalog.simple',
+                coalesce(NEW.title, '') || ' ' || coalesce(NEW.keywords, '')
+            ),
+            'A'
+        ) ||
+        setweight(
+            coalesce(
+                (SELECT search_vector FROM podcasts_podcast WHERE id = NEW.podcast_id),
+                ''::tsvector
+            ),
+            'B'
+        );
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS episode_update_library_search_trigger ON episodes_episode;
+CREATE TRIGGER episode_update_library_search_trigger
+BEFORE INSERT OR UPDATE OF title, keywords, podcast_id, library_search_vector
+ON episodes_episode
+FOR EACH ROW
+EXECUTE PROCEDURE episode_library_search_vector_update();
+
+CREATE OR REPLACE FUNCTION podcast_library_search_vector_update()
+RETURNS trigger AS $$
+BEGIN
+    UPDATE episodes_episode SET library_search_vector = NULL
+    WHERE podcast_id = NEW.id;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS podcast_update_library_search_trigger ON podcasts_podcast;
+CREATE TRIGGER podcast_update_library_search_trigger
+AFTER UPDATE ON podcasts_podcast
+FOR EACH ROW
+WHEN (OLD.search_vector IS DISTINCT FROM NEW.search_vector)
+EXECUTE PROCEDURE podcast_library_search_vector_update();
+""",
+            reverse_sql="""
+DROP TRIGGER IF EXISTS podcast_update_library_search_trigger ON podcasts_podcast;
+DROP FUNCTION IF EXISTS podcast_library_search_vector_update();
+DROP TRIGGER IF EXISTS episode_update_library_search_trigger ON episodes_episode;
+DROP FUNCTION IF EXISTS episode_library_search_vector_update();
+""",
+        ),
+        migrations.RunPython(
+            backfill_library_search_vector,
+            reverse_code=migrations.RunPython.noop,
+        ),
+        AddIndexConcurrently(
+            model_name="episode",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["library_search_vector"],
+                name="episodes_episode_library_search_idx",
+            ),
+        ),
+    ]
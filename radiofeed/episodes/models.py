@@ -10,11 +10,12 @@ from django.db.models.fields.tuple_lookups import (  # type: ignore[reportMissin
 )
 from django.urls import reverse
 from django.utils.functional import cached_property
+from django.utils.safestring import mark_safe
 from slugify import slugify
 
 from radiofeed.db.fields import URLField
 from radiofeed.db.search import Searchable
-from radiofeed.sanitizer import strip_html
+from radiofeed.sanitizer import markdown_cached, strip_html
 
 if TYPE_CHECKING:
     from radiofeed.podcasts.models import Season
@@ -24,6 +25,7 @@ class EpisodeQuerySet(Searchable, models.QuerySet):
     """Custom queryset for Episode model."""
 
     default_search_fields = ("search_vector",)
+    search_candidates_ordering = ("-pub_date", "-id")
 
 
 class Episode(models.Model):
@@ -48,6 +50,12 @@ class Episode(models.Model):
     description = models.TextField(blank=True)
     keywords = models.TextField(blank=True)
 
+    # Sanitized copies of title and description, stored by the feed parser
+    # so that they are not recomputed on every request
+    title_text = models.TextField(blank=True, editable=False)
+    description_text = models.TextField(blank=True, editable=False)
+    description_html = models.TextField(blank=True, editable=False)
+
     cover_url = URLField(blank=True)
 
     website = URLField(blank=True)
@@ -74,6 +82,10 @@ class Episode(models.Model):
 
     search_vector = SearchVectorField(null=True, editable=False)
 
+    # Episode title and keywords (weight A) with podcast search vector (weight B),
+    # maintained by database triggers for searching bookmarks and history
+    library_search_vector = SearchVectorField(null=True, editable=False)
+
     objects: EpisodeQuerySet = EpisodeQuerySet.as_manager()  # type: ignore[assignment]
 
     class Meta:
@@ -91,6 +103,10 @@ class Episode(models.Model):
             models.Index(fields=["-pub_date", "-id"]),
             models.Index(fields=["guid"]),
             GinIndex(fields=["search_vector"]),
+            GinIndex(
+                fields=["library_search_vector"],
+                name="%(app_label)s_%(class)s_library_search_idx",
+            ),
         ]
 
     def __str__(self) -> str:
@@ -162,13 +178,20 @@ class Episode(models.Model):
 
     @cached_property
     def cleaned_title(self) -> str:
-        """Strips HTML from title field."""
-        return strip_html(self.title)
+        """Strips HTML from title field, unless already stored."""
+        return self.title_text or strip_html(self.title)
 
     @cached_property
     def cleaned_description(self) -> str:
-        """Strips HTML from description field."""
-        return strip_html(self.description)
+        """Strips HTML from description field, unless already stored."""
+        return self.description_text or strip_html(self.description)
+
+    @cached_property
+    def rendered_description(self) -> str:
+        """Renders description as sanitized HTML, unless already stored."""
+        if self.description_html:
+            return mark_safe(self.description_html)  # noqa: S308
+        return markdown_cached(self.description)
 
     @cached_property
     def duration_in_seconds(self) -> int:
@@ -197,10 +220,7 @@ class Episode(models.Model):
 class BookmarkQuerySet(Searchable, models.QuerySet):
     """Custom queryset for Bookmark model."""
 
-    default_search_fields = (
-        "episode__search_vector",
-        "episode__podcast__search_vector",
-    )
+    default_search_fields = ("episode__library_search_vector",)
 
 
 class Bookmark(models.Model):
@@ -247,10 +267,7 @@ class Bookmark(models.Model):
 class AudioLogQuerySet(Searchable, models.QuerySet):
     """Custom queryset for AudioLog model."""
 
-    default_search_fields = (
-        "episode__search_vector",
-        "episode__podcast__search_vector",
-    )
+    default_search_fields = ("episode__library_search_vector",)
 
 
 class AudioLog(models.Model):
@@ -9,6 +9,7 @@ from django.tasks import task  # type: ignore[reportMissingTypeStubs]
 from django.utils import timezone
 
 from radiofeed.episodes.models import Episode
+from radiofeed.podcasts.models import Podcast
 from radiofeed.users.notifications import get_recipients, send_notification_email
 
 if TYPE_CHECKING:
@@ -59,7 +60,7 @@ def _get_new_episodes(
 ) -> QuerySet[Episode]:
     # Fetch latest episode IDs for each podcast the user is subscribed to since given time
     # Exclude any that the user has bookmarked or listened to
-    episodes = dict(
+    episode_ids = list(
         Episode.objects.annotate(
             is_bookmarked=Exists(
                 user.bookmarks.filter(
@@ -71,23 +72,17 @@ def _get_new_episodes(
                     episode=OuterRef("pk"),
                 )
             ),
-            is_subscribed=Exists(
-                user.subscriptions.filter(
-                    podcast=OuterRef("podcast"),
-                )
-            ),
         )
         .filter(
+            pk__in=Podcast.objects.subscribed(user).values("latest_episode"),
             is_bookmarked=False,
             is_listened=False,
-            is_subscribed=True,
             pub_date__gte=since,
         )
-        .order_by("pub_date", "pk")
-        .values_list("podcast", "pk")
+        .values_list("pk", flat=True)
     )
     # Randomly sample up to `limit` episode IDs
-    if episode_ids := list(episodes.values()):
+    if episode_ids:
         sample_ids = random.sample(episode_ids, min(len(episode_ids), limit))
         return (
             Episode.objects.filter(pk__in=sample_ids)
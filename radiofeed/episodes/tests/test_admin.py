@@ -31,6 +31,35 @@ class TestEpisodeAdmin:
         episode = EpisodeFactory(podcast=PodcastFactory(title="testing"))
         assert admin.podcast_title(episode) == "testing"
 
+    def test_save_model(self, rf, mocker, admin):
+        episode = EpisodeFactory(
+            title="new title",
+            title_text="old title",
+            description_text="description",
+            description_html="<p>description</p>",
+        )
+        form = mocker.Mock(changed_data=["title"])
+        admin.save_model(rf.post("/"), episode, form, change=True)
+
+        episode.refresh_from_db()
+        assert episode.title_text == ""
+        assert episode.description_text == "description"
+        assert episode.cleaned_title == "new title"
+
+    def test_save_model_description(self, rf, mocker, admin):
+        episode = EpisodeFactory(
+            description="new",
+            description_text="old",
+            description_html="<p>old</p>",
+        )
+        form = mocker.Mock(changed_data=["description"])
+        admin.save_model(rf.post("/"), episode, form, change=True)
+
+        episode.refresh_from_db()
+        assert episode.description_text == ""
+        assert episode.description_html == ""
+        assert episode.rendered_description == "<p>new</p>\n"
+
     def test_get_ordering_no_search_term(self, admin, rf):
         ordering = admin.get_ordering(rf.get("/"))
         assert ordering == ["-id"]
@@ -2,9 +2,10 @@ from datetime import timedelta
 
 import pytest
 
-from radiofeed.episodes.models import AudioLog, Episode
+from radiofeed.episodes.models import AudioLog, Bookmark, Episode
 from radiofeed.episodes.tests.factories import (
     AudioLogFactory,
+    BookmarkFactory,
     EpisodeFactory,
 )
 from radiofeed.podcasts.models import Podcast
@@ -40,6 +41,34 @@ class TestEpisodeModel:
         assert audio_log_1 in result
         assert audio_log_2 in result
 
+    def test_library_search_rank(self):
+        podcast_match = AudioLogFactory(
+            episode=EpisodeFactory(
+                title="Episode one",
+                podcast__title="Django Podcast",
+            )
+        )
+        episode_match = AudioLogFactory(
+            episode=EpisodeFactory(
+                title="Django for beginners",
+                podcast__title="Web Dev Podcast",
+            )
+        )
+
+        result = AudioLog.objects.search("Django").order_by("-rank")
+        assert list(result) == [episode_match, podcast_match]
+
+    def test_library_search_podcast_updated(self):
+        bookmark = BookmarkFactory(episode__podcast__title="Flask Podcast")
+
+        assert not Bookmark.objects.search("Django").exists()
+
+        Podcast.objects.filter(pk=bookmark.episode.podcast_id).update(
+            title="Django Podcast"
+        )
+
+        assert list(Bookmark.objects.search("Django")) == [bookmark]
+
     def test_next_episode_if_none(self, episode):
         assert episode.next_episode is None
 
@@ -113,6 +142,24 @@ class TestEpisodeModel:
         episode = Episode(description="<b>Test &amp; Code")
         assert episode.cleaned_description == "Test & Code"
 
+    def test_cleaned_stored(self):
+        episode = Episode(
+            title="<b>Test &amp; Code",
+            title_text="Stored title",
+            description="<b>Test &amp; Code",
+            description_text="Stored description",
+        )
+        assert episode.cleaned_title == "Stored title"
+        assert episode.cleaned_description == "Stored description"
+
+    def test_rendered_description(self):
+        episode = Episode(description="**Test**")
+        assert episode.rendered_description == "<p><strong>Test</strong></p>\n"
+
+    def test_rendered_description_stored(self):
+        episode = Episode(description="**Test**", description_html="<p>Stored</p>")
+        assert episode.rendered_description == "<p>Stored</p>"
+
     def test_get_cover_url_if_episode_cover(self, podcast):
         episode = EpisodeFactory(
             podcast=podcast, cover_url="https://example.com/episode-cover.jpg"
@@ -9,6 +9,7 @@ from radiofeed.episodes.tests.factories import (
     BookmarkFactory,
     EpisodeFactory,
 )
+from radiofeed.podcasts.models import Podcast
 from radiofeed.podcasts.tests.factories import (
     SubscriptionFactory,
 )
@@ -20,11 +21,14 @@ class TestSendEpisodeUpdates:
         subscription = SubscriptionFactory(
             subscriber=recipient.user,
         )
-        EpisodeFactory.create_batch(
+        *_, episode = EpisodeFactory.create_batch(
             3,
             podcast=subscription.podcast,
             pub_date=timezone.now() - timedelta(days=1),
         )
+        Podcast.objects.filter(pk=subscription.podcast_id).update(
+            latest_episode=episode
+        )
         send_episode_updates.enqueue(recipient_id=recipient.id)
         assert len(mailoutbox) == 1
         assert mailoutbox[0].to == [recipient.email]
@@ -37,6 +41,9 @@ class TestSendEpisodeUpdates:
             podcast=subscription.podcast,
             pub_date=timezone.now() - timedelta(days=1),
         )
+        Podcast.objects.filter(pk=subscription.podcast_id).update(
+            latest_episode=episode
+        )
         BookmarkFactory(episode=episode, user=recipient.user)
         send_episode_updates.enqueue(recipient_id=recipient.id)
         assert len(mailoutbox) == 0
@@ -61,6 +68,9 @@ class TestSendEpisodeUpdates:
             podcast=subscription.podcast,
             pub_date=timezone.now() - timedelta(days=1),
         )
+        Podcast.objects.filter(pk=subscription.podcast_id).update(
+            latest_episode=episode
+        )
         AudioLogFactory(
             episode=episode,
             user=recipient.user,
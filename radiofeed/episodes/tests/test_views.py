@@ -14,10 +14,15 @@ from radiofeed.episodes.tests.factories import (
     BookmarkFactory,
     EpisodeFactory,
 )
+from radiofeed.paginator import Page
+from radiofeed.podcasts.models import Podcast
+from radiofeed.podcasts.subscriptions import bump_subscriptions_version
 from radiofeed.podcasts.tests.factories import PodcastFactory, SubscriptionFactory
+from radiofeed.sanitizer import clear_markdown_cache, get_markdown_cache_stats
 from radiofeed.tests.asserts import (
     assert200,
     assert204,
+    assert304,
     assert400,
     assert401,
     assert404,
@@ -45,6 +50,11 @@ class TestIndex:
 
     def test_has_subscriptions(self, client, auth_user):
         episode = EpisodeFactory()
+        EpisodeFactory(
+            podcast=episode.podcast,
+            pub_date=episode.pub_date - timedelta(days=1),
+        )
+        Podcast.objects.filter(pk=episode.podcast_id).update(latest_episode=episode)
         SubscriptionFactory(subscriber=auth_user, podcast=episode.podcast)
 
         response = client.get(_index_url)
@@ -53,6 +63,20 @@ class TestIndex:
         assertTemplateUsed(response, "episodes/index.html")
         assert len(response.context["episodes"]) == 1
 
+    def test_cached(self, client, auth_user, _locmem_cache):
+        first = EpisodeFactory(title="First")
+        Podcast.objects.filter(pk=first.podcast_id).update(latest_episode=first)
+        SubscriptionFactory(subscriber=auth_user, podcast=first.podcast)
+        assertContains(client.get(_index_url), first.title)
+
+        second = EpisodeFactory(title="Second")
+        Podcast.objects.filter(pk=second.podcast_id).update(latest_episode=second)
+        SubscriptionFactory(subscriber=auth_user, podcast=second.podcast)
+        assertNotContains(client.get(_index_url), second.title)
+
+        bump_subscriptions_version(auth_user.pk)
+        assertContains(client.get(_index_url), second.title)
+
 
 @pytest.mark.django_db
 class TestSearchEpisodes:
@@ -101,6 +125,50 @@ class TestEpisodeDetail:
         assertTemplateUsed(response, "episodes/detail.html")
         assert response.context["episode"] == episode
 
+    def test_description_not_stored(self, client, auth_user):
+        clear_markdown_cache()
+
+        episode = EpisodeFactory(description="**bold**", description_html="")
+
+        for _ in range(2):
+            response = client.get(episode.get_absolute_url())
+            assert200(response)
+            assertContains(response, "<strong>bold</strong>")
+
+        # rendered on the first request, then found in the cache
+        stats = get_markdown_cache_stats()
+        assert stats.misses == 1
+        assert stats.local_hits == 1
+
+        clear_markdown_cache()
+
+    def test_not_modified(self, client, auth_user, episode):
+        # first request adds CSRF token to session
+        client.get(episode.get_absolute_url())
+        etag = client.get(episode.get_absolute_url())["ETag"]
+
+        response = client.get(
+            episode.get_absolute_url(), headers={"If-None-Match": etag}
+        )
+        assert304(response)
+
+        BookmarkFactory(user=auth_user, episode=episode)
+
+        response = client.get(
+            episode.get_absolute_url(), headers={"If-None-Match": etag}
+        )
+        assert200(response)
+        assert response.context["is_bookmarked"] is True
+
+    def test_not_found(self, client, auth_user):
+        response = client.get(
+            reverse(
+                "episodes:episode_detail",
+                kwargs={"episode_id": 1234, "slug": "test"},
+            )
+        )
+        assert404(response)
+
     def test_listened(self, client, auth_user, episode):
         AudioLogFactory(
             episode=episode,
@@ -292,6 +360,8 @@ class TestBookmarks:
         assertTemplateUsed(response, "episodes/bookmarks.html")
 
         assert len(response.context["page"].object_list) == 1
+        # ranked search results are not paginated by cursor
+        assert isinstance(response.context["page"], Page)
 
 
 @pytest.mark.django_db
@@ -367,6 +437,7 @@ class TestHistory:
 
         assert200(response)
         assert len(response.context["page"].object_list) == 1
+        assert isinstance(response.context["page"], Page)
 
 
 @pytest.mark.django_db
@@ -5,7 +5,6 @@ from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.db import IntegrityError
-from django.db.models import OuterRef, Subquery
 from django.http import Http404, JsonResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.template.response import TemplateResponse
@@ -14,7 +13,7 @@ from django.views.decorators.http import require_POST, require_safe
 from pydantic import BaseModel, ValidationError
 
 from radiofeed.episodes.models import AudioLog, Episode
-from radiofeed.http.decorators import require_DELETE
+from radiofeed.http.decorators import conditional_page, require_DELETE
 from radiofeed.http.request import (
     AuthenticatedHttpRequest,
     HttpRequest,
@@ -27,6 +26,7 @@ from radiofeed.http.response import (
 )
 from radiofeed.paginator import render_paginated_response
 from radiofeed.podcasts.models import Podcast
+from radiofeed.podcasts.subscriptions import get_subscriptions_version
 
 PlayerAction = Literal["load", "play", "close"]
 
@@ -51,16 +51,9 @@ def index(request: AuthenticatedHttpRequest) -> TemplateResponse:
 
     latest_episodes = (
         Podcast.objects.subscribed(request.user)
-        .annotate(
-            latest_episode=Subquery(
-                Episode.objects.filter(podcast_id=OuterRef("pk"))
-                .order_by("-pub_date", "-pk")
-                .values("pk")[:1]
-            )
-        )
         .filter(latest_episode__isnull=False)
         .order_by("-pub_date")
-        .values_list("latest_episode", flat=True)[: settings.DEFAULT_PAGE_SIZE]
+        .values("latest_episode")[: settings.DEFAULT_PAGE_SIZE]
     )
 
     episodes = (
@@ -74,6 +67,7 @@ def index(request: AuthenticatedHttpRequest) -> TemplateResponse:
         "episodes/index.html",
         {
             "episodes": episodes,
+            "subscriptions_version": get_subscriptions_version(request.user.pk),
         },
     )
 
@@ -86,9 +80,12 @@ def search_episodes(request: HttpRequest) -> RenderOrRedirectResponse:
     if request.search:
         episodes = (
             Episode.objects.filter(podcast__private=False)
-            .search(request.search.value)
             .select_related("podcast")
-            .order_by("-rank", "-pub_date")
+            .search_cached(
+                request.search.value,
+                order_by=("-rank", "-pub_date"),
+                max_candidates=settings.SEARCH_MAX_CANDIDATES,
+            )
         )
 
         return render_paginated_response(request, "episodes/search.html", episodes)
@@ -98,6 +95,9 @@ def search_episodes(request: HttpRequest) -> RenderOrRedirectResponse:
 
 @require_safe
 @login_required
+@conditional_page(
+    lambda request, episode_id, **_: _get_episode_version(request, episode_id)
+)
 def episode_detail(
     request: AuthenticatedHttpRequest,
     episode_id: int,
@@ -233,6 +233,7 @@ def history(request: AuthenticatedHttpRequest) -> TemplateResponse:
         {
             "ordering": ordering,
         },
+        cursor=not request.search,
     )
 
 
@@ -302,6 +303,7 @@ def bookmarks(request: AuthenticatedHttpRequest) -> TemplateResponse:
         {
             "ordering": ordering,
         },
+        cursor=not request.search,
     )
 
 
@@ -383,3 +385,24 @@ def _render_audio_log_action(
         context["audio_log"] = audio_log
 
     return TemplateResponse(request, "episodes/detail.html#audio_log", context)
+
+
+def _get_episode_version(
+    request: AuthenticatedHttpRequest, episode_id: int
+) -> tuple | None:
+    # Episodes change only when the podcast is updated by the feed parser. The
+    # user's bookmark, listening history and player are also shown on the page.
+    if updated := (
+        Episode.objects.filter(pk=episode_id)
+        .values_list("podcast__updated", flat=True)
+        .first()
+    ):
+        return (
+            updated,
+            request.user.audio_logs.filter(episode=episode_id)
+            .values_list("listened", "current_time")
+            .first(),
+            request.user.bookmarks.filter(episode=episode_id).exists(),
+            request.player.get(),
+        )
+    return None
@@ -1,5 +1,75 @@
-from django.views.decorators.http import require_http_methods
+import functools
+import hashlib
+from typing import TYPE_CHECKING
+
+from django.contrib.messages import get_messages
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import condition, require_http_methods
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+    from django.http import HttpResponse
+
+    from radiofeed.http.request import HttpRequest
 
 require_form_methods = require_http_methods(["GET", "HEAD", "POST"])
 
 require_DELETE = require_http_methods(["DELETE"])  # noqa: N816
+
+
+def conditional_page(
+    get_version: Callable[..., Hashable | None],
+) -> Callable[[Callable[..., HttpResponse]], Callable[..., HttpResponse]]:
+    """Adds conditional GET support to a page view using ETags.
+
+    `get_version` is called with the request and view arguments. It should return a value that changes whenever the page changes, e.g. the time the podcast was last updated along with any state of the user shown on the page, or None to always render the page.
+
+    The ETag also includes the state of the request shown on every page: user, CSRF token, HTMX headers and audio player. Pages are private and revalidated on every request, so an unchanged page costs a 304 response rather than a full render.
+
+    Place after `login_required`.
+    """
+
+    def _decorator(view: Callable[..., HttpResponse]) -> Callable[..., HttpResponse]:
+        def _get_etag(request: HttpRequest, *args, **kwargs) -> str | None:
+            if not _is_conditional(request):
+                return None
+            if (version := get_version(request, *args, **kwargs)) is None:
+                return None
+            return _make_etag(request, version)
+
+        conditional_view = condition(etag_func=_get_etag)(view)
+
+        @functools.wraps(view)
+        def _wrapper(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+            response = conditional_view(request, *args, **kwargs)
+            if response.has_header("ETag"):
+                patch_cache_control(response, private=True, no_cache=True)
+            return response
+
+        return _wrapper
+
+    return _decorator
+
+
+def _is_conditional(request: HttpRequest) -> bool:
+    # Pending messages are rendered with the response, so must not be skipped.
+    # The audio player on full pages starts from the current time of the episode,
+    # which changes as it is played.
+    if len(get_messages(request)):
+        return False
+    return bool(request.htmx) or request.player.get() is None
+
+
+def _make_etag(request: HttpRequest, version: Hashable) -> str:
+    state = (
+        version,
+        request.user.pk,
+        request.user.is_staff,
+        request.META.get("CSRF_COOKIE"),
+        bool(request.htmx),
+        request.htmx.target,
+        request.htmx.boosted,
+        request.htmx.history_restore_request,
+    )
+    return hashlib.sha256(repr(state).encode()).hexdigest()
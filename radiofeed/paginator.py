@@ -1,9 +1,15 @@
+import base64
+import dataclasses
+import datetime
+import functools
+import json
 from collections.abc import Sequence
-from typing import TYPE_CHECKING, TypeAlias, TypeVar
+from typing import TYPE_CHECKING, Any, TypeAlias, TypeVar
 
 from django.conf import settings
+from django.core.exceptions import ValidationError
 from django.core.paginator import EmptyPage, PageNotAnInteger
-from django.db.models import Model, QuerySet
+from django.db.models import Model, Q, QuerySet
 from django.utils.functional import cached_property
 
 from radiofeed.partials import render_partial_response
@@ -29,15 +35,22 @@ def render_paginated_response(  # noqa: PLR0913
     target: str = "pagination",
     partial: str = "pagination",
     per_page: int = settings.DEFAULT_PAGE_SIZE,
+    cursor: bool = False,
 ) -> TemplateResponse:
     """Render pagination response.
 
     This function is a wrapper around `render_partial_response` function.
 
     It renders a partial template with paginated data. The `Page` object is passed to the template context as `page`.
+
+    If `cursor` is True, an ordered QuerySet is paginated with `CursorPaginator` instead, so deep pages are as fast to query as the first.
     """
 
-    page = Paginator(object_list, per_page).get_page(request.GET.get(param, 1))
+    page: Page | CursorPage = (
+        CursorPaginator(object_list, per_page).get_page(request.GET.get(param))
+        if cursor and isinstance(object_list, QuerySet)
+        else Paginator(object_list, per_page).get_page(request.GET.get(param, 1))
+    )
 
     return render_partial_response(
         request,
@@ -138,6 +151,209 @@ class Paginator:
         return Page(paginator=self, number=number)
 
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Cursor:
+    """Position in a keyset-paginated QuerySet.
+
+    Values are the ordering fields of the last item of the previous page, or the first item of the next page if `reverse` is True.
+    """
+
+    values: tuple
+    reverse: bool = False
+
+    @classmethod
+    def decode(cls, value: str) -> Cursor:
+        """Decodes cursor from query string value.
+
+        Raises:
+            ValueError: if value is not a valid cursor
+        """
+        try:
+            data = json.loads(base64.urlsafe_b64decode(value))
+        except ValueError as exc:
+            raise ValueError("Invalid cursor") from exc
+
+        match data:
+            case {"values": list(values), "reverse": bool(reverse)} if values:
+                return cls(values=tuple(values), reverse=reverse)
+            case _:
+                raise ValueError("Invalid cursor")
+
+    def encode(self) -> str:
+        """Encodes cursor for use in query string."""
+        return base64.urlsafe_b64encode(
+            json.dumps(
+                {"values": self.values, "reverse": self.reverse},
+                default=_encode_value,
+            ).encode()
+        ).decode()
+
+
+class CursorPage:
+    """Keyset pagination without COUNT(*) queries.
+
+    Rather than skipping rows with OFFSET, each page is filtered by the ordering fields of the item before it, so that every page costs the same as the first. As with `Page`, no database queries are executed until the object list is accessed.
+
+    Page "numbers" are encoded cursors, so the page can be used in the same templates as `Page`.
+    """
+
+    def __init__(
+        self,
+        *,
+        paginator: CursorPaginator,
+        object_list: QuerySet,
+        cursor: Cursor | None = None,
+    ) -> None:
+        self.paginator = paginator
+        self.page_size = paginator.per_page
+        self.cursor = cursor
+        self._object_list = object_list
+
+    def __repr__(self) -> str:
+        """Object representation."""
+        return f"<CursorPage {self.cursor}>"
+
+    def __len__(self) -> int:
+        """Returns total number of items"""
+        return len(self.object_list)
+
+    def __getitem__(self, index: int | slice) -> ObjectList:
+        """Returns indexed item."""
+        return self.object_list[index]
+
+    @cached_property
+    def next_page_number(self) -> str:
+        """Returns cursor of the next page."""
+        if self.has_next:
+            return Cursor(
+                values=self.paginator.get_values(self.object_list[-1])
+            ).encode()
+        raise EmptyPage("Next page does not exist")
+
+    @cached_property
+    def previous_page_number(self) -> str:
+        """Returns cursor of the previous page."""
+        if self.has_previous:
+            return Cursor(
+                values=self.paginator.get_values(self.object_list[0]),
+                reverse=True,
+            ).encode()
+        raise EmptyPage("Previous page does not exist")
+
+    @cached_property
+    def has_next(self) -> bool:
+        """Checks if there is a next page."""
+        if self.is_reverse:
+            return bool(self.object_list)
+        return len(self.object_list_with_next_item) > self.page_size
+
+    @cached_property
+    def has_previous(self) -> bool:
+        """Checks if there is a previous page."""
+        if self.is_reverse:
+            return len(self.object_list_with_next_item) > self.page_size
+        return self.cursor is not None and bool(self.object_list)
+
+    @cached_property
+    def has_other_pages(self) -> bool:
+        """Checks if there are other pages."""
+        return self.has_previous or self.has_next
+
+    @cached_property
+    def is_reverse(self) -> bool:
+        """Checks if page is fetched backwards from the cursor."""
+        return self.cursor is not None and self.cursor.reverse
+
+    @cached_property
+    def object_list(self) -> list:
+        """Returns the object list."""
+        object_list = self.object_list_with_next_item[: self.page_size]
+        return object_list[::-1] if self.is_reverse else object_list
+
+    @cached_property
+    def object_list_with_next_item(self) -> list:
+        """Returns object list including next item, in order of fetching."""
+        # Database query executed here with LIMIT only
+        return list(self._object_list[: self.page_size + 1])
+
+
+class CursorPaginator:
+    """Keyset paginator without COUNT(*) queries.
+
+    The QuerySet must be ordered by field names or annotations that are not null. The primary key is added to the ordering if not already included, so that items with the same values are not skipped.
+    """
+
+    def __init__(self, object_list: QuerySet, per_page: int) -> None:
+        self.ordering = _get_ordering(object_list)
+        self.object_list = object_list.order_by(*self.ordering)
+        self.per_page = per_page
+
+    def get_page(self, value: str | None) -> CursorPage:
+        """Returns a page object. Invalid cursors return the first page."""
+        if value:
+            try:
+                cursor = Cursor.decode(value)
+                object_list = self._filter(cursor)
+            except ValidationError, ValueError, TypeError:
+                pass
+            else:
+                return CursorPage(
+                    paginator=self,
+                    object_list=object_list,
+                    cursor=cursor,
+                )
+
+        return CursorPage(paginator=self, object_list=self.object_list)
+
+    def get_values(self, obj: Model) -> tuple:
+        """Returns values of the ordering fields of an item."""
+        return tuple(
+            functools.reduce(getattr, field.removeprefix("-").split("__"), obj)
+            for field in self.ordering
+        )
+
+    def _filter(self, cursor: Cursor) -> QuerySet:
+        if len(cursor.values) != len(self.ordering):
+            raise ValueError("Cursor does not match ordering")
+
+        # e.g. ordering (-pub_date, -pk) is filtered with:
+        # pub_date <= x AND (pub_date < x OR (pub_date = x AND pk < y))
+        # The first condition is redundant, but allows an index range scan.
+        equal: dict[str, Any] = {}
+        keyset = Q()
+        bound = Q()
+
+        for field, value in zip(self.ordering, cursor.values, strict=True):
+            name = field.removeprefix("-")
+            lookup = "gt" if field.startswith("-") == cursor.reverse else "lt"
+            keyset |= Q(**equal, **{f"{name}__{lookup}": value})
+            if not equal:
+                bound = Q(**{f"{name}__{lookup}e": value})
+            equal[name] = value
+
+        object_list = self.object_list.reverse() if cursor.reverse else self.object_list
+        return object_list.filter(bound, keyset)
+
+
+def _get_ordering(queryset: QuerySet) -> list[str]:
+    ordering = list(queryset.query.order_by or queryset.model._meta.ordering)
+
+    if not ordering or not all(isinstance(field, str) for field in ordering):
+        raise ValueError("QuerySet must be ordered by field names")
+
+    if ordering[-1].removeprefix("-") not in ("pk", "id"):
+        ordering.append("-pk" if ordering[-1].startswith("-") else "pk")
+
+    return ordering
+
+
+def _encode_value(value: Any) -> str:
+    # Datetimes are encoded in full: DjangoJSONEncoder drops microseconds.
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return str(value)
+
+
 def validate_page_number(number: int | str) -> int:
     """Validates the page number: it should be an integer greater than 1."""
     try:
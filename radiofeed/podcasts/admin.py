@@ -10,6 +10,7 @@ from django.utils.timesince import timesince, timeuntil
 
 from radiofeed.admin import FastCountAdminMixin
 from radiofeed.podcasts import tasks
+from radiofeed.podcasts.autocomplete import get_autocomplete_text
 from radiofeed.podcasts.forms import OpmlUploadForm
 from radiofeed.podcasts.models import (
     Category,
@@ -18,8 +19,10 @@ from radiofeed.podcasts.models import (
     Recommendation,
     Subscription,
 )
+from radiofeed.sanitizer import strip_html
 
 if TYPE_CHECKING:
+    from django.forms import ModelForm
     from django.http import HttpRequest, HttpResponseRedirect
     from django.urls import URLPattern
     from django_stubs_ext import StrOrPromise
@@ -235,6 +238,7 @@ class PodcastAdmin(FastCountAdminMixin, admin.ModelAdmin):
         "modified",
         "etag",
         "content_hash",
+        "extracted_text_hash",
     )
 
     search_fields = ("search_vector",)
@@ -276,6 +280,7 @@ class PodcastAdmin(FastCountAdminMixin, admin.ModelAdmin):
                     "etag",
                     "modified",
                     "content_hash",
+                    "extracted_text_hash",
                 ),
             },
         ),
@@ -304,6 +309,24 @@ class PodcastAdmin(FastCountAdminMixin, admin.ModelAdmin):
             )
         return "-"
 
+    def save_model(
+        self,
+        request: HttpRequest,
+        obj: Podcast,
+        form: ModelForm,
+        change: bool,  # noqa: FBT001
+    ) -> None:
+        """Clears stored sanitized copies of an edited title or description, so they
+        are rendered from the new values until the feed is next parsed."""
+        if "title" in form.changed_data:
+            obj.title_text = ""
+            obj.autocomplete_text = get_autocomplete_text(
+                strip_html(obj.title), obj.cleaned_owner
+            )
+        if "description" in form.changed_data:
+            obj.description_text = obj.description_html = ""
+        super().save_model(request, obj, form, change)
+
     def get_search_results(
         self,
         request: HttpRequest,
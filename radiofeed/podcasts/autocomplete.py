@@ -0,0 +1,76 @@
+import hashlib
+from typing import Final
+
+from django.core.cache import cache
+
+from radiofeed.podcasts.models import Podcast
+
+DEFAULT_LIMIT: Final = 8
+
+# Max length of stored text: long enough to include most owners
+_MAX_LENGTH: Final = 200
+
+# Shortest values matched as prefix of title, or anywhere in title or owner.
+# Trigram indexes cannot match values shorter than a trigram.
+_PREFIX_MIN_LENGTH: Final = 2
+_TRIGRAM_MIN_LENGTH: Final = 3
+
+_CACHE_TIMEOUT: Final = 60
+
+
+def get_autocomplete_text(title: str, owner: str) -> str:
+    """Returns normalized title and owner of a podcast, as stored for autocomplete."""
+    return normalize(f"{title} {owner}")[:_MAX_LENGTH].strip()
+
+
+def normalize(value: str) -> str:
+    """Returns value casefolded, with whitespace collapsed."""
+    return " ".join(value.casefold().split())
+
+
+def search(value: str, *, limit: int = DEFAULT_LIMIT) -> list[Podcast]:
+    """Returns public podcasts for autocomplete of a partial search.
+
+    Podcasts with titles starting with the value come first, then any with the
+    value elsewhere in the title or owner, up to `limit`. Results are cached
+    briefly, as the same prefixes are typed by many users.
+    """
+    if len(value := normalize(value)) < _PREFIX_MIN_LENGTH:
+        return []
+
+    cache_key = _get_cache_key(value, limit)
+
+    if (podcasts := cache.get(cache_key)) is None:
+        podcasts = _search(value, limit)
+        cache.set(cache_key, podcasts, timeout=_CACHE_TIMEOUT)
+
+    return podcasts
+
+
+def _search(value: str, limit: int) -> list[Podcast]:
+    # Both queries are bounded by LIMIT and match the partial indexes on
+    # autocomplete_text of public podcasts.
+    podcasts = (
+        Podcast.objects.published()
+        .filter(private=False)
+        .only("pk", "title", "title_text", "owner", "owner_text")
+    )
+
+    results = list(
+        podcasts.filter(autocomplete_text__startswith=value).order_by(
+            "autocomplete_text"
+        )[:limit]
+    )
+
+    if len(results) < limit and len(value) >= _TRIGRAM_MIN_LENGTH:
+        results += (
+            podcasts.filter(autocomplete_text__contains=value)
+            .exclude(pk__in=[podcast.pk for podcast in results])
+            .order_by("-pub_date")[: limit - len(results)]
+        )
+
+    return results
+
+
+def _get_cache_key(value: str, limit: int) -> str:
+    return f"autocomplete:{hashlib.sha256(value.encode()).hexdigest()}:{limit}"
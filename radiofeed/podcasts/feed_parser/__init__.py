@@ -7,7 +7,9 @@ from asgiref.sync import sync_to_async
 from django.db import transaction
 from django.utils import timezone
 
+from radiofeed.db.search import bump_search_generation
 from radiofeed.episodes.models import Episode
+from radiofeed.podcasts.autocomplete import get_autocomplete_text
 from radiofeed.podcasts.feed_parser import scheduler
 from radiofeed.podcasts.feed_parser.exceptions import (
     DiscontinuedError,
@@ -20,6 +22,8 @@ from radiofeed.podcasts.feed_parser.models import Feed, Item
 from radiofeed.podcasts.feed_parser.rss_fetcher import Response, fetch_rss
 from radiofeed.podcasts.feed_parser.rss_parser import parse_rss
 from radiofeed.podcasts.models import Category, Podcast
+from radiofeed.podcasts.subscriptions import bump_subscribers_version
+from radiofeed.sanitizer import markdown, strip_html
 
 if TYPE_CHECKING:
     import datetime
@@ -29,6 +33,8 @@ if TYPE_CHECKING:
 _CATEGORIES_CACHE_KEY: Final = "feed_parser:categories_dict"
 _CATEGORIES_CACHE_TIMEOUT: Final = 60 * 60  # 1 hour
 
+_RENDERED_FIELDS: Final = ("title_text", "description_text", "description_html")
+
 
 async def parse_feed(podcast: Podcast, client: Client) -> Podcast.FeedStatus:
     """Updates a Podcast instance with its RSS or Atom feed source."""
@@ -150,28 +156,83 @@ class _FeedParser:
             episodes = Episode.objects.filter(podcast=self.podcast)
             items = list({item.guid: item for item in feed.items}.values())
 
-            episodes.exclude(guid__in={item.guid for item in items}).delete()
+            num_deleted, _ = episodes.exclude(
+                guid__in={item.guid for item in items}
+            ).delete()
+
+            # Sanitized text and HTML are only rendered again if the title or
+            # description of an episode has changed since it was last stored.
+            guids_to_episodes = {
+                guid: (pk, (title, description) if title_text else None)
+                for guid, pk, title, description, title_text in episodes.values_list(
+                    "guid",
+                    "pk",
+                    "title",
+                    "description",
+                    "title_text",
+                )
+            }
 
-            guids_to_pks = dict(episodes.values_list("guid", "pk"))
+            unchanged_episodes: list[Episode] = []
+            changed_episodes: list[Episode] = []
 
-            episodes_for_upsert = [
-                Episode(
-                    podcast=self.podcast,
-                    pk=guids_to_pks.get(item.guid),
-                    **item.model_dump(),
-                )
-                for item in items
-            ]
+            for item in items:
+                pk, content = guids_to_episodes.get(item.guid, (None, None))
+                episode = Episode(podcast=self.podcast, pk=pk, **item.model_dump())
+
+                if content == (item.title, item.description):
+                    unchanged_episodes.append(episode)
+                else:
+                    episode.title_text = strip_html(item.title)
+                    episode.description_text = strip_html(item.description)
+                    episode.description_html = markdown(item.description)
+                    changed_episodes.append(episode)
 
             unique_fields = ("podcast", "guid")
             update_fields = Item.model_fields.keys()
 
-            for batch in itertools.batched(episodes_for_upsert, 300, strict=False):
-                Episode.objects.bulk_create(
-                    batch,
-                    update_conflicts=True,
-                    unique_fields=unique_fields,
-                    update_fields=update_fields,
+            for episodes_for_upsert, fields in (
+                (unchanged_episodes, update_fields),
+                (changed_episodes, [*update_fields, *_RENDERED_FIELDS]),
+            ):
+                for batch in itertools.batched(episodes_for_upsert, 300, strict=False):
+                    Episode.objects.bulk_create(
+                        batch,
+                        update_conflicts=True,
+                        unique_fields=unique_fields,
+                        update_fields=fields,
+                    )
+
+            # All episodes in the feed are upserted, so have primary keys: the
+            # latest is stored, saving a query per podcast on each read.
+            latest_episode = max(
+                itertools.chain(unchanged_episodes, changed_episodes),
+                key=lambda episode: (episode.pub_date, episode.pk),
+                default=None,
+            )
+
+            extracted_text = self._extracted_text(feed)
+
+            # Cached search results are only invalidated if searchable fields
+            # have changed: tokenized podcast fields, or episodes added, removed
+            # or with a new title or description.
+            search_models: list[type[Podcast | Episode]] = []
+
+            if extracted_text:
+                search_models.append(Podcast)
+
+            if num_deleted or changed_episodes:
+                search_models.append(Episode)
+
+            transaction.on_commit(
+                functools.partial(bump_search_generation, *search_models)
+            )
+
+            # Subscribers' cached lists of podcasts and latest episodes are
+            # ordered by podcast pub date
+            if feed.pub_date != self.podcast.pub_date:
+                transaction.on_commit(
+                    functools.partial(bump_subscribers_version, self.podcast.pk)
                 )
 
             return self._feed_update(
@@ -181,9 +242,11 @@ class _FeedParser:
                 content_hash=response.content_hash,
                 etag=response.etag,
                 modified=response.modified,
-                extracted_text=feed.tokenize(),
+                **extracted_text,
+                **self._rendered_text(feed),
                 frequency=scheduler.schedule(feed),
                 num_episodes=len(feed.items),
+                latest_episode=latest_episode,
                 **feed.model_dump(
                     exclude={
                         "canonical_url",
@@ -194,6 +257,50 @@ class _FeedParser:
                 ),
             )
 
+    def _extracted_text(self, feed: Feed) -> dict[str, str]:
+        # Tokenizing is the most expensive step of a parse, so is skipped if the
+        # podcast fields it is based on are unchanged, e.g. if only new episodes
+        # have been added to the feed.
+        extracted_text_hash = feed.get_extracted_text_hash()
+        if (
+            self.podcast.extracted_text
+            and extracted_text_hash == self.podcast.extracted_text_hash
+        ):
+            return {}
+        return {
+            "extracted_text": feed.tokenize(),
+            "extracted_text_hash": extracted_text_hash,
+        }
+
+    def _rendered_text(self, feed: Feed) -> dict[str, str]:
+        # As with episodes, sanitized text and HTML are only rendered again if
+        # the podcast fields they are based on have changed, or if the stored
+        # copies have been cleared e.g. after editing in the admin.
+        fields: dict[str, str] = {}
+
+        if _is_changed(
+            feed.title, self.podcast.title, self.podcast.title_text
+        ) or _is_changed(feed.owner, self.podcast.owner, self.podcast.owner_text):
+            title_text = strip_html(feed.title)
+            owner_text = strip_html(feed.owner)
+            fields |= {
+                "title_text": title_text,
+                "owner_text": owner_text,
+                "autocomplete_text": get_autocomplete_text(title_text, owner_text),
+            }
+
+        if _is_changed(
+            feed.description,
+            self.podcast.description,
+            self.podcast.description_html,
+        ):
+            fields |= {
+                "description_text": strip_html(feed.description),
+                "description_html": markdown(feed.description),
+            }
+
+        return fields
+
     def _feed_update(
         self,
         feed_status: Podcast.FeedStatus,
@@ -212,3 +319,7 @@ class _FeedParser:
             **fields,
         )
         return feed_status
+
+
+def _is_changed(value: str, stored: str, rendered: str) -> bool:
+    return value != stored or bool(value and not rendered)
@@ -1,9 +1,52 @@
 import functools
-from datetime import date, datetime
+import re
+from datetime import date, datetime, timedelta, timezone
+from typing import Final
 
 from dateutil import parser as date_parser
 from django.utils.timezone import is_aware, make_aware
 
+_CACHE_SIZE: Final = 4096
+
+_MONTHS: Final = {
+    name: number
+    for number, names in enumerate(
+        (
+            ("jan", "january"),
+            ("feb", "february"),
+            ("mar", "march"),
+            ("apr", "april"),
+            ("may",),
+            ("jun", "june"),
+            ("jul", "july"),
+            ("aug", "august"),
+            ("sep", "sept", "september"),
+            ("oct", "october"),
+            ("nov", "november"),
+            ("dec", "december"),
+        ),
+        start=1,
+    )
+    for name in names
+}
+
+_WEEKDAYS: Final = {
+    "mon",
+    "monday",
+    "tue",
+    "tuesday",
+    "wed",
+    "wednesday",
+    "thu",
+    "thursday",
+    "fri",
+    "friday",
+    "sat",
+    "saturday",
+    "sun",
+    "sunday",
+}
+
 
 @functools.singledispatch
 def parse_date(value: str | datetime | date | None) -> datetime | None:
@@ -44,14 +87,89 @@ def _(value: date) -> datetime | None:
 
 @parse_date.register
 def _(value: str) -> datetime | None:
+    return _parse_date_str(value) if value else None
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _parse_date_str(value: str) -> datetime | None:
+    # Most feeds use RFC 822 or ISO 8601 dates, which are parsed directly. Any other
+    # strings, or ones with quirks such as out of range offsets, fall back to dateutil.
+    if (dt := _parse_rfc_822(value) or _parse_iso_8601(value)) is None:
+        try:
+            dt = date_parser.parse(value, tzinfos=_tz_infos())
+        except date_parser.ParserError:
+            return None
+    return parse_date(dt)
+
+
+def _parse_rfc_822(value: str) -> datetime | None:
+    # e.g. "Fri, 19 Jun 2020 16:58:03 +0000"
+    if not (match := _re_rfc_822().match(value)):
+        return None
+
+    weekday, day, month, year, hour, minute, second, offset, tzname = match.groups()
+
+    month_number = _MONTHS.get(month.casefold())
+
+    if month_number is None or (weekday and weekday.casefold() not in _WEEKDAYS):
+        return None
+
+    if offset:
+        sign = -1 if offset[0] == "-" else 1
+        tzinfo = timezone(
+            sign * timedelta(hours=int(offset[1:3]), minutes=int(offset[3:]))
+        )
+    elif tzname:
+        if (seconds := _tz_infos().get(tzname)) is None:
+            return None
+        tzinfo = timezone(timedelta(seconds=seconds))
+    else:
+        tzinfo = None
+
     try:
-        return (
-            parse_date(date_parser.parse(value, tzinfos=_tz_infos())) if value else None
+        return datetime(
+            int(year),
+            month_number,
+            int(day),
+            int(hour),
+            int(minute),
+            int(second or 0),
+            tzinfo=tzinfo,
         )
-    except date_parser.ParserError:
+    except ValueError:
+        return None
+
+
+def _parse_iso_8601(value: str) -> datetime | None:
+    # e.g. "2020-06-19T16:58:03Z"
+    if not _re_iso_8601().match(value):
+        return None
+    try:
+        return datetime.fromisoformat(value.strip())
+    except ValueError:
         return None
 
 
+@functools.cache
+def _re_rfc_822() -> re.Pattern:
+    # Years before 1000 and the military zones "A" and "P" (read by dateutil
+    # as AM/PM) are left to the fallback, so that results do not change.
+    return re.compile(
+        r"^\s*(?:([A-Za-z]+),?\s+)?"
+        r"(\d{1,2})\s+([A-Za-z]+)\s+([1-9]\d{3})\s+"
+        r"(\d{1,2}):(\d{2})(?::(\d{2}))?"
+        r"(?:\s*([+-](?:[01]\d|2[0-3])[0-5]\d)|\s+([A-Z]{2,5}|[B-OQ-Z]))?\s*$"
+    )
+
+
+@functools.cache
+def _re_iso_8601() -> re.Pattern:
+    return re.compile(
+        r"^\s*\d{4}-\d{2}-\d{2}"
+        r"(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?(?:Z|[+-]\d{2}:?\d{2})?)?\s*$"
+    )
+
+
 @functools.cache
 def _tz_infos() -> dict[str, int]:
     return {
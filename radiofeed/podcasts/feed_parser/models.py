@@ -1,3 +1,4 @@
+import hashlib
 from datetime import datetime
 from typing import Any, ClassVar
 
@@ -203,3 +204,22 @@ class Feed(BaseModel):
             ]
         )
         return " ".join(tokenizer.tokenize(self.language, text))
+
+    def get_extracted_text_hash(self) -> str:
+        """Return hash of the podcast fields tokenized by `tokenize`.
+
+        Episode titles are not included, so that new episodes alone do not
+        require the feed to be tokenized again.
+        """
+        return hashlib.sha256(
+            "\n".join(
+                [
+                    self.language,
+                    self.title,
+                    self.description,
+                    self.owner,
+                    ",".join(sorted(self.categories)),
+                    self.keywords,
+                ]
+            ).encode()
+        ).hexdigest()
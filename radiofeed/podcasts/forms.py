@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING, ClassVar
 from django import forms
 
 from radiofeed.podcasts.models import Podcast
-from radiofeed.podcasts.opml_parser import parse_opml
+from radiofeed.podcasts.opml_parser import iterparse_opml
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -34,7 +34,14 @@ class OpmlUploadForm(forms.Form):
     )
 
     def parse_opml(self) -> Iterator[str]:
-        """Parse the uploaded OPML file and extract podcast RSS feed URLs."""
-        fp = self.cleaned_data["opml"]
-        fp.seek(0)
-        return parse_opml(fp.read())
+        """Parse the uploaded OPML file and extract valid podcast RSS feed URLs.
+
+        The file is parsed in chunks, so large uploads are not read into memory.
+        """
+        rss_field = Podcast._meta.get_field("rss")
+        for url in iterparse_opml(self.cleaned_data["opml"].chunks()):
+            try:
+                rss_field.run_validators(url)
+            except forms.ValidationError:
+                continue
+            yield url
@@ -0,0 +1,324 @@
+import collections
+import json
+import pathlib
+import resource
+import shutil
+import statistics
+import string
+
+import numpy as np
+from django.core.management import BaseCommand, CommandError, CommandParser
+from django.db import transaction
+from django.utils import timezone
+
+from radiofeed.podcasts import recommender
+from radiofeed.podcasts.models import Category, Podcast, Recommendation
+
+# ISO 639-1 has no codes starting with "q" other than "qu", so synthetic
+# languages never collide with real podcasts.
+_languages = [f"q{letter}" for letter in string.ascii_lowercase if letter != "u"]
+
+_stages = ("load", "hashing", "tfidf", "index", "knn", "scoring", "write")
+
+
+class Command(BaseCommand):
+    """Django management command to benchmark the recommender on synthetic corpora."""
+
+    help = """Measure time per stage, peak memory and quality of recommendations
+    on synthetic podcasts. All data is created in a transaction that is rolled back,
+    but should not be run against a production database."""
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Parse command line arguments."""
+        parser.add_argument(
+            "--num-podcasts",
+            type=int,
+            default=10000,
+            help="Number of podcasts per language.",
+        )
+        parser.add_argument(
+            "--num-languages",
+            type=int,
+            default=1,
+            choices=range(1, len(_languages) + 1),
+            metavar=f"1-{len(_languages)}",
+            help="Number of languages.",
+        )
+        parser.add_argument(
+            "--num-categories",
+            type=int,
+            default=20,
+            help="Number of categories.",
+        )
+        parser.add_argument(
+            "--num-words",
+            type=int,
+            default=200,
+            help="Number of words per podcast.",
+        )
+        parser.add_argument(
+            "--vocabulary-size",
+            type=int,
+            default=20000,
+            help="Number of distinct words per language.",
+        )
+        parser.add_argument(
+            "--num-matches",
+            type=int,
+            default=12,
+            help="Number of neighbours per podcast.",
+        )
+        parser.add_argument(
+            "--approximate",
+            action="store_true",
+            help="Also run approximate nearest neighbours and compare against exact.",
+        )
+        parser.add_argument(
+            "--num-bits",
+            type=int,
+            default=12,
+            help="Hyperplanes per hash table in approximate mode.",
+        )
+        parser.add_argument(
+            "--num-tables",
+            type=int,
+            default=4,
+            help="Number of hash tables in approximate mode.",
+        )
+        parser.add_argument(
+            "--min-rows",
+            type=int,
+            default=0,
+            help="Minimum category size for approximate neighbours.",
+        )
+        parser.add_argument(
+            "--reference",
+            type=pathlib.Path,
+            help="Compare recommendations against a file saved with --output.",
+        )
+        parser.add_argument(
+            "--output",
+            type=pathlib.Path,
+            help="Save recommendations to file, for use as a later --reference.",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Random seed for the synthetic corpus.",
+        )
+
+    def handle(  # noqa: PLR0913
+        self,
+        *,
+        num_podcasts: int,
+        num_languages: int,
+        num_categories: int,
+        num_words: int,
+        vocabulary_size: int,
+        num_matches: int,
+        approximate: bool,
+        num_bits: int,
+        num_tables: int,
+        min_rows: int,
+        reference: pathlib.Path | None,
+        output: pathlib.Path | None,
+        seed: int,
+        **options,
+    ) -> None:
+        """Command handler."""
+        try:
+            references = json.loads(reference.read_text()) if reference else {}
+        except (OSError, ValueError) as exc:
+            raise CommandError(f"Unable to read reference: {exc}") from exc
+
+        rng = np.random.default_rng(seed)
+        languages = _languages[:num_languages]
+        results: dict[str, dict[str, list[str]]] = {}
+
+        try:
+            with transaction.atomic():
+                categories = Category.objects.bulk_create(
+                    Category(name=f"Benchmark {n}", slug=f"benchmark-{n}")
+                    for n in range(num_categories)
+                )
+
+                for language in languages:
+                    self._create_podcasts(
+                        rng,
+                        language,
+                        categories,
+                        num_podcasts=num_podcasts,
+                        num_words=num_words,
+                        vocabulary_size=vocabulary_size,
+                    )
+
+                    results[language] = self._run(
+                        language,
+                        "exact",
+                        num_matches=num_matches,
+                    )
+
+                    if language in references:
+                        self._write_overlap(
+                            language,
+                            "reference",
+                            references[language],
+                            results[language],
+                            num_matches,
+                        )
+
+                    if approximate:
+                        self._write_overlap(
+                            language,
+                            "exact",
+                            results[language],
+                            self._run(
+                                language,
+                                "approximate",
+                                num_matches=num_matches,
+                                approximate=recommender.ApproximateNeighbors(
+                                    num_bits=num_bits,
+                                    num_tables=num_tables,
+                                    min_rows=min_rows,
+                                ),
+                            ),
+                            num_matches,
+                        )
+
+                transaction.set_rollback(True)
+        finally:
+            for language in languages:
+                shutil.rmtree(recommender.get_index_path(language), ignore_errors=True)
+
+        if output:
+            output.write_text(json.dumps(results))
+
+    def _create_podcasts(  # noqa: PLR0913
+        self,
+        rng: np.random.Generator,
+        language: str,
+        categories: list[Category],
+        *,
+        num_podcasts: int,
+        num_words: int,
+        vocabulary_size: int,
+    ) -> None:
+        # Each category has its own topic words. Podcasts draw half their words
+        # from the topics of their categories and the rest from a Zipf-like
+        # background distribution shared across the language.
+        vocabulary = np.array(
+            [f"{language}{n:x}" for n in range(vocabulary_size)], dtype=object
+        )
+        background = 1 / np.arange(1, vocabulary_size + 1)
+        background /= background.sum()
+
+        topics = [
+            rng.choice(vocabulary_size, size=max(vocabulary_size // 100, 1))
+            for _ in categories
+        ]
+
+        now = timezone.now()
+
+        podcast_categories = [
+            rng.choice(len(categories), size=rng.integers(1, 4), replace=False)
+            for _ in range(num_podcasts)
+        ]
+
+        podcasts = Podcast.objects.bulk_create(
+            (
+                Podcast(
+                    rss=f"https://{language}.benchmark.invalid/{n}",
+                    title=f"Benchmark {language} {n}",
+                    language=language,
+                    pub_date=now,
+                    extracted_text=" ".join(
+                        vocabulary[
+                            np.concatenate(
+                                (
+                                    rng.choice(
+                                        np.concatenate([topics[i] for i in indices]),
+                                        size=num_words // 2,
+                                    ),
+                                    rng.choice(
+                                        vocabulary_size,
+                                        size=num_words - num_words // 2,
+                                        p=background,
+                                    ),
+                                )
+                            )
+                        ]
+                    ),
+                )
+                for n, indices in enumerate(podcast_categories)
+            ),
+            batch_size=1000,
+        )
+
+        Podcast.categories.through.objects.bulk_create(
+            (
+                Podcast.categories.through(
+                    podcast_id=podcast.pk,
+                    category_id=categories[index].pk,
+                )
+                for podcast, indices in zip(podcasts, podcast_categories, strict=True)
+                for index in indices.tolist()
+            ),
+            batch_size=1000,
+        )
+
+    def _run(
+        self,
+        language: str,
+        name: str,
+        **kwargs,
+    ) -> dict[str, list[str]]:
+        timings = recommender.recommend(language, **kwargs)
+
+        stages = " ".join(f"{stage}={timings.get(stage, 0):.2f}s" for stage in _stages)
+
+        self.stdout.write(
+            f"language={language} run={name} {stages} "
+            f"total={sum(timings.values()):.2f}s "
+            f"peak_rss={self._get_peak_rss()}MiB"
+        )
+
+        return self._get_top_matches(language, kwargs["num_matches"])
+
+    def _get_top_matches(self, language: str, num_matches: int) -> dict[str, list[str]]:
+        # Podcasts are keyed by RSS, which is stable across runs with the same seed
+        matches = collections.defaultdict(list)
+
+        for rss, recommended in (
+            Recommendation.objects.filter(podcast__language=language)
+            .order_by("podcast__rss", "-score", "recommended__rss")
+            .values_list("podcast__rss", "recommended__rss")
+            .iterator()
+        ):
+            if len(matches[rss]) < num_matches:
+                matches[rss].append(recommended)
+
+        return matches
+
+    def _write_overlap(
+        self,
+        language: str,
+        name: str,
+        expected: dict[str, list[str]],
+        found: dict[str, list[str]],
+        num_matches: int,
+    ) -> None:
+        overlaps = [
+            len(set(recommended) & set(found.get(rss, []))) / len(recommended)
+            for rss, recommended in expected.items()
+            if recommended
+        ]
+        overlap = statistics.mean(overlaps) if overlaps else 1.0
+
+        self.stdout.write(
+            f"language={language} overlap@{num_matches}={overlap:.3f} vs {name}"
+        )
+
+    def _get_peak_rss(self) -> int:
+        # ru_maxrss is in KiB on Linux
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024
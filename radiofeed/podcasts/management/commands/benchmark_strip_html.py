@@ -0,0 +1,63 @@
+import html
+import time
+from typing import TYPE_CHECKING
+
+from django.core.management import BaseCommand, CommandParser
+from django.template.defaultfilters import striptags
+
+from radiofeed.episodes.models import Episode
+from radiofeed.podcasts.models import Podcast
+from radiofeed.sanitizer import markdown, strip_extra_spaces, strip_html
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class Command(BaseCommand):
+    """Django management command to benchmark plain text extraction."""
+
+    help = "Compare time and output of strip_html against rendering Markdown to HTML."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Parse command line arguments."""
+        parser.add_argument(
+            "--limit",
+            "-l",
+            type=int,
+            default=1000,
+            help="Number of latest podcast and episode descriptions to sample.",
+        )
+
+    def handle(self, *, limit: int, **options) -> None:
+        """Command handler."""
+        for name, model in (("podcasts", Podcast), ("episodes", Episode)):
+            descriptions = list(
+                model.objects.exclude(description="")
+                .order_by("-pk")
+                .values_list("description", flat=True)[:limit]
+            )
+
+            rendered, expected = self._time(_strip_html_rendered, descriptions)
+            fast, results = self._time(strip_html, descriptions)
+
+            mismatches = sum(
+                result != value for result, value in zip(results, expected, strict=True)
+            )
+
+            self.stdout.write(
+                f"{name}: texts={len(descriptions)} rendered={rendered:.2f}s "
+                f"fast={fast:.2f}s speedup={rendered / fast if fast else 0:.1f}x "
+                f"mismatches={mismatches}"
+            )
+
+    def _time(
+        self, strip: Callable[[str], str], values: list[str]
+    ) -> tuple[float, list[str]]:
+        start = time.perf_counter()
+        results = [strip(value) for value in values]
+        return time.perf_counter() - start, results
+
+
+def _strip_html_rendered(content: str) -> str:
+    # Reference implementation: renders Markdown to HTML, then strips the tags
+    return strip_extra_spaces(html.unescape(striptags(markdown(content))))
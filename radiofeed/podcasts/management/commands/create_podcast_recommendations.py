@@ -1,25 +1,113 @@
-from django.core.management import BaseCommand
+import concurrent.futures
+import functools
+from typing import TYPE_CHECKING
+
+import django
+from django.core.management import BaseCommand, CommandParser
+from django.db import connections
+from django.db.models import Count, Q
 from django.db.models.functions import Lower
 
 from radiofeed.podcasts import recommender, tokenizer
 from radiofeed.podcasts.models import Podcast
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 
 class Command(BaseCommand):
     """Django management command to create podcast recommendations for specified languages or all languages if none are specified."""
 
     help = "Create podcast recommendations for all languages."
 
-    def handle(self, **options) -> None:
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Parse command line arguments."""
+        parser.add_argument(
+            "--jobs",
+            "-j",
+            type=int,
+            default=1,
+            help="Max number of languages processed concurrently, each in its own process.",
+        )
+        parser.add_argument(
+            "--approximate",
+            action="store_true",
+            help="Use approximate nearest neighbours for very large categories.",
+        )
+        parser.add_argument(
+            "--num-bits",
+            type=int,
+            default=12,
+            help="Hyperplanes per hash table in approximate mode.",
+        )
+        parser.add_argument(
+            "--num-tables",
+            type=int,
+            default=4,
+            help="Number of hash tables in approximate mode.",
+        )
+
+    def handle(
+        self,
+        *,
+        jobs: int,
+        approximate: bool,
+        num_bits: int,
+        num_tables: int,
+        **options,
+    ) -> None:
         """Commmand handler."""
-        languages = (
+        recommend = functools.partial(
+            recommender.recommend,
+            approximate=recommender.ApproximateNeighbors(
+                num_bits=num_bits,
+                num_tables=num_tables,
+            )
+            if approximate
+            else None,
+        )
+
+        # largest corpus first, so the biggest job does not hold up the others
+        languages = list(
             Podcast.objects.annotate(language_code=Lower("language"))
             .filter(language_code__in=tokenizer.get_language_codes())
+            .values("language_code")
+            .annotate(
+                num_podcasts=Count("pk", filter=Q(active=True, private=False)),
+            )
+            .order_by("-num_podcasts", "language_code")
             .values_list("language_code", flat=True)
-            .order_by("language_code")
-            .distinct()
         )
 
-        for language in languages:
-            recommender.recommend(language)
-            self.stdout.write(f"Recommendations created for language: {language}")
+        if jobs > 1:
+            self._recommend_parallel(recommend, languages, jobs)
+        else:
+            for language in languages:
+                recommend(language)
+                self._write_success(language)
+
+    def _recommend_parallel(
+        self,
+        recommend: Callable[[str], dict[str, float]],
+        languages: list[str],
+        jobs: int,
+    ) -> None:
+        # Workers are spawned fresh (not forked) so that each opens its own
+        # database connection, and are recycled after every language so that
+        # memory from the largest corpus is released before the next one.
+        connections.close_all()
+
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=django.setup,
+            max_tasks_per_child=1,
+        ) as executor:
+            futures = {
+                executor.submit(recommend, language): language for language in languages
+            }
+            for future in concurrent.futures.as_completed(futures):
+                future.result()
+                self._write_success(futures[future])
+
+    def _write_success(self, language: str) -> None:
+        self.stdout.write(f"Recommendations created for language: {language}")
@@ -0,0 +1,24 @@
+from django.core.management import BaseCommand, CommandParser
+
+from radiofeed.podcasts.models import UserRecommendation
+
+
+class Command(BaseCommand):
+    """Django management command to precompute recommended podcasts for each user."""
+
+    help = "Create podcast recommendations for all users."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Parse command line arguments."""
+        parser.add_argument(
+            "--limit",
+            "-l",
+            type=int,
+            default=12,
+            help="Max recommendations per user.",
+        )
+
+    def handle(self, *, limit: int, **options) -> None:
+        """Command handler."""
+        num_rows = UserRecommendation.objects.rebuild(limit)
+        self.stdout.write(f"Recommendations created for users: {num_rows}")
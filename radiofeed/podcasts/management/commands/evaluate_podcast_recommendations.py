@@ -0,0 +1,89 @@
+import itertools
+import time
+
+from django.core.management import BaseCommand, CommandError, CommandParser
+
+from radiofeed.podcasts import recommender
+
+
+class Command(BaseCommand):
+    """Django management command to compare approximate against exact recommendations."""
+
+    help = "Measure recall and time of approximate nearest neighbours for a language."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Parse command line arguments."""
+        parser.add_argument(
+            "--language",
+            default="en",
+            help="Language of the persisted recommender index.",
+        )
+        parser.add_argument(
+            "--num-bits",
+            type=int,
+            nargs="+",
+            default=[8, 12, 16],
+            help="Hyperplanes per hash table.",
+        )
+        parser.add_argument(
+            "--num-tables",
+            type=int,
+            nargs="+",
+            default=[2, 4, 8],
+            help="Number of hash tables.",
+        )
+        parser.add_argument(
+            "--min-rows",
+            type=int,
+            default=recommender.ApproximateNeighbors.min_rows,
+            help="Minimum category size for approximate neighbours.",
+        )
+        parser.add_argument(
+            "--num-matches",
+            type=int,
+            default=12,
+            help="Number of neighbours per podcast.",
+        )
+        parser.add_argument(
+            "--sample-size",
+            type=int,
+            default=1000,
+            help="Number of podcasts sampled for exact comparison.",
+        )
+
+    def handle(  # noqa: PLR0913
+        self,
+        *,
+        language: str,
+        num_bits: list[int],
+        num_tables: list[int],
+        min_rows: int,
+        num_matches: int,
+        sample_size: int,
+        **options,
+    ) -> None:
+        """Command handler."""
+        if (index := recommender.load_index(language)) is None:
+            raise CommandError(f"No recommender index found for language: {language}")
+
+        self.stdout.write(f"Podcasts in index: {index.matrix.shape[0]}")
+
+        partitions = recommender.get_category_partitions(language, index)
+
+        for bits, tables in itertools.product(num_bits, num_tables):
+            start = time.perf_counter()
+            recall = recommender.evaluate_recall(
+                index,
+                recommender.ApproximateNeighbors(
+                    num_bits=bits,
+                    num_tables=tables,
+                    min_rows=min_rows,
+                ),
+                partitions=partitions,
+                num_matches=num_matches,
+                sample_size=sample_size,
+            )
+            elapsed = time.perf_counter() - start
+            self.stdout.write(
+                f"bits={bits} tables={tables} recall={recall:.3f} time={elapsed:.2f}s"
+            )
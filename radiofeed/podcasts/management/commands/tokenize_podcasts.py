@@ -0,0 +1,180 @@
+import collections
+import concurrent.futures
+import itertools
+import operator
+from typing import TYPE_CHECKING
+
+import django
+from django.core.management import BaseCommand, CommandParser
+from django.db import connections
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+
+from radiofeed.episodes.models import Episode
+from radiofeed.podcasts import tokenizer
+from radiofeed.podcasts.models import Podcast
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from django.db.models import QuerySet
+
+
+class Command(BaseCommand):
+    """Django management command to rebuild extracted text of podcasts."""
+
+    help = """Re-tokenize extracted text of podcasts from their stored fields, e.g. after
+    changes to stopwords. Results may differ slightly from parsing the feeds again,
+    as only categories matched on parsing are stored. Progress is written per range
+    of podcast IDs, so an interrupted run can be resumed with --start."""
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Parse command line arguments."""
+        parser.add_argument(
+            "--jobs",
+            "-j",
+            type=int,
+            default=1,
+            help="Max number of batches processed concurrently, each in its own process.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            "-b",
+            type=int,
+            default=1000,
+            help="Number of podcasts per batch.",
+        )
+        parser.add_argument(
+            "--start",
+            type=int,
+            help="Start from this podcast ID.",
+        )
+        parser.add_argument(
+            "--end",
+            type=int,
+            help="End at this podcast ID.",
+        )
+
+    def handle(
+        self,
+        *,
+        jobs: int,
+        batch_size: int,
+        start: int | None,
+        end: int | None,
+        **options,
+    ) -> None:
+        """Command handler."""
+        podcasts = _get_queryset()
+
+        if start is not None:
+            podcasts = podcasts.filter(pk__gte=start)
+
+        if end is not None:
+            podcasts = podcasts.filter(pk__lte=end)
+
+        pk_ranges = [
+            (batch[0], batch[-1])
+            for batch in itertools.batched(
+                podcasts.order_by("pk").values_list("pk", flat=True).iterator(),
+                batch_size,
+                strict=False,
+            )
+        ]
+
+        if jobs > 1:
+            # See create_podcast_recommendations: each worker process opens its
+            # own database connection.
+            connections.close_all()
+
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=jobs,
+                initializer=django.setup,
+            ) as executor:
+                self._write_progress(pk_ranges, executor.map(_tokenize, pk_ranges))
+        else:
+            self._write_progress(pk_ranges, map(_tokenize, pk_ranges))
+
+    def _write_progress(
+        self,
+        pk_ranges: list[tuple[int, int]],
+        results: Iterable[int],
+    ) -> None:
+        # Results are written in order of ID, so the last range written is always
+        # safe to resume after.
+        for (first_pk, last_pk), num_podcasts in zip(pk_ranges, results, strict=True):
+            self.stdout.write(
+                f"Podcasts tokenized: {num_podcasts} (IDs {first_pk}-{last_pk})"
+            )
+
+
+def _get_queryset() -> QuerySet[Podcast]:
+    # Only podcasts already tokenized from a parsed feed
+    return Podcast.objects.exclude(extracted_text="")
+
+
+def _tokenize(pk_range: tuple[int, int]) -> int:
+    # Rebuilds extracted text from the stored equivalents of the fields used by
+    # `Feed.tokenize`. The results are close to, but not always the same as, a
+    # fresh parse of the feed:
+    #
+    # - feed categories are only stored if they match a `Category`, so the slugs
+    #   of matched categories are used and any other feed categories are missing;
+    # - the six latest episodes by pub date are used rather than the first six
+    #   items in the feed.
+    podcasts = list(
+        _get_queryset()
+        .filter(pk__range=pk_range)
+        .prefetch_related("categories")
+        .only("title", "description", "owner", "keywords", "language")
+    )
+
+    episode_titles = collections.defaultdict(list)
+
+    for podcast_id, title in (
+        Episode.objects.filter(podcast__in=podcasts)
+        .annotate(
+            position=Window(
+                RowNumber(),
+                partition_by=F("podcast"),
+                order_by=F("pub_date").desc(),
+            )
+        )
+        .filter(position__lte=6)
+        .order_by("podcast", "position")
+        .values_list("podcast", "title")
+    ):
+        episode_titles[podcast_id].append(title)
+
+    podcasts.sort(key=operator.attrgetter("language"))
+
+    for language, group in itertools.groupby(
+        podcasts, key=operator.attrgetter("language")
+    ):
+        batch = list(group)
+        texts = [
+            " ".join(
+                value
+                for value in [
+                    podcast.title,
+                    podcast.description,
+                    podcast.owner,
+                    *[category.slug for category in podcast.categories.all()],
+                    *podcast.keywords.split(","),
+                    *episode_titles[podcast.pk],
+                ]
+                if value
+            )
+            for podcast in batch
+        ]
+
+        for podcast, tokens in zip(
+            batch,
+            tokenizer.tokenize_many(language, texts),
+            strict=True,
+        ):
+            podcast.extracted_text = " ".join(tokens)
+
+    Podcast.objects.bulk_update(podcasts, ["extracted_text"], batch_size=500)
+
+    return len(podcasts)
@@ -0,0 +1,36 @@
+# Generated by Django 6.0.2 on 2026-10-19 08:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("podcasts", "0112_userrecommendation"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="podcast",
+            name="description_html",
+            field=models.TextField(blank=True, default="", editable=False),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="podcast",
+            name="description_text",
+            field=models.TextField(blank=True, default="", editable=False),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="podcast",
+            name="owner_text",
+            field=models.TextField(blank=True, default="", editable=False),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="podcast",
+            name="title_text",
+            field=models.TextField(blank=True, default="", editable=False),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-19 08:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("podcasts", "0113_podcast_description_html_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="podcast",
+            name="extracted_text_hash",
+            field=models.CharField(blank=True, default="", max_length=64),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 6.0.2 on 2026-10-19 08:30
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently, TrigramExtension
+from django.db import migrations, models
+
+timeout_statement = "SET statement_timeout = 0;"
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("podcasts", "0114_podcast_extracted_text_hash"),
+    ]
+
+    operations = [
+        migrations.RunSQL(timeout_statement, reverse_sql=timeout_statement),
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="podcast",
+            name="autocomplete_text",
+            field=models.TextField(blank=True, default="", editable=False),
+            preserve_default=False,
+        ),
+        # Approximates text stored by the feed parser until next parsed
+        migrations.RunSQL(
+            r"""
+UPDATE podcasts_podcast
+SET autocomplete_text = trim(left(lower(regexp_replace(
+    trim(
+        coalesce(nullif(title_text, ''), title) || ' ' ||
+        coalesce(nullif(owner_text, ''), owner)
+    ),
+    '\s+', ' ', 'g'
+)), 200));""",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        AddIndexConcurrently(
+            model_name="podcast",
+            index=models.Index(
+                condition=models.Q(("private", False), ("pub_date__isnull", False)),
+                fields=["autocomplete_text"],
+                name="podcasts_podcast_ac_prefix_idx",
+                opclasses=["text_pattern_ops"],
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="podcast",
+            index=django.contrib.postgres.indexes.GinIndex(
+                condition=models.Q(("private", False), ("pub_date__isnull", False)),
+                fields=["autocomplete_text"],
+                name="podcasts_podcast_ac_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
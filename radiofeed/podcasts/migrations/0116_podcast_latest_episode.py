@@ -0,0 +1,37 @@
+# Generated by Django 6.0.2 on 2026-10-19 08:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("episodes", "0033_episode_library_search_vector"),
+        ("podcasts", "0115_podcast_autocomplete_text"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="podcast",
+            name="latest_episode",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="episodes.episode",
+            ),
+        ),
+        migrations.RunSQL(
+            """
+UPDATE podcasts_podcast
+SET latest_episode_id = (
+    SELECT id FROM episodes_episode
+    WHERE episodes_episode.podcast_id = podcasts_podcast.id
+    ORDER BY pub_date DESC, id DESC
+    LIMIT 1
+);""",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 6.0.2 on 2026-10-19 08:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("podcasts", "0116_podcast_latest_episode"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RecommenderIndex",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("language", models.CharField(max_length=2, unique=True)),
+                ("version", models.PositiveSmallIntegerField()),
+                ("data", models.BinaryField()),
+                ("updated", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 6.0.2 on 2026-10-19 08:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("podcasts", "0117_recommenderindex"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="recommenderindex",
+            name="data",
+        ),
+        migrations.CreateModel(
+            name="RecommenderIndexChunk",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=30)),
+                ("position", models.PositiveIntegerField()),
+                ("data", models.BinaryField()),
+                (
+                    "index",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="chunks",
+                        to="podcasts.recommenderindex",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("index", "name", "position"),
+                        name="unique_podcasts_recommenderindexchunk",
+                    )
+                ],
+            },
+        ),
+    ]
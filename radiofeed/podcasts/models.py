@@ -6,18 +6,20 @@ from django.conf import settings
 from django.contrib.postgres.indexes import GinIndex
 from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import MinLengthValidator
-from django.db import models
-from django.db.models.functions import Coalesce
+from django.db import connections, models, transaction
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.functional import cached_property
+from django.utils.safestring import mark_safe
 from slugify import slugify
 
 from radiofeed.db.fields import URLField
 from radiofeed.db.search import Searchable
-from radiofeed.sanitizer import strip_html
+from radiofeed.sanitizer import markdown_cached, strip_html
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from radiofeed.episodes.models import Episode
     from radiofeed.users.models import User
 
@@ -83,6 +85,7 @@ class PodcastQuerySet(Searchable, models.QuerySet):
     """Custom QuerySet of Podcast model."""
 
     default_search_fields = ("search_vector",)
+    search_candidates_ordering = ("-pub_date",)
 
     def subscribed(self, user: User) -> Self:
         """Returns podcasts subscribed by user."""
@@ -116,38 +119,16 @@ class PodcastQuerySet(Searchable, models.QuerySet):
         )
 
     def recommended(self, user: User) -> Self:
-        """Returns recommended podcasts for user based on subscriptions. Includes `relevance` annotation."""
-
-        # pick highest matches
-        # we want the sum of the relevance of the recommendations, grouped by recommended
-
-        subscribed = set(user.subscriptions.values_list("podcast", flat=True))
-        recommended = set(user.recommended_podcasts.values_list("pk", flat=True))
-
-        exclude = subscribed | recommended
-
-        scores = (
-            Recommendation.objects.filter(
-                podcast__in=subscribed,
-                recommended=models.OuterRef("pk"),
-            )
-            .exclude(recommended__in=exclude)
-            .values("score")
-            .order_by("-score")
-        )
+        """Returns recommended podcasts for user based on subscriptions. Includes `relevance` annotation.
 
+        Recommendations are precomputed by `UserRecommendation.objects.rebuild()`. Podcasts the
+        user has since subscribed to or already been recommended are excluded.
+        """
         return (
-            self.alias(
-                relevance=Coalesce(
-                    models.Subquery(
-                        scores.values("score")[:1],
-                    ),
-                    0,
-                    output_field=models.DecimalField(),
-                ),
-            )
-            .filter(models.Q(relevance__gt=0))
-            .exclude(pk__in=exclude)
+            self.filter(user_recommendations__user=user)
+            .alias(relevance=models.F("user_recommendations__relevance"))
+            .exclude(pk__in=user.subscriptions.values("podcast"))
+            .exclude(pk__in=user.recommended_podcasts.values("pk"))
         )
 
 
@@ -199,6 +180,16 @@ class Podcast(models.Model):
 
     pub_date = models.DateTimeField(null=True, blank=True)
 
+    # Episode with the latest pub date, set by the feed parser
+    latest_episode = models.ForeignKey(
+        "episodes.Episode",
+        null=True,
+        blank=True,
+        editable=False,
+        on_delete=models.SET_NULL,
+        related_name="+",
+    )
+
     num_episodes = models.PositiveIntegerField(default=0)
 
     parsed = models.DateTimeField(null=True, blank=True)
@@ -235,8 +226,19 @@ class Podcast(models.Model):
     website = URLField(blank=True)
     keywords = models.TextField(blank=True)
     extracted_text = models.TextField(blank=True)
+    extracted_text_hash = models.CharField(max_length=64, blank=True)
     owner = models.TextField(blank=True)
 
+    # Sanitized copies of title, owner and description, stored by the feed parser
+    # so that they are not recomputed on every request
+    title_text = models.TextField(blank=True, editable=False)
+    owner_text = models.TextField(blank=True, editable=False)
+    description_text = models.TextField(blank=True, editable=False)
+    description_html = models.TextField(blank=True, editable=False)
+
+    # Normalized title and owner, matched by autocomplete
+    autocomplete_text = models.TextField(blank=True, editable=False)
+
     promoted = models.BooleanField(default=False)
 
     podcast_type = models.CharField(
@@ -273,6 +275,7 @@ class Podcast(models.Model):
         subscriptions: models.Manager[Subscription]
         recommendations: models.Manager[Recommendation]
         similar: models.Manager[Recommendation]
+        user_recommendations: models.Manager[UserRecommendation]
 
     class Meta:
         indexes: ClassVar[list] = [
@@ -301,6 +304,25 @@ class Podcast(models.Model):
             # Search indexes
             GinIndex(fields=["search_vector"]),
             GinIndex(fields=["owner_search_vector"]),
+            # Autocomplete indexes for prefix and substring matches
+            models.Index(
+                fields=["autocomplete_text"],
+                opclasses=["text_pattern_ops"],
+                condition=models.Q(
+                    private=False,
+                    pub_date__isnull=False,
+                ),
+                name="%(app_label)s_%(class)s_ac_prefix_idx",
+            ),
+            GinIndex(
+                fields=["autocomplete_text"],
+                opclasses=["gin_trgm_ops"],
+                condition=models.Q(
+                    private=False,
+                    pub_date__isnull=False,
+                ),
+                name="%(app_label)s_%(class)s_ac_trgm_idx",
+            ),
         ]
 
     def __str__(self) -> str:
@@ -343,18 +365,25 @@ class Podcast(models.Model):
 
     @cached_property
     def cleaned_title(self) -> str:
-        """Strips HTML from title field."""
-        return strip_html(self.title)
+        """Strips HTML from title field, unless already stored."""
+        return self.title_text or strip_html(self.title)
 
     @cached_property
     def cleaned_description(self) -> str:
-        """Strips HTML from description field."""
-        return strip_html(self.description)
+        """Strips HTML from description field, unless already stored."""
+        return self.description_text or strip_html(self.description)
+
+    @cached_property
+    def rendered_description(self) -> str:
+        """Renders description as sanitized HTML, unless already stored."""
+        if self.description_html:
+            return mark_safe(self.description_html)  # noqa: S308
+        return markdown_cached(self.description)
 
     @cached_property
     def cleaned_owner(self) -> str:
-        """Strips HTML from owner field."""
-        return strip_html(self.owner)
+        """Strips HTML from owner field, unless already stored."""
+        return self.owner_text or strip_html(self.owner)
 
     @cached_property
     def slug(self) -> str:
@@ -363,8 +392,23 @@ class Podcast(models.Model):
 
     @cached_property
     def has_similar_podcasts(self) -> bool:
-        """Returns True if any similar podcasts."""
-        return self.private is False and self.recommendations.exists()
+        """Returns True if any similar podcasts.
+
+        Podcasts with extracted text can be matched against the recommender
+        index for their language, if one has been built, before any
+        recommendations have been generated. The index itself is only loaded
+        when similar podcasts are shown.
+        """
+        # Imported here as the recommender depends on this module
+        from radiofeed.podcasts import recommender  # noqa: PLC0415
+
+        if self.private:
+            return False
+
+        if self.extracted_text and recommender.has_index(self.language):
+            return True
+
+        return self.recommendations.exists()
 
     @cached_property
     def seasons(self) -> list[Season]:
@@ -452,6 +496,45 @@ class RecommendationQuerySet(models.QuerySet):
         """
         return self._raw_delete(self.db)
 
+    def bulk_replace(self, rows: Iterable[tuple[int, int, float]]) -> int:
+        """Atomically replaces all rows in this queryset with new rows.
+
+        New rows of (podcast_id, recommended_id, score) are first written to a
+        temporary staging table with COPY, then swapped in within a single
+        transaction, so readers never see an empty set of recommendations.
+
+        The connection is held by COPY while rows are read, so rows must not be
+        generated by queries on the same connection.
+
+        Returns:
+            number of rows inserted
+        """
+        table = self.model._meta.db_table
+        staging = f"{table}_staging"
+
+        with connections[self.db].cursor() as cursor:
+            try:
+                cursor.execute(
+                    f"CREATE TEMPORARY TABLE {staging} "
+                    "(podcast_id bigint, recommended_id bigint, score numeric)"
+                )
+
+                with cursor.copy(
+                    f"COPY {staging} (podcast_id, recommended_id, score) FROM STDIN"
+                ) as copy:
+                    for row in rows:
+                        copy.write_row(row)
+
+                with transaction.atomic(using=self.db):
+                    self.bulk_delete()
+                    cursor.execute(
+                        f"INSERT INTO {table} (podcast_id, recommended_id, score) "  # noqa: S608
+                        f"SELECT podcast_id, recommended_id, score FROM {staging}"
+                    )
+                    return cursor.rowcount
+            finally:
+                cursor.execute(f"DROP TABLE IF EXISTS {staging}")
+
 
 class Recommendation(models.Model):
     """Recommendation based on similarity between two podcasts."""
@@ -487,3 +570,137 @@ class Recommendation(models.Model):
                 fields=["podcast", "recommended"],
             ),
         ]
+
+
+class UserRecommendationQuerySet(models.QuerySet):
+    """Custom QuerySet for UserRecommendation model."""
+
+    def rebuild(self, limit: int = 12) -> int:
+        """Replaces all user recommendations with the top `limit` podcasts for each user.
+
+        Podcasts are ranked by the highest score of any recommendation from the user's
+        subscriptions, excluding podcasts already subscribed or recommended to the user.
+        Computed in a single set-based query and swapped in within a transaction.
+
+        Returns:
+            number of rows inserted
+        """
+        sql = f"""
+INSERT INTO {self.model._meta.db_table} (user_id, podcast_id, relevance)
+SELECT user_id, podcast_id, relevance FROM (
+    SELECT
+        s.subscriber_id AS user_id,
+        r.recommended_id AS podcast_id,
+        MAX(r.score) AS relevance,
+        ROW_NUMBER() OVER (
+            PARTITION BY s.subscriber_id
+            ORDER BY MAX(r.score) DESC, r.recommended_id
+        ) AS position
+    FROM {Subscription._meta.db_table} s
+    INNER JOIN {Recommendation._meta.db_table} r ON r.podcast_id = s.podcast_id
+    INNER JOIN {Podcast._meta.db_table} p ON p.id = r.recommended_id
+    WHERE p.pub_date IS NOT NULL
+    AND r.score > 0
+    AND NOT EXISTS (
+        SELECT 1 FROM {Subscription._meta.db_table} s2
+        WHERE s2.subscriber_id = s.subscriber_id AND s2.podcast_id = r.recommended_id
+    )
+    AND NOT EXISTS (
+        SELECT 1 FROM {Podcast.recipients.through._meta.db_table} pr
+        WHERE pr.user_id = s.subscriber_id AND pr.podcast_id = r.recommended_id
+    )
+    GROUP BY s.subscriber_id, r.recommended_id
+) AS ranked
+WHERE position <= %s"""  # noqa: S608
+
+        with (
+            transaction.atomic(using=self.db),
+            connections[self.db].cursor() as cursor,
+        ):
+            self._raw_delete(self.db)
+            cursor.execute(sql, [limit])
+            return cursor.rowcount
+
+
+class UserRecommendation(models.Model):
+    """Podcast recommended to a user based on their subscriptions."""
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="podcast_recommendations",
+    )
+
+    podcast = models.ForeignKey(
+        "podcasts.Podcast",
+        on_delete=models.CASCADE,
+        related_name="user_recommendations",
+    )
+
+    relevance = models.DecimalField(
+        decimal_places=10,
+        max_digits=100,
+    )
+
+    objects: UserRecommendationQuerySet = UserRecommendationQuerySet.as_manager()  # type: ignore[assignment]
+
+    class Meta:
+        indexes: ClassVar[list] = [
+            models.Index(
+                fields=["user", "-relevance"],
+                name="podcasts_userrec_user_idx",
+            ),
+        ]
+        constraints: ClassVar[list] = [
+            models.UniqueConstraint(
+                name="unique_%(app_label)s_%(class)s_user_podcast",
+                fields=["user", "podcast"],
+            ),
+        ]
+
+
+class RecommenderIndex(models.Model):
+    """Persisted recommender TF-IDF index for a language.
+
+    Indexes are built by the recommendations job and stored in the database, so
+    that they are available to all web processes. Each process keeps a local
+    memory-mapped copy of the current index.
+    """
+
+    language = models.CharField(max_length=2, unique=True)
+    version = models.PositiveSmallIntegerField()
+    updated = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        """Returns language of the index."""
+        return self.language
+
+
+class RecommenderIndexChunk(models.Model):
+    """Chunk of an .npy file of a recommender index.
+
+    Files are split into chunks so that they can be copied to and from the
+    database without holding a whole file in memory.
+    """
+
+    index = models.ForeignKey(
+        "podcasts.RecommenderIndex",
+        on_delete=models.CASCADE,
+        related_name="chunks",
+    )
+
+    name = models.CharField(max_length=30)
+    position = models.PositiveIntegerField()
+    data = models.BinaryField()
+
+    class Meta:
+        constraints: ClassVar[list] = [
+            models.UniqueConstraint(
+                name="unique_%(app_label)s_%(class)s",
+                fields=["index", "name", "position"],
+            ),
+        ]
+
+    def __str__(self) -> str:
+        """Returns file name and position of the chunk."""
+        return f"{self.name}:{self.position}"
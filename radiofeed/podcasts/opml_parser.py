@@ -1,16 +1,25 @@
+import contextlib
 import functools
 from typing import TYPE_CHECKING
 
+import lxml.etree
+
 from radiofeed.podcasts.xml_parser import XPathParser
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator
 
 
 def parse_opml(content: bytes) -> Iterator[str]:
     """Parse OPML document and return podcast URLs"""
 
-    return _opml_parser().parse(content)
+    return iterparse_opml((content,))
+
+
+def iterparse_opml(chunks: Iterable[bytes]) -> Iterator[str]:
+    """Parse OPML document in chunks and return podcast URLs as they are found."""
+
+    return _opml_parser().parse(chunks)
 
 
 class _OpmlParser:
@@ -19,12 +28,11 @@ class _OpmlParser:
     def __init__(self) -> None:
         self._parser = XPathParser()
 
-    def parse(self, content: bytes) -> Iterator[str]:
+    def parse(self, chunks: Iterable[bytes]) -> Iterator[str]:
         """Parse OPML content, returning RSS or Atom URLs."""
-        yield from self._parser.itervalues(
-            self._parser.find(content, "opml", "body"),
-            ".//outline/@xmlUrl",
-        )
+        with contextlib.suppress(lxml.etree.XMLSyntaxError):
+            for element in self._parser.iterparse_chunks(chunks, "outline", "."):
+                yield from self._parser.itervalues(element, "@xmlUrl")
 
 
 @functools.cache
@@ -0,0 +1,54 @@
+import itertools
+from typing import TYPE_CHECKING, Final
+
+from django.utils.html import escape
+from django.utils.text import Truncator
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from radiofeed.podcasts.models import Podcast
+
+_BATCH_SIZE: Final = 500
+
+_DESCRIPTION_WORDS: Final = 60
+
+
+def write_opml(podcasts: Iterable[Podcast], title: str) -> Iterator[str]:
+    """Write OPML document containing podcast feeds.
+
+    The document is written incrementally, in batches of outlines, so it can be
+    streamed as podcasts are fetched.
+    """
+    yield (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<opml version="1.0">\n'
+        f"<head><title>{escape(title)}</title></head>\n"
+        "<body>\n"
+        '<outline text="Podcasts" title="Podcasts">\n'
+    )
+
+    for batch in itertools.batched(podcasts, _BATCH_SIZE, strict=False):
+        yield "".join(_outline(podcast) for podcast in batch)
+
+    yield "</outline>\n</body>\n</opml>\n"
+
+
+def _outline(podcast: Podcast) -> str:
+    attrs = {
+        "type": "rss",
+        "title": podcast.title,
+        "text": Truncator(podcast.cleaned_description).words(
+            _DESCRIPTION_WORDS, truncate=" …"
+        ),
+        "xmlUrl": podcast.rss,
+    }
+
+    if podcast.website:
+        attrs["htmlUrl"] = podcast.website
+
+    return (
+        "<outline "
+        + " ".join(f'{name}="{escape(value)}"' for name, value in attrs.items())
+        + " />\n"
+    )
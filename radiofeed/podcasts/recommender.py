@@ -1,31 +1,64 @@
+import array
 import collections
+import contextlib
+import dataclasses
+import functools
 import itertools
 import math
+import pathlib
+import shutil
 import statistics
+import tempfile
+import time
 from datetime import timedelta
-from typing import TYPE_CHECKING, Final
+from typing import TYPE_CHECKING, Final, Self
 
 import numpy as np
+from django.conf import settings
 from django.contrib.postgres.aggregates import ArrayAgg
+from django.db import transaction
 from django.db.models import Q
 from django.utils import timezone
+from scipy import sparse
 from sklearn.feature_extraction.text import (
     HashingVectorizer,
     TfidfTransformer,
 )
 from sklearn.neighbors import NearestNeighbors
+from sklearn.preprocessing import normalize
 
-from radiofeed.podcasts.models import Podcast, Recommendation
+from radiofeed.podcasts.models import (
+    Podcast,
+    Recommendation,
+    RecommenderIndex,
+    RecommenderIndexChunk,
+)
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Iterable, Iterator
 
     from django.db.models.query import QuerySet
 
 _default_timeframe: Final = timedelta(days=90)
 
+# Bump whenever the hasher or transformer settings or the storage format change,
+# so that indexes built with incompatible features are never loaded.
+_index_version: Final = 2
+
+# Max size in bytes of each chunk of an index file stored in the database
+_index_chunk_size: Final = 4 * 1024 * 1024
+
+_chunk_size: Final = 1000
+
+# Max number of exact similarities held in memory when evaluating recall
+_max_exact_similarities: Final = 10_000_000
+
 _transformer = TfidfTransformer()
-_hasher = HashingVectorizer(n_features=30000, alternate_sign=False)
+_hasher = HashingVectorizer(
+    n_features=30000,
+    alternate_sign=False,
+    dtype=np.float32,
+)
 
 
 def recommend(
@@ -33,19 +66,475 @@ def recommend(
     *,
     timeframe: timedelta | None = None,
     num_matches: int = 12,
-) -> None:
+    approximate: ApproximateNeighbors | None = None,
+) -> dict[str, float]:
     """Generates Recommendation instances based on podcast similarity, grouped by
-    language and category. Existing recommendations are first deleted."""
+    language and category. Existing recommendations are replaced atomically.
+
+    If `approximate` is provided, categories with at least `approximate.min_rows`
+    podcasts use approximate rather than exact nearest neighbours.
 
-    Recommendation.objects.filter(podcast__language__iexact=language).bulk_delete()
+    Returns elapsed seconds for each stage of the build.
+    """
 
     recommender = _Recommender(
         language=language,
         timeframe=timeframe or _default_timeframe,
         num_matches=num_matches,
+        approximate=approximate,
+    )
+
+    # Rows are streamed into the database as they are scored, so the write stage
+    # is whatever time the replace took beyond the recommender's own stages.
+    start = time.perf_counter()
+
+    Recommendation.objects.filter(podcast__language__iexact=language).bulk_replace(
+        recommender.recommend()
+    )
+
+    elapsed = time.perf_counter() - start
+
+    return dict(recommender.timings) | {
+        "write": elapsed - sum(recommender.timings.values())
+    }
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True)
+class Index:
+    """TF-IDF model for a single language.
+
+    Rows of `matrix` are L2-normalized TF-IDF vectors, aligned with `podcast_ids`.
+    """
+
+    matrix: sparse.csr_matrix
+    idf: np.ndarray
+    podcast_ids: np.ndarray
+
+    @classmethod
+    def load(cls, path: pathlib.Path) -> Self:
+        """Loads index from directory. Arrays are memory-mapped read-only."""
+
+        def _load(name: str) -> np.ndarray:
+            return np.load(path / f"{name}.npy", mmap_mode="r")
+
+        return cls._from_arrays(_load)
+
+    def save(self, path: pathlib.Path) -> None:
+        """Saves index to directory as .npy files.
+
+        Files are written to a temporary directory first and then swapped in,
+        so readers never load a partially written index.
+        """
+        tmp_path = _make_tmp_dir(path)
+
+        for name, values in self._arrays():
+            np.save(tmp_path / f"{name}.npy", values)
+
+        _replace_dir(tmp_path, path)
+
+    @classmethod
+    def _from_arrays(cls, load: Callable[[str], np.ndarray]) -> Self:
+        idf = load("idf")
+        podcast_ids = load("podcast_ids")
+
+        return cls(
+            matrix=sparse.csr_matrix(
+                (load("data"), load("indices"), load("indptr")),
+                shape=(len(podcast_ids), len(idf)),
+                copy=False,
+            ),
+            idf=idf,
+            podcast_ids=podcast_ids,
+        )
+
+    def _arrays(self) -> Iterator[tuple[str, np.ndarray]]:
+        yield "data", self.matrix.data
+        yield "indices", self.matrix.indices
+        yield "indptr", self.matrix.indptr
+        yield "idf", self.idf
+        yield "podcast_ids", self.podcast_ids
+
+    def query(self, text: str, *, limit: int) -> list[tuple[int, float]]:
+        """Returns up to `limit` (podcast_id, similarity) pairs most similar to text.
+
+        Text is hashed and weighted with the same IDF as the indexed corpus.
+        """
+        vector = normalize(
+            sparse.csr_matrix(_hasher.transform([text]).multiply(self.idf))
+        )
+        similarities = (self.matrix @ vector.T).toarray().ravel()
+
+        limit = min(limit, similarities.size)
+        top = np.argpartition(-similarities, limit - 1)[:limit]
+        top = top[np.argsort(-similarities[top], kind="stable")]
+
+        return [
+            (int(self.podcast_ids[row]), float(similarities[row]))
+            for row in top
+            if similarities[row] > 0
+        ]
+
+
+def get_index_path(language: str) -> pathlib.Path:
+    """Returns directory of local copies of the index for a language."""
+    return settings.RECOMMENDER_INDEX_DIR / f"v{_index_version}" / language
+
+
+def save_index(language: str, index: Index) -> None:
+    """Saves index for a language to the database, replacing any existing index.
+
+    The index is saved to a local directory first, and each file is then copied
+    to the database one chunk at a time.
+    """
+    path = get_index_path(language)
+    path.mkdir(parents=True, exist_ok=True)
+
+    with tempfile.TemporaryDirectory(dir=path, prefix=".") as tmp_dir:
+        index_path = pathlib.Path(tmp_dir) / "index"
+        index.save(index_path)
+
+        with transaction.atomic():
+            RecommenderIndex.objects.filter(language=language).delete()
+
+            recommender_index = RecommenderIndex.objects.create(
+                language=language,
+                version=_index_version,
+            )
+
+            for file in sorted(index_path.iterdir()):
+                with file.open("rb") as fp:
+                    for position, data in enumerate(
+                        iter(functools.partial(fp.read, _index_chunk_size), b"")
+                    ):
+                        RecommenderIndexChunk.objects.create(
+                            index=recommender_index,
+                            name=file.stem,
+                            position=position,
+                            data=data,
+                        )
+
+
+def delete_index(language: str) -> None:
+    """Deletes index for a language, including any local copies."""
+    RecommenderIndex.objects.filter(language=language).delete()
+    shutil.rmtree(get_index_path(language), ignore_errors=True)
+
+
+def load_index(language: str) -> Index | None:
+    """Loads persisted index for a language, if any.
+
+    The index is copied from the database to a local directory, unless already
+    copied, and memory-mapped from there.
+    """
+    if index_id := _get_indexes(language).values_list("pk", flat=True).first():
+        return _load_index(language, index_id)
+    return None
+
+
+def has_index(language: str) -> bool:
+    """Returns True if an index has been built for a language.
+
+    Only checks the database, without loading the index.
+    """
+    return _get_indexes(language).exists()
+
+
+def get_index(language: str) -> Index | None:
+    """Returns persisted index for a language, cached per process.
+
+    As `load_index`, but the cache is keyed on the database row of the index,
+    which is replaced on each rebuild, so a rebuilt index is picked up on the
+    next call.
+    """
+    if index_id := _get_indexes(language).values_list("pk", flat=True).first():
+        return _get_cached_index(language, index_id)
+    return None
+
+
+def find_similar(
+    language: str,
+    text: str,
+    *,
+    limit: int = 12,
+) -> list[tuple[int, float]]:
+    """Returns (podcast_id, similarity) pairs most similar to text, best first.
+
+    Text should already be tokenized, e.g. `Podcast.extracted_text`. Use
+    `tokenizer.tokenize` to prepare any other text.
+    """
+    if text and (index := get_index(language)):
+        return index.query(text, limit=limit)
+    return []
+
+
+@functools.lru_cache(maxsize=8)
+def _get_cached_index(language: str, index_id: int) -> Index | None:
+    return _load_index(language, index_id)
+
+
+def _load_index(language: str, index_id: int) -> Index | None:
+    path = get_index_path(language) / str(index_id)
+
+    if not path.exists():
+        if not _download_index(index_id, path):
+            return None
+
+        # Remove copies of earlier builds. Processes still using them keep
+        # their memory-mapped files until closed.
+        for other in path.parent.iterdir():
+            if other != path and not other.name.startswith("."):
+                shutil.rmtree(other, ignore_errors=True)
+
+    return Index.load(path)
+
+
+def _download_index(index_id: int, path: pathlib.Path) -> bool:
+    # Chunks are fetched one query at a time, so that only a single chunk is
+    # held in memory however the rows would otherwise be fetched by the cursor.
+    # Returns False if the index has been deleted since it was looked up.
+    chunks = list(
+        RecommenderIndexChunk.objects.filter(index=index_id)
+        .order_by("name", "position")
+        .values_list("pk", "name")
     )
 
-    Recommendation.objects.bulk_create(recommender.recommend())
+    if not chunks:
+        return False
+
+    tmp_path = _make_tmp_dir(path)
+
+    try:
+        for chunk_id, name in chunks:
+            data = RecommenderIndexChunk.objects.values_list("data", flat=True).get(
+                pk=chunk_id
+            )
+            with (tmp_path / f"{name}.npy").open("ab") as fp:
+                fp.write(data)
+    except RecommenderIndexChunk.DoesNotExist:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        return False
+    except BaseException:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        raise
+
+    _replace_dir(tmp_path, path)
+    return True
+
+
+def _make_tmp_dir(path: pathlib.Path) -> pathlib.Path:
+    # Hidden temporary directory alongside path, so that it can be renamed into place
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return pathlib.Path(tempfile.mkdtemp(dir=path.parent, prefix=f".{path.name}."))
+
+
+def _replace_dir(tmp_path: pathlib.Path, path: pathlib.Path) -> None:
+    # Swap tmp_path into place, so readers never load a partially written directory
+    old_path = _make_tmp_dir(path)
+
+    with contextlib.suppress(FileNotFoundError):
+        path.rename(old_path / path.name)
+
+    try:
+        tmp_path.rename(path)
+    except OSError:
+        # Another process has written the directory in the meantime
+        shutil.rmtree(tmp_path, ignore_errors=True)
+
+    shutil.rmtree(old_path, ignore_errors=True)
+
+
+def _get_indexes(language: str) -> QuerySet[RecommenderIndex]:
+    return RecommenderIndex.objects.filter(language=language, version=_index_version)
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True)
+class ApproximateNeighbors:
+    """Approximate cosine nearest neighbours using random-projection LSH.
+
+    Each of `num_tables` hash tables buckets rows by the signs of their projections
+    onto `num_bits` random hyperplanes, and exact similarities are only computed
+    between rows sharing a bucket. More tables raise recall; more bits make buckets
+    smaller and faster. Use `evaluate_recall` to pick parameters for a corpus.
+    """
+
+    num_bits: int = 12
+    num_tables: int = 4
+    min_rows: int = 10000
+    seed: int = 0
+
+    def kneighbors(
+        self, matrix: sparse.csr_matrix, n_neighbors: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Returns (distances, indices) of nearest rows for every row of L2-normalized matrix.
+
+        Same layout as `NearestNeighbors.kneighbors`, with each row usually its own first
+        neighbour. Missing neighbours have index -1 and distance 1.
+        """
+        rng = np.random.default_rng(self.seed)
+        powers = 1 << np.arange(self.num_bits, dtype=np.int64)
+
+        neighbors = np.full((matrix.shape[0], n_neighbors), -1, dtype=np.int64)
+        similarities = np.zeros((matrix.shape[0], n_neighbors), dtype=np.float32)
+
+        for _ in range(self.num_tables):
+            planes = rng.standard_normal(
+                (matrix.shape[1], self.num_bits),
+                dtype=np.float32,
+            )
+            keys = (np.asarray(matrix @ planes) > 0) @ powers
+
+            order = np.argsort(keys, kind="stable")
+            _, starts = np.unique(keys[order], return_index=True)
+
+            for bucket in np.split(order, starts[1:]):
+                rows = matrix[bucket]
+                self._merge(
+                    neighbors,
+                    similarities,
+                    bucket,
+                    (rows @ rows.T).toarray(),
+                )
+
+        return 1 - similarities, neighbors
+
+    def _merge(
+        self,
+        neighbors: np.ndarray,
+        similarities: np.ndarray,
+        bucket: np.ndarray,
+        block: np.ndarray,
+    ) -> None:
+        # Merge bucket similarities into the running top-k of each row in the bucket
+        candidates = np.concatenate(
+            (neighbors[bucket], np.broadcast_to(bucket, block.shape)), axis=1
+        )
+        scores = np.concatenate((similarities[bucket], block), axis=1)
+
+        # Drop neighbours already found in a previous table
+        order = np.argsort(candidates, axis=1, kind="stable")
+        candidates = np.take_along_axis(candidates, order, axis=1)
+        scores = np.take_along_axis(scores, order, axis=1)
+        scores[:, 1:][candidates[:, 1:] == candidates[:, :-1]] = -1
+
+        top = np.argsort(-scores, axis=1, kind="stable")[:, : neighbors.shape[1]]
+        neighbors[bucket] = np.take_along_axis(candidates, top, axis=1)
+        similarities[bucket] = np.take_along_axis(scores, top, axis=1)
+
+
+def get_category_partitions(language: str, index: Index) -> list[np.ndarray]:
+    """Returns rows of the index grouped by category, as partitioned by `recommend`."""
+    rows = {
+        podcast_id: row for row, podcast_id in enumerate(index.podcast_ids.tolist())
+    }
+
+    partitions: dict[int, list[int]] = collections.defaultdict(list)
+
+    for podcast_id, category_id in (
+        Podcast.categories.through.objects.filter(
+            podcast__language__iexact=language,
+        )
+        .values_list("podcast_id", "category_id")
+        .iterator(chunk_size=_chunk_size)
+    ):
+        if (row := rows.get(podcast_id)) is not None:
+            partitions[category_id].append(row)
+
+    return [
+        np.array(partition, dtype=np.int64)
+        for _, partition in sorted(partitions.items())
+    ]
+
+
+def evaluate_recall(  # noqa: PLR0913
+    index: Index,
+    approximate: ApproximateNeighbors,
+    *,
+    partitions: Iterable[np.ndarray] | None = None,
+    num_matches: int = 12,
+    sample_size: int = 1000,
+    seed: int = 0,
+) -> float:
+    """Returns mean recall of approximate against exact nearest neighbours.
+
+    As in `recommend`, neighbours are found within each partition of rows, e.g.
+    from `get_category_partitions`, and only partitions of at least
+    `approximate.min_rows` rows use approximate neighbours. Other partitions
+    have full recall. If no partitions are given, the whole index is used.
+
+    Recall of each approximate partition is measured over a random sample of up
+    to `sample_size` rows, against each row's exact top `num_matches` neighbours
+    with non-zero similarity. The result is the mean over partitions, weighted
+    by their size.
+    """
+    if partitions is None:
+        partitions = [np.arange(index.matrix.shape[0])]
+
+    rng = np.random.default_rng(seed)
+
+    total_rows = 0
+    total_recall = 0.0
+
+    for rows in partitions:
+        n_neighbors = min(num_matches, len(rows))
+
+        # Partitions without neighbours are skipped by `recommend`
+        if n_neighbors <= 1:
+            continue
+
+        total_rows += len(rows)
+
+        if len(rows) < approximate.min_rows:
+            total_recall += len(rows)
+        else:
+            total_recall += len(rows) * _evaluate_partition_recall(
+                index.matrix[rows],
+                approximate,
+                n_neighbors=n_neighbors,
+                sample_size=sample_size,
+                rng=rng,
+            )
+
+    return total_recall / total_rows if total_rows else 1.0
+
+
+def _evaluate_partition_recall(
+    matrix: sparse.csr_matrix,
+    approximate: ApproximateNeighbors,
+    *,
+    n_neighbors: int,
+    sample_size: int,
+    rng: np.random.Generator,
+) -> float:
+    num_rows = matrix.shape[0]
+
+    _, approximate_neighbors = approximate.kneighbors(matrix, n_neighbors)
+
+    sample = rng.choice(num_rows, size=min(sample_size, num_rows), replace=False)
+
+    # Exact similarities are computed for a chunk of sampled rows at a time, so
+    # that the dense array of similarities has a bounded size.
+    chunk_size = max(1, _max_exact_similarities // num_rows)
+
+    recalls = []
+
+    for start in range(0, len(sample), chunk_size):
+        chunk = sample[start : start + chunk_size]
+
+        similarities = (matrix[chunk] @ matrix.T).toarray()
+        exact_neighbors = np.argpartition(-similarities, n_neighbors - 1, axis=1)[
+            :, :n_neighbors
+        ]
+
+        for position, row in enumerate(chunk.tolist()):
+            if expected := {
+                neighbor
+                for neighbor in exact_neighbors[position].tolist()
+                if similarities[position, neighbor] > 0
+            }:
+                found = expected & set(approximate_neighbors[row].tolist())
+                recalls.append(len(found) / len(expected))
+
+    return statistics.mean(recalls) if recalls else 1.0
 
 
 class _Recommender:
@@ -55,57 +544,127 @@ class _Recommender:
         language: str,
         timeframe: timedelta,
         num_matches: int,
+        approximate: ApproximateNeighbors | None = None,
     ) -> None:
         self._language = language
         self._timeframe = timeframe
         self._num_matches = num_matches
+        self._approximate = approximate
+
+        self.timings: dict[str, float] = collections.defaultdict(float)
+
+    def recommend(self) -> Iterator[tuple[int, int, float]]:
+        """Build (podcast_id, recommended_id, score) rows based on podcast similarity, grouped by category.
 
-    def recommend(self) -> Iterator[Recommendation]:
-        """Build Recommendation instances based on podcast similarity, grouped by category."""
+        All database queries are run before rows are returned, so the rows can be
+        consumed while writing to the same connection e.g. with COPY.
+        """
 
         # Build the corpus and category mappings
         self._build_dataset()
 
         # If there are no categories, there is nothing to do
-        if not self._categories:
-            return
+        if self._counts is None or not self._category_ids.size:
+            delete_index(self._language)
+            return iter(())
+
+        # Transform the hashed corpus into TF-IDF matrix and persist for reuse
+        with self._timer("tfidf"):
+            self._index = Index(
+                matrix=_transformer.fit_transform(self._counts),
+                idf=_transformer.idf_,
+                podcast_ids=self._podcast_ids,
+            )
+
+        with self._timer("index"):
+            save_index(self._language, self._index)
 
         # Find similarities and group them by (podcast_id, recommended_id)
         matches = collections.defaultdict(list)
 
-        for (
-            podcast_id,
-            recommended_id,
-            similarity,
-            category_id,
-        ) in self._find_similarities():
-            matches[(podcast_id, recommended_id)].append((similarity, category_id))
-
-        # Create Recommendation instances with calculated scores
-        for (podcast_id, recommended_id), values in matches.items():
-            yield Recommendation(
-                podcast_id=podcast_id,
-                recommended_id=recommended_id,
-                score=self._calculate_score(values),
-            )
+        for row_ids, neighbor_ids, sims, category_id in self._find_similarities():
+            with self._timer("scoring"):
+                for podcast_id, recommended_id, similarity in zip(
+                    row_ids.tolist(),
+                    neighbor_ids.tolist(),
+                    sims.tolist(),
+                    strict=True,
+                ):
+                    matches[(podcast_id, recommended_id)].append(
+                        (similarity, category_id)
+                    )
+
+        return self._score(matches)
+
+    def _score(
+        self, matches: dict[tuple[int, int], list[tuple[float, int]]]
+    ) -> Iterator[tuple[int, int, float]]:
+        # Create recommendation rows with calculated scores. Rows are scored in
+        # batches so that time spent by the consumer is not counted as scoring.
+        for batch in itertools.batched(matches.items(), _chunk_size, strict=False):
+            with self._timer("scoring"):
+                rows = [
+                    (podcast_id, recommended_id, self._calculate_score(values))
+                    for (podcast_id, recommended_id), values in batch
+                ]
+            yield from rows
+
+    @contextlib.contextmanager
+    def _timer(self, stage: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[stage] += time.perf_counter() - start
 
     def _build_dataset(self) -> None:
-        # Build podcast index and corpus
-        self._podcast_index: dict[int, int] = {}
-        self._corpus: list[str] = []
+        # Stream the corpus in chunks straight into the hasher, so that only
+        # one chunk of text is held in memory at a time. Category membership
+        # is stored as parallel integer arrays of (row, category_id).
+        podcast_ids = array.array("q")
+        category_rows = array.array("q")
+        category_ids = array.array("q")
 
-        self._categories = collections.defaultdict(set)
-        self._category_sizes = collections.Counter()
+        chunks: list[sparse.csr_matrix] = []
 
-        for counter, (podcast_id, text, category_ids) in enumerate(
-            self._get_queryset()
-        ):
-            self._podcast_index[podcast_id] = counter
-            self._corpus.append(text)
+        start = time.perf_counter()
 
-            for category_id in category_ids:
-                self._categories[category_id].add(podcast_id)
-                self._category_sizes[category_id] += 1
+        for batch in itertools.batched(
+            self._get_queryset().iterator(chunk_size=_chunk_size),
+            _chunk_size,
+            strict=False,
+        ):
+            texts: list[str] = []
+            for podcast_id, text, podcast_category_ids in batch:
+                category_rows.extend(
+                    itertools.repeat(len(podcast_ids), len(podcast_category_ids))
+                )
+                category_ids.extend(podcast_category_ids)
+                podcast_ids.append(podcast_id)
+                texts.append(text)
+            with self._timer("hashing"):
+                chunks.append(_hasher.transform(texts))
+
+        # Time spent fetching and unpacking rows from the database
+        self.timings["load"] += time.perf_counter() - start - self.timings["hashing"]
+
+        self._podcast_ids = np.array(podcast_ids, dtype=np.int64)
+        self._counts = sparse.vstack(chunks, format="csr") if chunks else None
+
+        # Group rows by category: sort once, then split into per-category slices
+        rows = np.array(category_rows, dtype=np.int64)
+        categories = np.array(category_ids, dtype=np.int64)
+
+        order = np.argsort(categories, kind="stable")
+        self._category_ids, starts, sizes = np.unique(
+            categories[order],
+            return_index=True,
+            return_counts=True,
+        )
+        self._category_rows = np.split(rows[order], starts[1:])
+        self._category_sizes = dict(
+            zip(self._category_ids.tolist(), sizes.tolist(), strict=True)
+        )
 
     def _get_queryset(self) -> QuerySet:
         # Retrieve podcasts with their categories for the specified language and timeframe
@@ -128,57 +687,55 @@ class _Recommender:
             .values_list("id", "extracted_text", "category_ids")
         )
 
-    def _find_similarities(self) -> Iterator[tuple[int, int, float, int]]:
-        # Transform the corpus into TF-IDF matrix
-        tfidf_matrix = _transformer.fit_transform(_hasher.transform(self._corpus))
-        podcast_ids = list(self._podcast_index.keys())
-
-        for category_id, category_podcast_ids in self._categories.items():
-            indices = [
-                self._podcast_index[pid]
-                for pid in category_podcast_ids
-                if pid in self._podcast_index
-            ]
-
-            subset_ids = np.array([podcast_ids[idx] for idx in indices])
+    def _find_similarities(
+        self,
+    ) -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray, int]]:
+        # Yields (podcast_ids, recommended_ids, similarities, category_id) per category
+        tfidf_matrix = self._index.matrix
+
+        for category_id, indices in zip(
+            self._category_ids.tolist(),
+            self._category_rows,
+            strict=True,
+        ):
+            subset_ids = self._podcast_ids[indices]
             n_neighbors = min(self._num_matches, len(subset_ids))
 
             if n_neighbors <= 1:
                 continue
 
-            tfidf_subset = tfidf_matrix[indices]
-
-            nn = NearestNeighbors(
-                n_neighbors=n_neighbors,
-                metric="cosine",
-                algorithm="brute",
-            ).fit(tfidf_subset)
-
-            distances, neighbors = nn.kneighbors(tfidf_subset)
-
-            similarities = 1 - distances[:, 1:]
-            filtered_neighbors = neighbors[:, 1:]
-
-            mask = similarities > 0
-            row_idxs, col_idxs = np.where(mask)
-
-            row_ids = subset_ids[row_idxs]
-            neighbor_ids = subset_ids[filtered_neighbors[row_idxs, col_idxs]]
-            sims = similarities[row_idxs, col_idxs]
-
-            # remove zero similarity and self-references
-            mask = (row_ids != neighbor_ids) & (sims > 0)
-            row_ids = row_ids[mask]
-            neighbor_ids = neighbor_ids[mask]
-            sims = sims[mask]
-
-            yield from zip(
-                row_ids,
-                neighbor_ids,
-                sims,
-                itertools.repeat(category_id, len(row_ids)),
-                strict=True,
-            )
+            with self._timer("knn"):
+                tfidf_subset = tfidf_matrix[indices]
+
+                if self._approximate and len(indices) >= self._approximate.min_rows:
+                    distances, neighbors = self._approximate.kneighbors(
+                        tfidf_subset, n_neighbors
+                    )
+                else:
+                    distances, neighbors = (
+                        NearestNeighbors(
+                            n_neighbors=n_neighbors,
+                            metric="cosine",
+                            algorithm="brute",
+                        )
+                        .fit(tfidf_subset)
+                        .kneighbors(tfidf_subset)
+                    )
+
+                similarities = 1 - distances[:, 1:]
+                filtered_neighbors = neighbors[:, 1:]
+
+                mask = similarities > 0
+                row_idxs, col_idxs = np.where(mask)
+
+                row_ids = subset_ids[row_idxs]
+                neighbor_ids = subset_ids[filtered_neighbors[row_idxs, col_idxs]]
+                sims = similarities[row_idxs, col_idxs]
+
+                # remove zero similarity and self-references
+                mask = (row_ids != neighbor_ids) & (sims > 0)
+
+            yield row_ids[mask], neighbor_ids[mask], sims[mask], category_id
 
     def _calculate_score(self, values: list[tuple[float, int]]) -> float:
         # Calculate weighted score based on similarities and category sizes
@@ -0,0 +1,40 @@
+import time
+
+from django.core.cache import cache
+
+from radiofeed.podcasts.models import Subscription
+
+
+def get_subscriptions_version(user_id: int) -> int:
+    """Returns version of cached fragments rendered from a user's subscriptions.
+
+    Versions are used to vary the keys of cached fragments, e.g. the user's
+    subscribed podcasts or latest episodes, so that the fragments are
+    invalidated without deleting every cached page.
+    """
+    # Versions start from current time rather than zero, so fragments cached
+    # before a version is evicted are never reused.
+    return cache.get_or_set(
+        _get_version_cache_key(user_id),
+        time.time_ns,
+        timeout=None,
+    )
+
+
+def bump_subscriptions_version(*user_ids: int) -> None:
+    """Invalidates cached fragments of the users' subscriptions."""
+    if user_ids:
+        cache.delete_many([_get_version_cache_key(user_id) for user_id in user_ids])
+
+
+def bump_subscribers_version(podcast_id: int) -> None:
+    """Invalidates cached fragments of all subscribers to a podcast."""
+    bump_subscriptions_version(
+        *Subscription.objects.filter(podcast_id=podcast_id).values_list(
+            "subscriber_id", flat=True
+        )
+    )
+
+
+def _get_version_cache_key(user_id: int) -> str:
+    return f"subscriptions:version:{user_id}"
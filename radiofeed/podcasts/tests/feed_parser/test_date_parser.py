@@ -1,10 +1,74 @@
 import datetime
 from zoneinfo import ZoneInfo
 
-from radiofeed.podcasts.feed_parser.date_parser import parse_date
+import pytest
+from dateutil import parser as date_parser
+from django.utils.timezone import is_aware, make_aware
+
+from radiofeed.podcasts.feed_parser.date_parser import (
+    _parse_date_str,
+    _parse_iso_8601,
+    _parse_rfc_822,
+    _tz_infos,
+    parse_date,
+)
 
 UTC = ZoneInfo(key="UTC")
 
+# Date strings as found in real feeds, including quirks handled by the fallback
+_CORPUS = [
+    "Fri, 19 Jun 2020 16:58:03 +0000",
+    "Fri, 19 Jun 2020 16:58:03 GMT",
+    "Fri, 19 Jun 2020 16:58:03 UTC",
+    "Fri, 19 Jun 2020 16:58:03",
+    "Fri, 19 Jun 2020 16:58",
+    " Fri, 19 Jun 2020 16:58:03 +0000 ",
+    "19 Jun 2020 16:58:03 +0100",
+    "Fri, 19 June 2020 16:58:03 -0700",
+    "Friday, 19 June 2020 16:58:03 EST",
+    "Fri, 5 Jun 2020 6:08:03 PDT",
+    "Mon, 02 Sep 2019 09:00:00 +0530",
+    "Mon, 02 Sept 2019 09:00:00 +0530",
+    "Tue, 10 Jun 2003 04:00:00 Z",
+    "Thu, 31 Dec 2020 23:59:59 CET",
+    "Mon, 01 Jan 2001 00:00:00+0000",
+    "Mon,01 Jan 2001 00:00:00 +0000",
+    "Mon, 01 Jan 01 00:00:00 +0000",
+    "Mon, 01 Jan 2001 00:00:00 GMT+2",
+    "Fri, 19 Jun 2020 16:58:03 M",
+    "Fri, 19 Jun 2020 16:58:03 A",
+    "Fri, 19 Jun 0001 16:58:03 +0000",
+    "Fri, 19 Jun 2020 04:58:03 PM +0000",
+    "Fri, 19 Jun 2020 16:58:03 +0000 (UTC)",
+    "Fri Jun 19 16:58:03 2020",
+    "Sat, 29 Feb 2020 12:00:00 +0000",
+    "Sat, 30 Feb 2020 12:00:00 +0000",
+    "Fri, 19 Foo 2020 16:58:03 +0000",
+    "Xyz, 19 Jun 2020 16:58:03 +0000",
+    "Fri, 19 Jun 2020 24:00:00 +0000",
+    "2020-06-19T16:58:03Z",
+    "2020-06-19T16:58:03+01:00",
+    "2020-06-19T16:58:03+0100",
+    "2020-06-19T16:58:03.123456-05:00",
+    "2020-06-19T16:58:03.1234567Z",
+    "2020-06-19T16:58",
+    "2020-06-19 16:58:03",
+    "2020-06-19",
+    "2020-13-19T16:58:03Z",
+    "20200619T165803Z",
+    "June 19, 2020",
+    "06/19/2020 4:58 PM",
+    "not a date",
+]
+
+
+def _parse_dateutil(value):
+    try:
+        dt = date_parser.parse(value, tzinfos=_tz_infos())
+    except date_parser.ParserError:
+        return None
+    return dt if is_aware(dt) else make_aware(dt)
+
 
 class TestParseDate:
     def test_empty_str(self):
@@ -42,3 +106,97 @@ class TestParseDate:
 
     def test_invalid_str(self):
         assert parse_date("Fri, 33 June 2020 16:58:03 +0000") is None
+
+    @pytest.mark.parametrize("value", _CORPUS)
+    def test_matches_dateutil(self, value):
+        _parse_date_str.cache_clear()
+        dt = parse_date(value)
+        expected = _parse_dateutil(value)
+        assert dt == expected
+        if dt is not None:
+            assert dt.utcoffset() == expected.utcoffset()
+
+    def test_cached(self):
+        _parse_date_str.cache_clear()
+        value = "Fri, 19 Jun 2020 16:58:03 +0000"
+        assert parse_date(value) is parse_date(value)
+        assert _parse_date_str.cache_info().hits == 1
+
+
+class TestParseRFC822:
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            pytest.param(
+                "Fri, 19 Jun 2020 16:58:03 +0000",
+                datetime.datetime(2020, 6, 19, 16, 58, 3, tzinfo=datetime.UTC),
+                id="offset",
+            ),
+            pytest.param(
+                "Fri, 19 Jun 2020 16:58:03 -0730",
+                datetime.datetime(
+                    2020,
+                    6,
+                    19,
+                    16,
+                    58,
+                    3,
+                    tzinfo=datetime.timezone(-datetime.timedelta(hours=7, minutes=30)),
+                ),
+                id="negative offset",
+            ),
+            pytest.param(
+                "fri, 19 jun 2020 16:58:03 EDT",
+                datetime.datetime(
+                    2020,
+                    6,
+                    19,
+                    16,
+                    58,
+                    3,
+                    tzinfo=datetime.timezone(datetime.timedelta(hours=-4)),
+                ),
+                id="tzname",
+            ),
+            pytest.param(
+                "19 Jun 2020 16:58",
+                datetime.datetime(2020, 6, 19, 16, 58),
+                id="no weekday, seconds or tz",
+            ),
+        ],
+    )
+    def test_valid(self, value, expected):
+        dt = _parse_rfc_822(value)
+        assert dt == expected
+        assert dt.tzinfo == expected.tzinfo
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pytest.param("2020-06-19T16:58:03Z", id="iso 8601"),
+            pytest.param("Fri, 19 Foo 2020 16:58:03 +0000", id="month"),
+            pytest.param("Xyz, 19 Jun 2020 16:58:03 +0000", id="weekday"),
+            pytest.param("Fri, 19 Jun 2020 16:58:03 XYZ", id="tzname"),
+            pytest.param("Fri, 19 Jun 2020 21:38:44 -4400", id="offset"),
+            pytest.param("Fri, 31 Jun 2020 16:58:03 +0000", id="day"),
+            pytest.param("Fri, 19 Jun 20 16:58:03 +0000", id="two digit year"),
+        ],
+    )
+    def test_invalid(self, value):
+        assert _parse_rfc_822(value) is None
+
+
+class TestParseISO8601:
+    def test_valid(self):
+        assert _parse_iso_8601("2020-06-19T16:58:03Z") == datetime.datetime(
+            2020, 6, 19, 16, 58, 3, tzinfo=datetime.UTC
+        )
+
+    def test_date(self):
+        assert _parse_iso_8601("2020-06-19") == datetime.datetime(2020, 6, 19)
+
+    def test_not_iso_8601(self):
+        assert _parse_iso_8601("Fri, 19 Jun 2020 16:58:03 +0000") is None
+
+    def test_invalid(self):
+        assert _parse_iso_8601("2020-13-19T16:58:03Z") is None
@@ -16,6 +16,7 @@ from radiofeed.podcasts.feed_parser.date_parser import parse_date
 from radiofeed.podcasts.feed_parser.rss_fetcher import make_content_hash
 from radiofeed.podcasts.models import Category, Podcast
 from radiofeed.podcasts.tests.factories import PodcastFactory
+from radiofeed.sanitizer import markdown, strip_html
 
 
 @pytest.fixture
@@ -84,6 +85,9 @@ class TestFeedParser:
 
         episode = Episode.objects.get(guid=episode_guid)
         assert episode.title != episode_title
+        assert episode.title_text == strip_html(episode.title)
+        assert episode.description_text == strip_html(episode.description)
+        assert episode.description_html == markdown(episode.description)
 
         podcast.refresh_from_db()
 
@@ -91,12 +95,28 @@ class TestFeedParser:
 
         assert podcast.rss
         assert podcast.num_episodes == 20
+        assert (
+            podcast.latest_episode
+            == podcast.episodes.order_by("-pub_date", "-pk").first()
+        )
+        assert podcast.latest_episode.pub_date == podcast.pub_date
         assert podcast.active is True
         assert podcast.content_hash
         assert podcast.title == "Mysterious Universe"
+        assert podcast.title_text == "Mysterious Universe"
 
         assert podcast.description == "Blog and Podcast specializing in offbeat news"
+        assert (
+            podcast.description_text == "Blog and Podcast specializing in offbeat news"
+        )
+        assert (
+            podcast.description_html
+            == "<p>Blog and Podcast specializing in offbeat news</p>\n"
+        )
         assert podcast.owner == "8th Kind"
+        assert podcast.owner_text == "8th Kind"
+        assert podcast.autocomplete_text == "mysterious universe 8th kind"
+        assert podcast.extracted_text_hash
 
         tokens = set(podcast.extracted_text.split())
 
@@ -394,6 +414,154 @@ class TestFeedParser:
         assert "Society & Culture" in assigned_categories
         assert "Philosophy" in assigned_categories
 
+    async def test_parse_unchanged_episodes(self, categories):
+        podcast = PodcastFactory(rss=self.rss)
+
+        for num_parses in range(2):
+            if num_parses:
+                # stored HTML should not be rendered again on the next parse
+                Episode.objects.filter(podcast=podcast).update(
+                    description_html="stored"
+                )
+
+            with aioresponses() as m:
+                m.get(
+                    podcast.rss,
+                    status=http.HTTPStatus.OK,
+                    body=self.get_rss_content(),
+                )
+                client = Client()
+                result = await parse_feed(podcast, client)
+                await client.aclose()
+
+            assert result == Podcast.FeedStatus.SUCCESS
+
+        assert Episode.objects.filter(podcast=podcast).count() == 20
+        assert (
+            Episode.objects.filter(podcast=podcast)
+            .exclude(description_html="stored")
+            .exists()
+            is False
+        )
+
+    async def test_parse_unchanged_podcast_text(self, categories):
+        podcast = PodcastFactory(rss=self.rss)
+
+        for num_parses in range(2):
+            if num_parses:
+                # stored text and HTML should not be rendered again
+                Podcast.objects.filter(pk=podcast.pk).update(
+                    title_text="stored",
+                    owner_text="stored",
+                    description_html="stored",
+                )
+                podcast.refresh_from_db()
+
+            with aioresponses() as m:
+                m.get(
+                    podcast.rss,
+                    status=http.HTTPStatus.OK,
+                    body=self.get_rss_content(),
+                )
+                client = Client()
+                result = await parse_feed(podcast, client)
+                await client.aclose()
+
+            assert result == Podcast.FeedStatus.SUCCESS
+
+        podcast.refresh_from_db()
+
+        assert podcast.title_text == "stored"
+        assert podcast.owner_text == "stored"
+        assert podcast.description_html == "stored"
+
+    async def test_parse_changed_podcast_text(self, categories):
+        podcast = PodcastFactory(
+            rss=self.rss,
+            title="Mysterious Universe",
+            title_text="stored",
+            owner="8th Kind",
+            owner_text="stored",
+            description="old description",
+            description_html="stored",
+        )
+
+        with aioresponses() as m:
+            m.get(
+                podcast.rss,
+                status=http.HTTPStatus.OK,
+                body=self.get_rss_content(),
+            )
+            client = Client()
+            result = await parse_feed(podcast, client)
+            await client.aclose()
+
+        assert result == Podcast.FeedStatus.SUCCESS
+
+        podcast.refresh_from_db()
+
+        # title and owner unchanged
+        assert podcast.title_text == "stored"
+        assert podcast.owner_text == "stored"
+
+        assert (
+            podcast.description_html
+            == "<p>Blog and Podcast specializing in offbeat news</p>\n"
+        )
+
+    async def test_parse_unchanged_extracted_text(self, mocker, categories):
+        mock_bump = mocker.patch(
+            "radiofeed.podcasts.feed_parser.bump_search_generation"
+        )
+        mock_bump_subscribers = mocker.patch(
+            "radiofeed.podcasts.feed_parser.bump_subscribers_version"
+        )
+        podcast = PodcastFactory(rss=self.rss)
+
+        with aioresponses() as m:
+            m.get(
+                podcast.rss,
+                status=http.HTTPStatus.OK,
+                body=self.get_rss_content(),
+            )
+            client = Client()
+            await parse_feed(podcast, client)
+            await client.aclose()
+
+        podcast.refresh_from_db()
+
+        assert podcast.extracted_text
+        assert podcast.extracted_text_hash
+
+        # stored text should not be tokenized again on the next parse
+        Podcast.objects.filter(pk=podcast.pk).update(extracted_text="stored")
+        podcast.extracted_text = "stored"
+        podcast.content_hash = ""
+
+        with aioresponses() as m:
+            m.get(
+                podcast.rss,
+                status=http.HTTPStatus.OK,
+                body=self.get_rss_content(),
+            )
+            client = Client()
+            result = await parse_feed(podcast, client)
+            await client.aclose()
+
+        assert result == Podcast.FeedStatus.SUCCESS
+
+        podcast.refresh_from_db()
+        assert podcast.extracted_text == "stored"
+
+        # cached search results only invalidated on the first parse
+        assert mock_bump.call_args_list == [
+            mocker.call(Podcast, Episode),
+            mocker.call(),
+        ]
+
+        # pub date only changed on the first parse
+        mock_bump_subscribers.assert_called_once_with(podcast.pk)
+
     async def test_parse_same_content(self, mocker):
         content = self.get_rss_content()
         podcast = PodcastFactory(content_hash=make_content_hash(content))
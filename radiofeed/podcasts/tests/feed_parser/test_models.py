@@ -156,3 +156,16 @@ class TestFeed:
             feed.tokenize()
             == "title description sci fi technology futurism scifi space science engineering future item"
         )
+
+    def test_extracted_text_hash(self):
+        item = ItemFactory(title="item")
+
+        feed = Feed(**FeedFactory(title="The Title", items=[item]))
+        new_episode = Feed(
+            **FeedFactory(title="The Title", items=[ItemFactory(), item])
+        )
+        new_title = Feed(**FeedFactory(title="New Title", items=[item]))
+
+        assert len(feed.get_extracted_text_hash()) == 64
+        assert feed.get_extracted_text_hash() == new_episode.get_extracted_text_hash()
+        assert feed.get_extracted_text_hash() != new_title.get_extracted_text_hash()
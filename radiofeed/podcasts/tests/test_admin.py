@@ -127,6 +127,38 @@ class TestPodcastAdmin:
         podcast_admin.sync_podcast_feeds(request, queryset)
         mock_parse.enqueue.assert_not_called()
 
+    def test_save_model(self, rf, mocker, podcast_admin):
+        podcast = PodcastFactory(
+            title="new title",
+            title_text="old title",
+            owner="Owner",
+            autocomplete_text="old title owner",
+            description_text="description",
+            description_html="<p>description</p>",
+        )
+        form = mocker.Mock(changed_data=["title"])
+        podcast_admin.save_model(rf.post("/"), podcast, form, change=True)
+
+        podcast.refresh_from_db()
+        assert podcast.title_text == ""
+        assert podcast.description_text == "description"
+        assert podcast.cleaned_title == "new title"
+        assert podcast.autocomplete_text == "new title owner"
+
+    def test_save_model_description(self, rf, mocker, podcast_admin):
+        podcast = PodcastFactory(
+            description="new",
+            description_text="old",
+            description_html="<p>old</p>",
+        )
+        form = mocker.Mock(changed_data=["description"])
+        podcast_admin.save_model(rf.post("/"), podcast, form, change=True)
+
+        podcast.refresh_from_db()
+        assert podcast.description_text == ""
+        assert podcast.description_html == ""
+        assert podcast.rendered_description == "<p>new</p>\n"
+
 
 @pytest.mark.django_db
 class TestPodcastAdminSyncFeedView:
@@ -0,0 +1,84 @@
+import datetime
+
+import pytest
+from django.utils import timezone
+
+from radiofeed.podcasts import autocomplete
+from radiofeed.podcasts.tests.factories import PodcastFactory
+
+
+class TestGetAutocompleteText:
+    def test_text(self):
+        assert (
+            autocomplete.get_autocomplete_text("The  Daily\nShow", "Some Owner")
+            == "the daily show some owner"
+        )
+
+    def test_no_owner(self):
+        assert autocomplete.get_autocomplete_text("Testing", "") == "testing"
+
+    def test_max_length(self):
+        assert len(autocomplete.get_autocomplete_text("a" * 300, "owner")) == 200
+
+
+class TestNormalize:
+    def test_normalize(self):
+        assert autocomplete.normalize("  Straße \t Radio ") == "strasse radio"
+
+
+class TestSearch:
+    @pytest.mark.django_db
+    def test_prefix_then_contains(self):
+        now = timezone.now()
+        contains_old = PodcastFactory(
+            autocomplete_text="learn python",
+            pub_date=now - datetime.timedelta(days=3),
+        )
+        contains_new = PodcastFactory(
+            autocomplete_text="talk python to me",
+            pub_date=now - datetime.timedelta(days=1),
+        )
+        prefix_b = PodcastFactory(autocomplete_text="python bytes")
+        prefix_a = PodcastFactory(autocomplete_text="python anywhere")
+        PodcastFactory(autocomplete_text="rust")
+
+        assert autocomplete.search("Python") == [
+            prefix_a,
+            prefix_b,
+            contains_new,
+            contains_old,
+        ]
+
+    @pytest.mark.django_db
+    def test_limit(self):
+        PodcastFactory.create_batch(3, autocomplete_text="python")
+        PodcastFactory(autocomplete_text="learn python")
+
+        assert len(autocomplete.search("python", limit=2)) == 2
+
+    @pytest.mark.django_db
+    def test_private_and_unpublished(self):
+        PodcastFactory(autocomplete_text="python", private=True)
+        PodcastFactory(autocomplete_text="python", pub_date=None)
+
+        assert autocomplete.search("python") == []
+
+    @pytest.mark.django_db
+    def test_short_value_prefix_only(self):
+        podcast = PodcastFactory(autocomplete_text="py weekly")
+        PodcastFactory(autocomplete_text="happy hour")
+
+        assert autocomplete.search("py") == [podcast]
+
+    def test_too_short(self):
+        assert autocomplete.search(" p ") == []
+
+    @pytest.mark.django_db
+    def test_cached(self, _locmem_cache, django_assert_num_queries):
+        podcast = PodcastFactory(autocomplete_text="python")
+
+        with django_assert_num_queries(2):
+            assert autocomplete.search("python") == [podcast]
+
+        with django_assert_num_queries(0):
+            assert autocomplete.search("Python ") == [podcast]
@@ -1,10 +1,17 @@
+import concurrent.futures
+import io
+
 import pytest
-from django.core.management import call_command
+from django.core.management import CommandError, call_command
 
+from radiofeed.episodes.tests.factories import EpisodeFactory
+from radiofeed.podcasts import recommender
+from radiofeed.podcasts.models import Recommendation
 from radiofeed.podcasts.tests.factories import (
     CategoryFactory,
     PodcastFactory,
     RecommendationFactory,
+    SubscriptionFactory,
 )
 
 
@@ -51,6 +58,15 @@ class TestFetchItunesFeeds:
         mock_task.enqueue.assert_called()
 
 
+@pytest.mark.django_db
+class TestCreateUserRecommendations:
+    def test_create_user_recommendations(self, user):
+        podcast = SubscriptionFactory(subscriber=user).podcast
+        RecommendationFactory.create_batch(3, podcast=podcast)
+        call_command("create_user_recommendations", limit=2)
+        assert user.podcast_recommendations.count() == 2
+
+
 @pytest.mark.django_db
 class TestCreatePodcastRecommendations:
     def test_create_podcast_recommendations(self, mocker):
@@ -60,3 +76,201 @@ class TestCreatePodcastRecommendations:
         )
         call_command("create_podcast_recommendations")
         patched.assert_called()
+
+    def test_create_podcast_recommendations_parallel(self, mocker):
+        PodcastFactory.create_batch(2, language="en")
+        PodcastFactory(language="fr")
+
+        mocker.patch(
+            "concurrent.futures.ProcessPoolExecutor",
+            side_effect=lambda max_workers, **kwargs: (
+                concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+            ),
+        )
+        mocker.patch("django.db.connections.close_all")
+        patched = mocker.patch("radiofeed.podcasts.recommender.recommend")
+
+        call_command("create_podcast_recommendations", jobs=2)
+
+        assert patched.call_count == 2
+        patched.assert_any_call("en", approximate=None)
+        patched.assert_any_call("fr", approximate=None)
+
+    def test_create_podcast_recommendations_approximate(self, mocker):
+        PodcastFactory(language="en")
+        patched = mocker.patch("radiofeed.podcasts.recommender.recommend")
+
+        call_command(
+            "create_podcast_recommendations",
+            approximate=True,
+            num_bits=8,
+            num_tables=2,
+        )
+
+        patched.assert_called_once_with(
+            "en",
+            approximate=recommender.ApproximateNeighbors(num_bits=8, num_tables=2),
+        )
+
+
+@pytest.mark.django_db
+class TestEvaluatePodcastRecommendations:
+    def test_no_index(self):
+        with pytest.raises(CommandError):
+            call_command("evaluate_podcast_recommendations")
+
+    def test_evaluate(self):
+        category = CategoryFactory()
+        PodcastFactory.create_batch(
+            3,
+            extracted_text="science physics astronomy",
+            language="en",
+            categories=[category],
+        )
+        recommender.recommend("en")
+
+        out = io.StringIO()
+
+        call_command(
+            "evaluate_podcast_recommendations",
+            num_bits=[4],
+            num_tables=[1, 2],
+            stdout=out,
+        )
+
+        assert "bits=4 tables=2 recall=1.000" in out.getvalue()
+
+
+@pytest.mark.django_db
+class TestBenchmarkPodcastRecommendations:
+    def test_benchmark(self, tmp_path):
+        output = tmp_path / "reference.json"
+        out = io.StringIO()
+
+        call_command(
+            "benchmark_podcast_recommendations",
+            num_podcasts=20,
+            num_languages=2,
+            num_categories=3,
+            num_words=20,
+            vocabulary_size=100,
+            output=output,
+            stdout=out,
+        )
+
+        assert "language=qa run=exact" in out.getvalue()
+        assert "language=qb run=exact" in out.getvalue()
+        assert output.exists()
+
+        # synthetic data is rolled back
+        assert Recommendation.objects.exists() is False
+        assert recommender.load_index("qa") is None
+
+        out = io.StringIO()
+
+        call_command(
+            "benchmark_podcast_recommendations",
+            num_podcasts=20,
+            num_categories=3,
+            num_words=20,
+            vocabulary_size=100,
+            approximate=True,
+            num_bits=1,
+            num_tables=1,
+            reference=output,
+            stdout=out,
+        )
+
+        assert "language=qa run=approximate" in out.getvalue()
+        assert "overlap@12=1.000 vs reference" in out.getvalue()
+        assert "vs exact" in out.getvalue()
+
+    def test_empty_reference(self, tmp_path):
+        reference = tmp_path / "reference.json"
+        reference.write_text('{"qa": {}}')
+
+        out = io.StringIO()
+
+        call_command(
+            "benchmark_podcast_recommendations",
+            num_podcasts=2,
+            num_categories=1,
+            num_words=5,
+            vocabulary_size=10,
+            reference=reference,
+            stdout=out,
+        )
+
+        assert "overlap@12=1.000 vs reference" in out.getvalue()
+
+    def test_invalid_reference(self, tmp_path):
+        with pytest.raises(CommandError):
+            call_command(
+                "benchmark_podcast_recommendations",
+                reference=tmp_path / "missing.json",
+            )
+
+
+@pytest.mark.django_db
+class TestTokenizePodcasts:
+    @pytest.fixture
+    def podcast(self):
+        podcast = PodcastFactory(
+            title="Cats",
+            description="",
+            owner="",
+            keywords="",
+            language="en",
+            extracted_text="old",
+            categories=[CategoryFactory(name="Science")],
+        )
+        EpisodeFactory(podcast=podcast, title="Dogs")
+        return podcast
+
+    def test_tokenize(self, podcast):
+        untokenized = PodcastFactory(extracted_text="")
+
+        out = io.StringIO()
+        call_command("tokenize_podcasts", stdout=out)
+
+        podcast.refresh_from_db()
+        assert podcast.extracted_text == "cat science dog"
+
+        untokenized.refresh_from_db()
+        assert untokenized.extracted_text == ""
+
+        assert (
+            f"Podcasts tokenized: 1 (IDs {podcast.pk}-{podcast.pk})" in out.getvalue()
+        )
+
+    def test_tokenize_range(self, podcast):
+        call_command("tokenize_podcasts", start=podcast.pk + 1, end=podcast.pk + 10)
+
+        podcast.refresh_from_db()
+        assert podcast.extracted_text == "old"
+
+    def test_tokenize_parallel(self, mocker, podcast):
+        # run batches in this process, so they share the test transaction
+        executor = mocker.MagicMock()
+        executor.__enter__.return_value.map = map
+        mocker.patch("concurrent.futures.ProcessPoolExecutor", return_value=executor)
+        mocker.patch("django.db.connections.close_all")
+
+        call_command("tokenize_podcasts", jobs=2, batch_size=1)
+
+        podcast.refresh_from_db()
+        assert podcast.extracted_text == "cat science dog"
+
+
+@pytest.mark.django_db
+class TestBenchmarkStripHtml:
+    def test_benchmark(self):
+        PodcastFactory(description="<p>this &amp; that</p>")
+        EpisodeFactory(description="**bold** text")
+
+        out = io.StringIO()
+        call_command("benchmark_strip_html", stdout=out)
+
+        assert "podcasts: texts=1" in out.getvalue()
+        assert "episodes: texts=1" in out.getvalue()
+        assert "mismatches=0" in out.getvalue()
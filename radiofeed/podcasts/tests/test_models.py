@@ -1,10 +1,18 @@
 import datetime
+import shutil
 
 import pytest
 from django.utils import timezone
 
+from radiofeed.db.search import bump_search_generation, get_search_generation
 from radiofeed.episodes.tests.factories import EpisodeFactory
-from radiofeed.podcasts.models import Category, Podcast, Recommendation
+from radiofeed.podcasts.models import (
+    Category,
+    Podcast,
+    Recommendation,
+    UserRecommendation,
+)
+from radiofeed.podcasts.recommender import get_index_path, recommend
 from radiofeed.podcasts.tests.factories import (
     CategoryFactory,
     PodcastFactory,
@@ -20,6 +28,58 @@ class TestRecommendationManager:
         Recommendation.objects.bulk_delete()
         assert Recommendation.objects.count() == 0
 
+    def test_bulk_replace(self):
+        old = RecommendationFactory()
+        podcast, recommended = PodcastFactory.create_batch(2)
+
+        num_rows = Recommendation.objects.bulk_replace(
+            [(podcast.pk, recommended.pk, 0.5)]
+        )
+
+        assert num_rows == 1
+        assert not Recommendation.objects.filter(pk=old.pk).exists()
+
+        recommendation = Recommendation.objects.get()
+        assert recommendation.podcast == podcast
+        assert recommendation.recommended == recommended
+
+
+@pytest.mark.django_db
+class TestUserRecommendationManager:
+    def test_rebuild(self, user):
+        podcast = SubscriptionFactory(subscriber=user).podcast
+        RecommendationFactory(podcast=podcast, score=0.3)
+        best = RecommendationFactory(podcast=podcast, score=0.9).recommended
+        RecommendationFactory(
+            podcast=SubscriptionFactory(subscriber=user).podcast,
+            recommended=best,
+            score=0.1,
+        )
+        RecommendationFactory(podcast=podcast, recommended__pub_date=None)
+
+        # not subscribed
+        RecommendationFactory()
+
+        assert UserRecommendation.objects.rebuild(limit=1) == 1
+
+        recommendation = UserRecommendation.objects.get()
+        assert recommendation.user == user
+        assert recommendation.podcast == best
+        assert float(recommendation.relevance) == pytest.approx(0.9)
+
+    def test_rebuild_replaces_existing(self, user):
+        podcast = SubscriptionFactory(subscriber=user).podcast
+        recommended = RecommendationFactory(podcast=podcast).recommended
+
+        assert UserRecommendation.objects.rebuild() == 1
+
+        # subscribed since last rebuild, still excluded when read
+        SubscriptionFactory(subscriber=user, podcast=recommended)
+        assert Podcast.objects.recommended(user).count() == 0
+
+        assert UserRecommendation.objects.rebuild() == 0
+        assert UserRecommendation.objects.exists() is False
+
 
 class TestCategoryModel:
     def test_str(self):
@@ -62,6 +122,84 @@ class TestPodcastManager:
 
         assert podcast_1 in result
 
+    def test_search_max_candidates(self):
+        now = timezone.now()
+
+        PodcastFactory(
+            title="Learn Python Programming",
+            pub_date=now - datetime.timedelta(days=3),
+        )
+        podcast_2 = PodcastFactory(
+            title="Advanced Python Techniques",
+            pub_date=now - datetime.timedelta(days=1),
+        )
+        podcast_3 = PodcastFactory(
+            title="Python Python Python",
+            pub_date=now - datetime.timedelta(days=2),
+        )
+        PodcastFactory(title="JavaScript Basics", pub_date=now)
+
+        result = Podcast.objects.search("Python", max_candidates=2).order_by("-rank")
+
+        assert list(result) == [podcast_3, podcast_2]
+        assert all(podcast.rank > 0 for podcast in result)
+
+    def test_search_cached(self, _locmem_cache):
+        podcast_1 = PodcastFactory(title="Learn Python Programming")
+
+        result = Podcast.objects.search_cached("Python")
+
+        assert len(result) == 1
+        assert result[0] == podcast_1
+        assert result[0:10] == [podcast_1]
+
+        # not found until cached results are invalidated
+        podcast_2 = PodcastFactory(title="Advanced Python Techniques")
+
+        assert Podcast.objects.search_cached(" PYTHON ")[0:10] == [podcast_1]
+
+        bump_search_generation(Podcast)
+
+        assert set(Podcast.objects.search_cached("python")[0:10]) == {
+            podcast_1,
+            podcast_2,
+        }
+
+        result = Podcast.objects.search_cached("python", order_by=("title",))
+
+        assert len(result) == 2
+        assert result[0:10] == [podcast_2, podcast_1]
+
+    def test_search_cached_deleted(self, _locmem_cache):
+        podcast = PodcastFactory(title="Learn Python Programming")
+
+        assert Podcast.objects.search_cached("Python")[0:10] == [podcast]
+
+        podcast.delete()
+
+        assert Podcast.objects.search_cached("Python")[0:10] == []
+
+    def test_search_cached_empty(self):
+        result = Podcast.objects.search_cached("")
+        assert len(result) == 0
+        assert result[0:10] == []
+
+        with pytest.raises(IndexError):
+            result[0]
+
+    def test_search_generation(self, _locmem_cache):
+        generation = get_search_generation(Podcast)
+
+        assert get_search_generation(Podcast) == generation
+
+        bump_search_generation(Podcast)
+
+        assert get_search_generation(Podcast) == generation + 1
+
+    def test_search_generation_not_cached(self, _locmem_cache):
+        bump_search_generation(Podcast)
+        assert get_search_generation(Podcast)
+
     def test_subscribed_true(self, user):
         SubscriptionFactory(subscriber=user)
         assert Podcast.objects.subscribed(user).exists() is True
@@ -159,6 +297,7 @@ class TestPodcastManager:
         podcast = SubscriptionFactory(subscriber=user).podcast
         RecommendationFactory.create_batch(3, podcast=podcast)
         outlier = PodcastFactory()  # not recommended
+        UserRecommendation.objects.rebuild()
         podcasts = Podcast.objects.recommended(user)
         assert podcasts.count() == 3
         assert outlier not in podcasts
@@ -166,12 +305,14 @@ class TestPodcastManager:
     def test_recommended_is_subscribed(self, user):
         podcast = SubscriptionFactory(subscriber=user).podcast
         RecommendationFactory(recommended=podcast)
+        UserRecommendation.objects.rebuild()
         assert Podcast.objects.recommended(user).count() == 0
 
     def test_already_recommended(self, user):
         podcast = SubscriptionFactory(subscriber=user).podcast
         recommended = RecommendationFactory(podcast=podcast).recommended
         user.recommended_podcasts.add(recommended)
+        UserRecommendation.objects.rebuild()
         assert Podcast.objects.recommended(user).count() == 0
 
     def test_recommended_is_subscribed_or_recommended(self, user):
@@ -179,6 +320,7 @@ class TestPodcastManager:
         RecommendationFactory(recommended=podcast)
         recommended = RecommendationFactory(podcast=podcast).recommended
         user.recommended_podcasts.add(recommended)
+        UserRecommendation.objects.rebuild()
         assert Podcast.objects.recommended(user).count() == 0
 
 
@@ -204,10 +346,32 @@ class TestPodcastModel:
         podcast = Podcast(description="<b>Test &amp; Code")
         assert podcast.cleaned_description == "Test & Code"
 
+    def test_cleaned_stored(self):
+        podcast = Podcast(
+            title="<b>Test &amp; Code",
+            title_text="Stored title",
+            description="<b>Test &amp; Code",
+            description_text="Stored description",
+        )
+        assert podcast.cleaned_title == "Stored title"
+        assert podcast.cleaned_description == "Stored description"
+
+    def test_rendered_description(self):
+        podcast = Podcast(description="**Test**")
+        assert podcast.rendered_description == "<p><strong>Test</strong></p>\n"
+
+    def test_rendered_description_stored(self):
+        podcast = Podcast(description="**Test**", description_html="<p>Stored</p>")
+        assert podcast.rendered_description == "<p>Stored</p>"
+
     def test_cleaned_owner(self):
         podcast = Podcast(owner="<b>Test &amp; Code")
         assert podcast.cleaned_owner == "Test & Code"
 
+    def test_cleaned_owner_stored(self):
+        podcast = Podcast(owner="<b>Test &amp; Code", owner_text="Stored")
+        assert podcast.cleaned_owner == "Stored"
+
     @pytest.mark.django_db
     def test_has_similar_podcasts_private(self):
         podcast = RecommendationFactory(podcast__private=True).podcast
@@ -218,6 +382,24 @@ class TestPodcastModel:
         podcast = RecommendationFactory().podcast
         assert podcast.has_similar_podcasts is True
 
+    @pytest.mark.django_db
+    def test_has_similar_podcasts_extracted_text(self):
+        category = CategoryFactory()
+        PodcastFactory(extracted_text="cooking recipes", categories=[category])
+        podcast = PodcastFactory(
+            extracted_text="science physics", categories=[category]
+        )
+        recommend(podcast.language)
+        shutil.rmtree(get_index_path(podcast.language))
+        assert podcast.has_similar_podcasts is True
+        # index is not copied locally just to check it exists
+        assert not get_index_path(podcast.language).exists()
+
+    @pytest.mark.django_db
+    def test_has_similar_podcasts_extracted_text_no_index(self):
+        podcast = PodcastFactory(extracted_text="science physics")
+        assert podcast.has_similar_podcasts is False
+
     @pytest.mark.django_db
     def test_has_similar_podcasts_false(self):
         podcast = PodcastFactory()
@@ -1,6 +1,6 @@
 import pathlib
 
-from radiofeed.podcasts.opml_parser import parse_opml
+from radiofeed.podcasts.opml_parser import iterparse_opml, parse_opml
 
 
 class TestParseOpml:
@@ -13,3 +13,22 @@ class TestParseOpml:
         feeds = list(parse_opml(b""))
 
         assert len(feeds) == 0
+
+    def test_parse_invalid(self):
+        feeds = list(parse_opml(b"not xml"))
+
+        assert len(feeds) == 0
+
+
+class TestIterparseOpml:
+    def test_parse_chunks(self):
+        content = (pathlib.Path(__file__).parent / "mocks" / "feeds.opml").read_bytes()
+        chunks = (content[i : i + 100] for i in range(0, len(content), 100))
+        feeds = list(iterparse_opml(chunks))
+        assert feeds == list(parse_opml(content))
+        assert len(feeds) == 11
+
+    def test_parse_empty(self):
+        feeds = list(iterparse_opml([]))
+
+        assert len(feeds) == 0
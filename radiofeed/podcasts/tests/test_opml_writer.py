@@ -0,0 +1,49 @@
+import pytest
+
+from radiofeed.podcasts.opml_parser import parse_opml
+from radiofeed.podcasts.opml_writer import write_opml
+from radiofeed.podcasts.tests.factories import PodcastFactory
+
+
+class TestWriteOpml:
+    @pytest.mark.django_db
+    def test_write(self):
+        podcasts = PodcastFactory.create_batch(3)
+        content = "".join(write_opml(podcasts, "Podcasts for Testing"))
+
+        assert "<title>Podcasts for Testing</title>" in content
+        assert list(parse_opml(content.encode())) == [
+            podcast.rss for podcast in podcasts
+        ]
+
+    @pytest.mark.django_db
+    def test_escape(self):
+        podcast = PodcastFactory(
+            title='Tom & Jerry "Live"',
+            description="<p>Cats & mice</p>",
+            website="https://example.com/?a=1&b=2",
+        )
+        content = "".join(write_opml([podcast], "Podcasts"))
+
+        assert 'title="Tom &amp; Jerry &quot;Live&quot;"' in content
+        assert 'text="Cats &amp; mice"' in content
+        assert 'htmlUrl="https://example.com/?a=1&amp;b=2"' in content
+        assert list(parse_opml(content.encode())) == [podcast.rss]
+
+    @pytest.mark.django_db
+    def test_truncate_description(self):
+        podcast = PodcastFactory(description=" ".join(["word"] * 100))
+        content = "".join(write_opml([podcast], "Podcasts"))
+
+        # same as the truncatewords template filter
+        assert f'text="{" ".join(["word"] * 60)} …"' in content
+
+    @pytest.mark.django_db
+    def test_no_website(self):
+        podcast = PodcastFactory(website="")
+        content = "".join(write_opml([podcast], "Podcasts"))
+        assert "htmlUrl" not in content
+
+    def test_empty(self):
+        content = "".join(write_opml([], "Podcasts"))
+        assert list(parse_opml(content.encode())) == []
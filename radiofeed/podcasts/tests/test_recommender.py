@@ -1,7 +1,25 @@
+import dataclasses
+import shutil
+
 import pytest
 
-from radiofeed.podcasts.models import Category, Recommendation
-from radiofeed.podcasts.recommender import recommend
+from radiofeed.podcasts.models import (
+    Category,
+    Recommendation,
+    RecommenderIndex,
+    RecommenderIndexChunk,
+)
+from radiofeed.podcasts.recommender import (
+    ApproximateNeighbors,
+    evaluate_recall,
+    find_similar,
+    get_category_partitions,
+    get_index,
+    get_index_path,
+    has_index,
+    load_index,
+    recommend,
+)
 from radiofeed.podcasts.tests.factories import (
     CategoryFactory,
     PodcastFactory,
@@ -36,6 +54,64 @@ class TestRecommend:
             # The podcast itself should never appear in its recommendations
             assert all(r.recommended != podcast for r in recs)
 
+    def test_recommend_writes_rows(self):
+        # Not mocked: rows are written with COPY on the connection also used to
+        # build the corpus and save the index.
+        cat = CategoryFactory()
+
+        science = PodcastFactory(
+            extracted_text="science physics astronomy",
+            language="en",
+            categories=[cat],
+        )
+        physics = PodcastFactory(
+            extracted_text="science physics chemistry",
+            language="en",
+            categories=[cat],
+        )
+        PodcastFactory(
+            extracted_text="cooking recipes",
+            language="en",
+            categories=[cat],
+        )
+        old = RecommendationFactory(podcast__language="en")
+
+        recommend("en")
+
+        assert not Recommendation.objects.filter(pk=old.pk).exists()
+        assert RecommenderIndex.objects.filter(language="en").exists()
+
+        rows = {
+            (podcast_id, recommended_id)
+            for podcast_id, recommended_id, score in Recommendation.objects.values_list(
+                "podcast", "recommended", "score"
+            )
+            if score > 0
+        }
+        assert rows == {(science.pk, physics.pk), (physics.pk, science.pk)}
+
+    def test_timings(self):
+        cat = CategoryFactory.create()
+
+        PodcastFactory.create_batch(
+            3,
+            extracted_text="shared content about science and tech",
+            language="en",
+            categories=[cat],
+        )
+
+        timings = recommend("en")
+
+        assert set(timings) == {
+            "load",
+            "hashing",
+            "tfidf",
+            "index",
+            "knn",
+            "scoring",
+            "write",
+        }
+
     def test_handle_empty_data_frame(self):
         PodcastFactory(
             title="Cool science podcast",
@@ -149,3 +225,281 @@ class TestRecommend:
         recommend("en")
 
         assert Recommendation.objects.exists() is False
+
+
+@pytest.mark.django_db
+class TestIndex:
+    def test_load_index_not_found(self):
+        assert load_index("en") is None
+
+    def test_save_and_load(self):
+        cat = CategoryFactory()
+
+        podcasts = PodcastFactory.create_batch(
+            3,
+            extracted_text="shared content about science and tech",
+            language="en",
+            categories=[cat],
+        )
+
+        recommend("en")
+
+        index = load_index("en")
+        assert index is not None
+        assert index.matrix.shape == (3, len(index.idf))
+        assert set(index.podcast_ids.tolist()) == {p.pk for p in podcasts}
+
+        # rebuild replaces existing index
+        recommend("en")
+        assert load_index("en") is not None
+
+    def test_remove_if_no_categories(self):
+        RecommenderIndex.objects.create(language="en", version=2)
+        get_index_path("en").mkdir(parents=True)
+        PodcastFactory(extracted_text="science physics astronomy", language="en")
+        recommend("en")
+        assert load_index("en") is None
+        assert not RecommenderIndex.objects.exists()
+        assert not get_index_path("en").exists()
+
+    def test_load_index_no_chunks(self):
+        RecommenderIndex.objects.create(language="en", version=2)
+        assert load_index("en") is None
+        assert not get_index_path("en").exists()
+
+    def test_save_and_load_in_chunks(self, mocker):
+        mocker.patch("radiofeed.podcasts.recommender._index_chunk_size", 64)
+
+        cat = CategoryFactory()
+        PodcastFactory.create_batch(
+            3,
+            extracted_text="shared content about science and tech",
+            language="en",
+            categories=[cat],
+        )
+        recommend("en")
+
+        assert RecommenderIndexChunk.objects.filter(name="idf").count() > 1
+
+        index = load_index("en")
+        assert index is not None
+
+        matrix = index.matrix.toarray().tolist()
+        idf = index.idf.tolist()
+        podcast_ids = index.podcast_ids.tolist()
+
+        # copy again from the database
+        shutil.rmtree(get_index_path("en"))
+
+        copy = load_index("en")
+        assert copy is not None
+        assert copy.matrix.toarray().tolist() == matrix
+        assert copy.idf.tolist() == idf
+        assert copy.podcast_ids.tolist() == podcast_ids
+
+    def test_has_index(self):
+        RecommenderIndex.objects.create(language="en", version=2)
+        assert has_index("en") is True
+
+    def test_has_index_other_version(self):
+        RecommenderIndex.objects.create(language="en", version=0)
+        assert has_index("en") is False
+
+    def test_get_index_not_found(self):
+        assert get_index("en") is None
+
+    def test_get_index_other_version(self):
+        RecommenderIndex.objects.create(language="en", version=0)
+        assert get_index("en") is None
+
+    def test_get_index(self):
+        cat = CategoryFactory()
+        podcasts = PodcastFactory.create_batch(
+            3,
+            extracted_text="shared content about science and tech",
+            language="en",
+            categories=[cat],
+        )
+
+        recommend("en")
+
+        index = get_index("en")
+        assert index is not None
+        assert set(index.podcast_ids.tolist()) == {p.pk for p in podcasts}
+
+        # local copy is kept for the current build only
+        assert len(list(get_index_path("en").iterdir())) == 1
+
+        PodcastFactory(
+            extracted_text="shared content about science",
+            language="en",
+            categories=[cat],
+        )
+
+        recommend("en")
+
+        index = get_index("en")
+        assert index is not None
+        assert index.matrix.shape[0] == 4
+        assert len(list(get_index_path("en").iterdir())) == 1
+
+
+@pytest.mark.django_db
+class TestFindSimilar:
+    def test_no_index(self):
+        assert find_similar("en", "science physics") == []
+
+    def test_empty_text(self):
+        assert find_similar("en", "") == []
+
+    def test_find_similar(self):
+        cat = CategoryFactory()
+
+        science = PodcastFactory(
+            extracted_text="science physics astronomy",
+            language="en",
+            categories=[cat],
+        )
+        philosophy = PodcastFactory(
+            extracted_text="philosophy thinking ethics",
+            language="en",
+            categories=[cat],
+        )
+        PodcastFactory(
+            extracted_text="cooking recipes",
+            language="en",
+            categories=[cat],
+        )
+
+        recommend("en")
+
+        results = find_similar("en", "physics astronomy", limit=5)
+        assert [podcast_id for podcast_id, _ in results] == [science.pk]
+        assert 0 < results[0][1] <= 1
+
+        results = find_similar("en", "philosophy science", limit=1)
+        assert len(results) == 1
+        assert results[0][0] in {science.pk, philosophy.pk}
+
+
+@pytest.mark.django_db
+class TestApproximateNeighbors:
+    @pytest.fixture
+    def podcasts(self):
+        cat = CategoryFactory()
+        return [
+            PodcastFactory(
+                extracted_text=text,
+                language="en",
+                categories=[cat],
+            )
+            for text in (
+                "science physics astronomy",
+                "science physics chemistry",
+                "philosophy thinking ethics",
+                "philosophy thinking logic",
+            )
+        ]
+
+    def test_recommend(self, podcasts):
+        recommend("en", approximate=ApproximateNeighbors(num_bits=0, min_rows=0))
+
+        recs = Recommendation.objects.filter(podcast=podcasts[0])
+        assert recs.count() == 1
+        assert recs.get().recommended == podcasts[1]
+
+    def test_matches_exact_with_single_bucket(self, podcasts):
+        recommend("en")
+
+        index = load_index("en")
+        assert index is not None
+
+        assert (
+            evaluate_recall(index, ApproximateNeighbors(num_bits=0, min_rows=0)) == 1.0
+        )
+
+    def test_evaluate_recall_in_chunks(self, mocker, podcasts):
+        mocker.patch("radiofeed.podcasts.recommender._max_exact_similarities", 1)
+        recommend("en")
+
+        index = load_index("en")
+        assert index is not None
+
+        assert (
+            evaluate_recall(
+                index,
+                ApproximateNeighbors(num_bits=0, min_rows=0),
+                partitions=get_category_partitions("en", index),
+            )
+            == 1.0
+        )
+
+    def test_evaluate_recall_exact_partitions(self, podcasts):
+        recommend("en")
+
+        index = load_index("en")
+        assert index is not None
+
+        # partitions smaller than min_rows use exact neighbours
+        assert (
+            evaluate_recall(
+                index,
+                ApproximateNeighbors(num_bits=16, num_tables=1, min_rows=5),
+                partitions=get_category_partitions("en", index),
+            )
+            == 1.0
+        )
+
+    def test_get_category_partitions(self, podcasts):
+        other = CategoryFactory()
+        podcasts[0].categories.add(other)
+
+        recommend("en")
+
+        index = load_index("en")
+        assert index is not None
+
+        rows = {
+            podcast_id: row for row, podcast_id in enumerate(index.podcast_ids.tolist())
+        }
+
+        partitions = sorted(
+            sorted(partition.tolist())
+            for partition in get_category_partitions("en", index)
+        )
+        assert partitions == [
+            [rows[podcasts[0].pk]],
+            sorted(rows[podcast.pk] for podcast in podcasts),
+        ]
+
+    def test_missing_neighbors(self, podcasts):
+        recommend("en")
+
+        index = load_index("en")
+        assert index is not None
+
+        distances, neighbors = ApproximateNeighbors(
+            num_bits=16, num_tables=1
+        ).kneighbors(index.matrix, 4)
+
+        assert neighbors.shape == (4, 4)
+        assert distances.shape == (4, 4)
+        # every row is at least found in its own bucket
+        assert all(row in neighbors[row] for row in range(4))
+
+    def test_evaluate_recall_no_matches(self, podcasts):
+        recommend("en")
+
+        index = load_index("en")
+        assert index is not None
+
+        matrix = index.matrix.copy()
+        matrix.data[:] = 0
+
+        assert (
+            evaluate_recall(
+                dataclasses.replace(index, matrix=matrix),
+                ApproximateNeighbors(min_rows=0),
+            )
+            == 1.0
+        )
@@ -0,0 +1,41 @@
+import pytest
+
+from radiofeed.podcasts.subscriptions import (
+    bump_subscribers_version,
+    bump_subscriptions_version,
+    get_subscriptions_version,
+)
+from radiofeed.podcasts.tests.factories import SubscriptionFactory
+from radiofeed.users.tests.factories import UserFactory
+
+
+class TestSubscriptionsVersion:
+    def test_get_version(self, _locmem_cache):
+        assert get_subscriptions_version(1) == get_subscriptions_version(1)
+
+    def test_bump_version(self, _locmem_cache):
+        version = get_subscriptions_version(1)
+        other = get_subscriptions_version(2)
+
+        bump_subscriptions_version(1)
+
+        assert get_subscriptions_version(1) != version
+        assert get_subscriptions_version(2) == other
+
+    def test_bump_no_users(self, _locmem_cache):
+        version = get_subscriptions_version(1)
+        bump_subscriptions_version()
+        assert get_subscriptions_version(1) == version
+
+    @pytest.mark.django_db
+    def test_bump_subscribers(self, _locmem_cache):
+        subscription = SubscriptionFactory()
+        other = UserFactory()
+
+        version = get_subscriptions_version(subscription.subscriber_id)
+        other_version = get_subscriptions_version(other.pk)
+
+        bump_subscribers_version(subscription.podcast_id)
+
+        assert get_subscriptions_version(subscription.subscriber_id) != version
+        assert get_subscriptions_version(other.pk) == other_version
@@ -1,7 +1,7 @@
 import pytest
 
 from radiofeed.podcasts import itunes
-from radiofeed.podcasts.models import Podcast
+from radiofeed.podcasts.models import Podcast, UserRecommendation
 from radiofeed.podcasts.tasks import (
     fetch_itunes_feeds,
     parse_podcast_feed,
@@ -71,6 +71,7 @@ class TestSendPodcastRecommendations:
     def test_ok(self, recipient, mailoutbox, _immediate_task_backend):
         podcast = SubscriptionFactory(subscriber=recipient.user).podcast
         RecommendationFactory(podcast=podcast)
+        UserRecommendation.objects.rebuild()
         send_podcast_recommendations.enqueue(recipient_id=recipient.id)
         assert len(mailoutbox) == 1
 
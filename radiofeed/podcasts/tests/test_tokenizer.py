@@ -1,4 +1,11 @@
-from radiofeed.podcasts.tokenizer import clean_text, get_stopwords, tokenize
+from radiofeed.podcasts import tokenizer
+from radiofeed.podcasts.tokenizer import (
+    _lemmatize,
+    clean_text,
+    get_stopwords,
+    tokenize,
+    tokenize_many,
+)
 
 
 class TestStopwords:
@@ -20,7 +27,14 @@ class TestTokenize:
             "mat",
         ]
 
+    def test_extract_cached(self, mocker):
+        _lemmatize.cache_clear()
+        lemmatize = mocker.spy(tokenizer._lemmatizer, "lemmatize")
+        assert tokenize("en", "cat cat cat") == ["cat", "cat", "cat"]
+        assert lemmatize.call_count == 1
+
     def test_extract_attribute_error(self, mocker):
+        _lemmatize.cache_clear()
         mocker.patch(
             "radiofeed.podcasts.tokenizer._lemmatizer.lemmatize",
             side_effect=AttributeError,
@@ -28,6 +42,43 @@ class TestTokenize:
         assert tokenize("en", "the cat sits on the mat") == []
 
 
+class TestTokenizeMany:
+    def test_tokenize_many(self):
+        assert tokenize_many("en", ["the cat sits on the mat", "  ", "dogs"]) == [
+            ["cat", "sits", "mat"],
+            [],
+            ["dog"],
+        ]
+
+    def test_matches_tokenize(self):
+        texts = [
+            "<p>The cats sat on the mats</p>",
+            "Dogs chase cats, 2020",
+            "",
+        ]
+        assert tokenize_many("en", texts) == [tokenize("en", text) for text in texts]
+
+    def test_lemmatizes_each_token_once(self, mocker):
+        mock_lemmatize = mocker.patch(
+            "radiofeed.podcasts.tokenizer._lemmatize",
+            side_effect=lambda language, token: token,
+        )
+        assert tokenize_many("en", ["cat dog", "dog cat", "cat"]) == [
+            ["cat", "dog"],
+            ["dog", "cat"],
+            ["cat"],
+        ]
+        assert mock_lemmatize.call_count == 2
+
+    def test_attribute_error(self, mocker):
+        _lemmatize.cache_clear()
+        mocker.patch(
+            "radiofeed.podcasts.tokenizer._lemmatizer.lemmatize",
+            side_effect=AttributeError,
+        )
+        assert tokenize_many("en", ["the cat sits on the mat"]) == [[]]
+
+
 class TestCleanText:
     def test_remove_html_tags(self):
         assert (
@@ -1,17 +1,27 @@
 import pytest
 from django.urls import reverse, reverse_lazy
-from pytest_django.asserts import assertContains, assertTemplateUsed
+from pytest_django.asserts import (
+    assertContains,
+    assertNotContains,
+    assertTemplateUsed,
+)
 
 from radiofeed.episodes.tests.factories import EpisodeFactory
+from radiofeed.paginator import Page
 from radiofeed.podcasts import itunes
 from radiofeed.podcasts.models import Podcast, Subscription
+from radiofeed.podcasts.subscriptions import (
+    bump_subscriptions_version,
+    get_subscriptions_version,
+)
 from radiofeed.podcasts.tests.factories import (
     CategoryFactory,
     PodcastFactory,
     RecommendationFactory,
     SubscriptionFactory,
 )
-from radiofeed.tests.asserts import assert200, assert404, assert409
+from radiofeed.sanitizer import clear_markdown_cache, get_markdown_cache_stats
+from radiofeed.tests.asserts import assert200, assert304, assert404, assert409
 
 _subscriptions_url = reverse_lazy("podcasts:subscriptions")
 _discover_url = reverse_lazy("podcasts:discover")
@@ -68,6 +78,16 @@ class TestSubscriptions:
         assert len(response.context["page"].object_list) == 1
         assert response.context["page"].object_list[0] == sub.podcast
 
+    def test_cached(self, client, auth_user, _locmem_cache):
+        first = SubscriptionFactory(subscriber=auth_user, podcast__title="First")
+        assertContains(client.get(_subscriptions_url), first.podcast.title)
+
+        second = SubscriptionFactory(subscriber=auth_user, podcast__title="Second")
+        assertNotContains(client.get(_subscriptions_url), second.podcast.title)
+
+        bump_subscriptions_version(auth_user.pk)
+        assertContains(client.get(_subscriptions_url), second.podcast.title)
+
 
 @pytest.mark.django_db
 class TestDiscover:
@@ -135,6 +155,28 @@ class TestSearchPodcasts:
         assert len(response.context["page"].object_list) == 0
 
 
+@pytest.mark.django_db
+class TestSearchAutocomplete:
+    url = reverse_lazy("podcasts:search_autocomplete")
+
+    def test_search(self, client, auth_user):
+        podcast = PodcastFactory(title="Testing", autocomplete_text="testing")
+        PodcastFactory(autocomplete_text="other")
+        response = client.get(self.url, {"search": "Test"})
+
+        assert200(response)
+        assertTemplateUsed(response, "podcasts/autocomplete.html")
+
+        assert response.context["podcasts"] == [podcast]
+
+    def test_search_value_empty(self, client, auth_user):
+        response = client.get(self.url, {"search": ""})
+
+        assert200(response)
+
+        assert response.context["podcasts"] == []
+
+
 @pytest.mark.django_db
 class TestSearchItunes:
     url = reverse_lazy("podcasts:search_itunes")
@@ -194,6 +236,24 @@ class TestPodcastSimilar:
         assert response.context["podcast"] == podcast
         assert len(response.context["recommendations"]) == 3
 
+    def test_get_from_index(self, client, auth_user, mocker):
+        podcast = PodcastFactory(extracted_text="science physics")
+        other = PodcastFactory()
+        private = PodcastFactory(private=True)
+
+        mocker.patch(
+            "radiofeed.podcasts.recommender.find_similar",
+            return_value=[(podcast.pk, 1.0), (other.pk, 0.5), (private.pk, 0.3)],
+        )
+
+        response = client.get(podcast.get_similar_url())
+
+        assert200(response)
+
+        recommendations = response.context["recommendations"]
+        assert len(recommendations) == 1
+        assert recommendations[0].recommended == other
+
 
 class TestPodcastDetail:
     @pytest.fixture
@@ -215,6 +275,24 @@ class TestPodcastDetail:
 
         assert response.context["podcast"] == podcast
 
+    @pytest.mark.django_db
+    def test_get_podcast_description_not_stored(self, client, auth_user):
+        clear_markdown_cache()
+
+        podcast = PodcastFactory(description="**bold**", description_html="")
+
+        for _ in range(2):
+            response = client.get(podcast.get_absolute_url())
+            assert200(response)
+            assertContains(response, "<strong>bold</strong>")
+
+        # rendered on the first request, then found in the cache
+        stats = get_markdown_cache_stats()
+        assert stats.misses == 1
+        assert stats.local_hits == 1
+
+        clear_markdown_cache()
+
     @pytest.mark.django_db
     def test_get_podcast_subscribed(self, client, auth_user, podcast):
         podcast.categories.set(CategoryFactory.create_batch(3))
@@ -226,6 +304,36 @@ class TestPodcastDetail:
         assert response.context["podcast"] == podcast
         assert response.context["is_subscribed"] is True
 
+    @pytest.mark.django_db
+    def test_not_modified(self, client, auth_user, podcast, _locmem_cache):
+        # first request adds CSRF token to session
+        client.get(podcast.get_absolute_url())
+        etag = client.get(podcast.get_absolute_url())["ETag"]
+
+        response = client.get(
+            podcast.get_absolute_url(), headers={"If-None-Match": etag}
+        )
+        assert304(response)
+
+        SubscriptionFactory(subscriber=auth_user, podcast=podcast)
+        bump_subscriptions_version(auth_user.pk)
+
+        response = client.get(
+            podcast.get_absolute_url(), headers={"If-None-Match": etag}
+        )
+        assert200(response)
+        assert response.context["is_subscribed"] is True
+
+    @pytest.mark.django_db
+    def test_not_found(self, client, auth_user):
+        response = client.get(
+            reverse(
+                "podcasts:podcast_detail",
+                kwargs={"podcast_id": 1234, "slug": "test"},
+            )
+        )
+        assert404(response)
+
     @pytest.mark.django_db
     def test_get_podcast_private_subscribed(self, client, auth_user):
         podcast = PodcastFactory(private=True)
@@ -276,6 +384,7 @@ class TestPodcastDetail:
 @pytest.mark.django_db
 class TestLatestEpisode:
     def test_ok(self, client, auth_user, episode):
+        Podcast.objects.filter(pk=episode.podcast_id).update(latest_episode=episode)
         response = client.get(self.url(episode.podcast))
         assert response.url == episode.get_absolute_url()
 
@@ -378,6 +487,7 @@ class TestPodcastEpisodes:
         )
         assert200(response)
         assert len(response.context["page"].object_list) == 1
+        assert isinstance(response.context["page"], Page)
 
 
 @pytest.mark.django_db
@@ -469,6 +579,11 @@ class TestSubscribe:
             podcast=podcast, subscriber=auth_user
         ).exists()
 
+    def test_subscribe_bumps_version(self, client, podcast, auth_user, _locmem_cache):
+        version = get_subscriptions_version(auth_user.pk)
+        client.post(self.url(podcast), headers={"HX-Request": "true"})
+        assert get_subscriptions_version(auth_user.pk) != version
+
     @pytest.mark.django_db()(transaction=True)
     def test_already_subscribed(
         self,
@@ -531,6 +646,12 @@ class TestUnsubscribe:
             podcast=podcast, subscriber=auth_user
         ).exists()
 
+    def test_unsubscribe_bumps_version(self, client, auth_user, podcast, _locmem_cache):
+        SubscriptionFactory(subscriber=auth_user, podcast=podcast)
+        version = get_subscriptions_version(auth_user.pk)
+        client.delete(self.url(podcast), headers={"HX-Request": "true"})
+        assert get_subscriptions_version(auth_user.pk) != version
+
     def test_unsubscribe_private(self, client, auth_user):
         podcast = SubscriptionFactory(
             subscriber=auth_user, podcast=PodcastFactory(private=True)
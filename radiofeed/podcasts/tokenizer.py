@@ -1,6 +1,7 @@
 import contextlib
 import datetime
 import functools
+import itertools
 import re
 import unicodedata
 from typing import TYPE_CHECKING, Final
@@ -16,7 +17,7 @@ from nltk.tokenize import RegexpTokenizer
 from radiofeed.sanitizer import strip_html
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator
 
 _STOPWORDS_LANGUAGES: Final = {
     "ar": "arabic",
@@ -60,6 +61,9 @@ _CORPORATE_STOPWORDS: Final = {
     "itunes",
 }
 
+# Max number of (language, token) pairs memoized per process. Vocabulary follows
+# a long-tailed distribution, so this covers nearly all tokens seen in practice.
+_LEMMA_CACHE_SIZE: Final = 100_000
 
 _lemmatizer = WordNetLemmatizer()
 _tokenizer = RegexpTokenizer(r"\w+")
@@ -81,16 +85,31 @@ def tokenize(language: str, text: str) -> list[str]:
         text: text source
     """
     if text := clean_text(text).casefold():
-        stopwords_for_language = get_stopwords(language)
-
-        return [
-            token
-            for token in _lemmatized_tokens(text)
-            if token and token not in stopwords_for_language
-        ]
+        return list(_lemmatized_tokens(language, text))
     return []
 
 
+def tokenize_many(language: str, texts: Iterable[str]) -> list[list[str]]:
+    """Extract keywords from each text, as `tokenize`. Use for batches of texts in the
+    same language, e.g. when re-tokenizing many podcasts.
+
+    Tokens are lemmatized and checked against stopwords in one shared pass, once
+    for each distinct token in the batch.
+
+    Args:
+        language: 2-char language code e.g. "en"
+        texts: text sources
+    """
+    batch = [_tokenizer.tokenize(clean_text(text).casefold()) for text in texts]
+
+    lemmas = {
+        token: _safe_lemmatize(language, token)
+        for token in set(itertools.chain.from_iterable(batch))
+    }
+
+    return [[lemmas[token] for token in tokens if lemmas[token]] for tokens in batch]
+
+
 @functools.cache
 def get_language_codes() -> set[str]:
     """Return ISO 639 2-char language codes ."""
@@ -117,10 +136,23 @@ def get_stopwords(language: str) -> set[str]:
     }
 
 
-def _lemmatized_tokens(text: str) -> Iterator[str]:
+def _lemmatized_tokens(language: str, text: str) -> Iterator[str]:
     for token in _tokenizer.tokenize(text):
-        with contextlib.suppress(AttributeError):
-            yield _lemmatizer.lemmatize(token)
+        if lemma := _safe_lemmatize(language, token):
+            yield lemma
+
+
+def _safe_lemmatize(language: str, token: str) -> str:
+    with contextlib.suppress(AttributeError):
+        return _lemmatize(language, token)
+    return ""
+
+
+@functools.lru_cache(maxsize=_LEMMA_CACHE_SIZE)
+def _lemmatize(language: str, token: str) -> str:
+    # Returns empty string if lemma is a stopword
+    lemma = _lemmatizer.lemmatize(token)
+    return "" if lemma in get_stopwords(language) else lemma
 
 
 def _strip_accents(text: str) -> str:
@@ -22,6 +22,11 @@ urlpatterns = [
     path("discover/", views.discover, name="discover"),
     path("search/podcasts/", views.search_podcasts, name="search_podcasts"),
     path("search/people/", views.search_people, name="search_people"),
+    path(
+        "search/autocomplete/",
+        views.search_autocomplete,
+        name="search_autocomplete",
+    ),
     path("search/itunes/", views.search_itunes, name="search_itunes"),
     path(
         "podcasts/<slug:slug>-<int:podcast_id>/",
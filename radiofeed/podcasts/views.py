@@ -5,23 +5,37 @@ from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.db import IntegrityError
 from django.db.models import Exists, OuterRef
-from django.http import Http404, HttpResponseRedirect
 from django.shortcuts import get_object_or_404, redirect
 from django.template.response import TemplateResponse
 from django.views.decorators.http import require_POST, require_safe
 
 from radiofeed.client import get_client
-from radiofeed.episodes.models import Episode
-from radiofeed.http.decorators import require_DELETE, require_form_methods
+from radiofeed.http.decorators import (
+    conditional_page,
+    require_DELETE,
+    require_form_methods,
+)
 from radiofeed.http.response import HttpResponseConflict, RenderOrRedirectResponse
 from radiofeed.paginator import render_paginated_response
 from radiofeed.partials import render_partial_response
-from radiofeed.podcasts import itunes
+from radiofeed.podcasts import autocomplete, itunes, recommender
 from radiofeed.podcasts.forms import PodcastForm
-from radiofeed.podcasts.models import Category, Podcast, PodcastQuerySet
+from radiofeed.podcasts.models import (
+    Category,
+    Podcast,
+    PodcastQuerySet,
+    Recommendation,
+)
+from radiofeed.podcasts.subscriptions import (
+    bump_subscriptions_version,
+    get_subscriptions_version,
+)
 
 if TYPE_CHECKING:
+    from django.http import HttpResponseRedirect
+
     from radiofeed.http.request import AuthenticatedHttpRequest, HttpRequest
+    from radiofeed.users.models import User
 
 
 @require_safe
@@ -34,7 +48,12 @@ def subscriptions(request: AuthenticatedHttpRequest) -> TemplateResponse:
         podcasts = podcasts.search(request.search.value).order_by("-rank", "-pub_date")
     else:
         podcasts = podcasts.order_by("-pub_date")
-    return render_paginated_response(request, "podcasts/subscriptions.html", podcasts)
+    return render_paginated_response(
+        request,
+        "podcasts/subscriptions.html",
+        podcasts,
+        {"subscriptions_version": get_subscriptions_version(request.user.pk)},
+    )
 
 
 @require_safe
@@ -59,10 +78,10 @@ def search_podcasts(request: HttpRequest) -> RenderOrRedirectResponse:
     """Search all public podcasts in database. Redirects to discover page if search is empty."""
 
     if request.search:
-        podcasts = (
-            _get_public_podcasts()
-            .search(request.search.value)
-            .order_by("-rank", "-pub_date")
+        podcasts = _get_public_podcasts().search_cached(
+            request.search.value,
+            order_by=("-rank", "-pub_date"),
+            max_candidates=settings.SEARCH_MAX_CANDIDATES,
         )
 
         return render_paginated_response(
@@ -72,6 +91,19 @@ def search_podcasts(request: HttpRequest) -> RenderOrRedirectResponse:
     return redirect("podcasts:discover")
 
 
+@require_safe
+@login_required
+def search_autocomplete(request: HttpRequest) -> TemplateResponse:
+    """Render public podcasts matching a partial search, e.g. as the user types."""
+    return TemplateResponse(
+        request,
+        "podcasts/autocomplete.html",
+        {
+            "podcasts": autocomplete.search(request.search.value),
+        },
+    )
+
+
 @require_safe
 @login_required
 async def search_itunes(request: HttpRequest) -> RenderOrRedirectResponse:
@@ -106,13 +138,11 @@ def search_people(request: HttpRequest) -> RenderOrRedirectResponse:
     """Search all podcasts by owner(s). Redirects to discover page if no owner is given."""
 
     if request.search:
-        podcasts = (
-            _get_public_podcasts()
-            .search(
-                request.search.value,
-                "owner_search_vector",
-            )
-            .order_by("-rank", "-pub_date")
+        podcasts = _get_public_podcasts().search_cached(
+            request.search.value,
+            "owner_search_vector",
+            order_by=("-rank", "-pub_date"),
+            max_candidates=settings.SEARCH_MAX_CANDIDATES,
         )
         return render_paginated_response(
             request,
@@ -125,6 +155,9 @@ def search_people(request: HttpRequest) -> RenderOrRedirectResponse:
 
 @require_safe
 @login_required
+@conditional_page(
+    lambda request, podcast_id, **_: _get_podcast_version(podcast_id, request.user)
+)
 def podcast_detail(
     request: AuthenticatedHttpRequest,
     podcast_id: int,
@@ -153,17 +186,17 @@ def podcast_detail(
 @login_required
 def latest_episode(_, podcast_id: int) -> HttpResponseRedirect:
     """Redirects to latest episode."""
-    if (
-        episode := Episode.objects.filter(podcast__pk=podcast_id)
-        .order_by("-pub_date", "-id")
-        .first()
-    ):
-        return redirect(episode)
-    raise Http404
+    podcast = get_object_or_404(
+        Podcast.objects.select_related("latest_episode"),
+        pk=podcast_id,
+        latest_episode__isnull=False,
+    )
+    return redirect(podcast.latest_episode)
 
 
 @require_safe
 @login_required
+@conditional_page(lambda _, podcast_id, **__: _get_podcast_version(podcast_id))
 def episodes(
     request: HttpRequest,
     podcast_id: int,
@@ -190,11 +223,13 @@ def episodes(
             "podcast": podcast,
             "ordering": ordering,
         },
+        cursor=not request.search,
     )
 
 
 @require_safe
 @login_required
+@conditional_page(lambda _, podcast_id, **__: _get_podcast_version(podcast_id))
 def season(
     request: HttpRequest,
     podcast_id: int,
@@ -217,6 +252,7 @@ def season(
             "podcast": podcast,
             "season": podcast.get_season(season),
         },
+        cursor=True,
     )
 
 
@@ -227,13 +263,22 @@ def similar(
     podcast_id: int,
     slug: str | None = None,
 ) -> TemplateResponse:
-    """List similar podcasts based on recommendations."""
+    """List similar podcasts based on recommendations.
+
+    If no recommendations have been generated yet for this podcast, falls back to
+    querying the recommender index directly.
+    """
 
     podcast = get_object_or_404(_get_podcasts(), pk=podcast_id)
 
-    recommendations = podcast.recommendations.select_related("recommended").order_by(
-        "-score"
-    )[: settings.DEFAULT_PAGE_SIZE]
+    recommendations = list(
+        podcast.recommendations.select_related("recommended").order_by("-score")[
+            : settings.DEFAULT_PAGE_SIZE
+        ]
+    )
+
+    if not recommendations and not podcast.private:
+        recommendations = _find_similar_podcasts(podcast, settings.DEFAULT_PAGE_SIZE)
 
     return TemplateResponse(
         request,
@@ -280,7 +325,10 @@ def category_detail(request: HttpRequest, slug: str) -> TemplateResponse:
     podcasts = category.podcasts.published().filter(private=False).distinct()
 
     if request.search:
-        podcasts = podcasts.search(request.search.value).order_by("-rank", "-pub_date")
+        podcasts = podcasts.search_cached(
+            request.search.value,
+            order_by=("-rank", "-pub_date"),
+        )
     else:
         podcasts = podcasts.order_by("-pub_date")
 
@@ -307,6 +355,8 @@ def subscribe(
     except IntegrityError:
         return HttpResponseConflict()
 
+    bump_subscriptions_version(request.user.pk)
+
     messages.success(request, "Subscribed to Podcast")
 
     return _render_subscribe_action(request, podcast, is_subscribed=True)
@@ -318,6 +368,7 @@ def unsubscribe(request: AuthenticatedHttpRequest, podcast_id: int) -> TemplateR
     """Unsubscribe user from a podcast."""
     podcast = get_object_or_404(_get_public_podcasts(), pk=podcast_id)
     request.user.subscriptions.filter(podcast=podcast).delete()
+    bump_subscriptions_version(request.user.pk)
     messages.info(request, "Unsubscribed from Podcast")
     return _render_subscribe_action(request, podcast, is_subscribed=False)
 
@@ -348,6 +399,7 @@ def add_private_feed(request: AuthenticatedHttpRequest) -> RenderOrRedirectRespo
             podcast.save()
 
             request.user.subscriptions.create(podcast=podcast)
+            bump_subscriptions_version(request.user.pk)
 
             messages.success(
                 request,
@@ -379,10 +431,22 @@ def remove_private_feed(
         pk=podcast_id,
     ).delete()
 
+    bump_subscriptions_version(request.user.pk)
+
     messages.info(request, "Removed from Private Feeds")
     return redirect("podcasts:private_feeds")
 
 
+def _get_podcast_version(podcast_id: int, user: User | None = None) -> tuple | None:
+    # Podcast pages change only when the podcast is updated, e.g. by the feed
+    # parser, or when the user subscribes or unsubscribes.
+    if updated := (
+        _get_podcasts().filter(pk=podcast_id).values_list("updated", flat=True).first()
+    ):
+        return (updated, get_subscriptions_version(user.pk) if user else None)
+    return None
+
+
 def _get_podcasts() -> PodcastQuerySet:
     return Podcast.objects.published()
 
@@ -395,6 +459,30 @@ def _get_private_podcasts() -> PodcastQuerySet:
     return _get_podcasts().filter(private=True)
 
 
+def _find_similar_podcasts(podcast: Podcast, limit: int) -> list[Recommendation]:
+    matches = [
+        (podcast_id, similarity)
+        for podcast_id, similarity in recommender.find_similar(
+            podcast.language,
+            podcast.extracted_text,
+            limit=limit + 1,
+        )
+        if podcast_id != podcast.pk
+    ][:limit]
+
+    podcasts = _get_public_podcasts().in_bulk([podcast_id for podcast_id, _ in matches])
+
+    return [
+        Recommendation(
+            podcast=podcast,
+            recommended=podcasts[podcast_id],
+            score=similarity,
+        )
+        for podcast_id, similarity in matches
+        if podcast_id in podcasts
+    ]
+
+
 def _render_subscribe_action(
     request: HttpRequest,
     podcast: Podcast,
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, TypeAlias
 import lxml.etree
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator
 
 Namespaces: TypeAlias = tuple[tuple[str, str], ...]
 OptionalXmlElement: TypeAlias = lxml.etree._Element | None
@@ -34,10 +34,30 @@ class XPathParser:
                 if paths:
                     yield from self.iterfind(element, *paths)
             finally:
-                element.clear()
-                with contextlib.suppress(AttributeError, TypeError):
-                    while element.getprevious() is not None:
-                        del element.getparent()[0]
+                _clear(element)
+
+    def iterparse_chunks(
+        self, chunks: Iterable[bytes], tag: str | None = None, *paths: str
+    ) -> Iterator:
+        """Parses document fed in chunks into iterable of paths.
+
+        Only the current chunk and unprocessed elements are held in memory, so
+        large documents e.g. uploaded files can be parsed incrementally.
+        """
+        parser = lxml.etree.XMLPullParser(
+            tag=tag,
+            no_network=True,
+            resolve_entities=False,
+            recover=True,
+            events=("end",),
+        )
+
+        for chunk in chunks:
+            parser.feed(chunk)
+            yield from self._read_events(parser, *paths)
+
+        parser.close()
+        yield from self._read_events(parser, *paths)
 
     def find(self, *args, **kwargs) -> OptionalXmlElement:
         """Returns first matching element, or None if not found."""
@@ -67,6 +87,21 @@ class XPathParser:
                 if isinstance(value, str) and (cleaned := value.strip()):
                     yield cleaned
 
+    def _read_events(self, parser: lxml.etree.XMLPullParser, *paths: str) -> Iterator:
+        for _, element in parser.read_events():
+            try:
+                if paths:
+                    yield from self.iterfind(element, *paths)
+            finally:
+                _clear(element)
+
+
+def _clear(element: lxml.etree._Element) -> None:
+    element.clear()
+    with contextlib.suppress(AttributeError, TypeError):
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+
 
 @functools.cache
 def _xpath(path: str, namespaces: Namespaces) -> lxml.etree.XPath:
@@ -1,14 +1,23 @@
+import collections
+import dataclasses
 import functools
+import hashlib
 import html
+import logging
 import re
-from typing import Final
+from typing import TYPE_CHECKING, Final
 
 import nh3
-from django.template.defaultfilters import striptags
+from django.core.cache import cache
 from django.utils.safestring import mark_safe
 from markdown_it import MarkdownIt
 from markdownify import markdownify
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from markdown_it.token import Token
+
 _ALLOWED_TAGS: Final = {
     "a",
     "abbr",
@@ -66,6 +75,47 @@ _TAG_ATTRIBUTES: Final = {
     },
 }
 
+# Bump whenever rendering rules change, so that stale HTML is not served from cache
+_MARKDOWN_CACHE_VERSION: Final = 1
+_MARKDOWN_CACHE_SIZE: Final = 1024
+_MARKDOWN_CACHE_TIMEOUT: Final = 60 * 60 * 24 * 7  # 1 week
+
+# Log cache stats after this many lookups in each process
+_MARKDOWN_CACHE_LOG_INTERVAL: Final = 1000
+
+logger = logging.getLogger(__name__)
+
+_markdown_cache_stats: collections.Counter[str] = collections.Counter()
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True)
+class CacheStats:
+    """Lookups of rendered Markdown in this process."""
+
+    local_hits: int
+    shared_hits: int
+    misses: int
+
+    @property
+    def lookups(self) -> int:
+        """Returns total number of lookups."""
+        return self.local_hits + self.shared_hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Returns fraction of lookups found in either cache."""
+        return (
+            (self.local_hits + self.shared_hits) / self.lookups if self.lookups else 0.0
+        )
+
+    def __str__(self) -> str:
+        """Returns summary of stats."""
+        return (
+            f"lookups={self.lookups} local_hits={self.local_hits} "
+            f"shared_hits={self.shared_hits} misses={self.misses} "
+            f"hit_rate={self.hit_rate:.1%}"
+        )
+
 
 @mark_safe  # noqa: S308
 def markdown(content: str) -> str:
@@ -83,6 +133,57 @@ def markdown(content: str) -> str:
     )
 
 
+def markdown_cached(content: str) -> str:
+    """Renders Markdown as `markdown`, cached by hash of content.
+
+    Rendered HTML is cached in a per-process LRU cache, backed by the Django cache
+    shared by all processes.
+    """
+    if not content:
+        return markdown(content)
+
+    rendered = _markdown_cached(content)
+
+    _markdown_cache_stats["lookups"] += 1
+
+    if _markdown_cache_stats["lookups"] % _MARKDOWN_CACHE_LOG_INTERVAL == 0:
+        logger.info("Markdown cache: %s", get_markdown_cache_stats())
+
+    return rendered
+
+
+def get_markdown_cache_stats() -> CacheStats:
+    """Returns stats of `markdown_cached` lookups in this process."""
+    shared_hits = _markdown_cache_stats["shared_hits"]
+    misses = _markdown_cache_stats["misses"]
+    return CacheStats(
+        local_hits=_markdown_cache_stats["lookups"] - shared_hits - misses,
+        shared_hits=shared_hits,
+        misses=misses,
+    )
+
+
+def clear_markdown_cache() -> None:
+    """Clears the per-process cache and stats of `markdown_cached`."""
+    _markdown_cached.cache_clear()
+    _markdown_cache_stats.clear()
+
+
+@functools.lru_cache(maxsize=_MARKDOWN_CACHE_SIZE)
+def _markdown_cached(content: str) -> str:
+    digest = hashlib.sha256(content.encode()).hexdigest()
+    cache_key = f"sanitizer:markdown:v{_MARKDOWN_CACHE_VERSION}:{digest}"
+
+    if (rendered := cache.get(cache_key)) is None:
+        rendered = markdown(content)
+        cache.set(cache_key, str(rendered), timeout=_MARKDOWN_CACHE_TIMEOUT)
+        _markdown_cache_stats["misses"] += 1
+    else:
+        _markdown_cache_stats["shared_hits"] += 1
+
+    return mark_safe(rendered)  # noqa: S308
+
+
 @functools.cache
 def _markdown():
     return MarkdownIt(
@@ -104,9 +205,26 @@ def strip_html(content: str) -> str:
     """Scrubs all HTML tags and entities from text.
     Removes content from any style or script tags.
 
-    If content is Markdown, will attempt to render to HTML first.
+    Returns the same visible text as `markdown`, but extracts it directly rather than
+    rendering Markdown to HTML and stripping the tags.
     """
-    return strip_extra_spaces(html.unescape(striptags(markdown(content))))
+    if nh3.is_html(content):
+        # Block tags are replaced by line breaks, then all other tags removed
+        content = html.unescape(
+            nh3.clean(
+                _re_block_tags().sub("\n", content),
+                clean_content_tags=_CLEAN_TAGS,
+                tags=set(),
+            )
+        )
+        parser = _typographer()
+    elif "://" in content or "www." in content:
+        parser = _markdown()
+    else:
+        # Linkify does not change visible text, but is by far the slowest rule
+        parser = _markdown_text()
+
+    return strip_extra_spaces("".join(_extract_text(parser.parse(content))))
 
 
 def strip_extra_spaces(value: str) -> str:
@@ -121,6 +239,60 @@ def strip_extra_spaces(value: str) -> str:
     return "\n".join(lines)
 
 
+def _extract_text(tokens: list[Token]) -> Iterator[str]:
+    for token in tokens:
+        if token.type == "inline":
+            for child in token.children or []:
+                if child.type in {"text", "code_inline"}:
+                    yield child.content
+                elif child.type in {"softbreak", "hardbreak"}:
+                    yield "\n"
+        elif token.type in {"code_block", "fence"}:
+            yield token.content
+        elif token.nesting == -1 or token.type == "hr":
+            yield "\n"
+
+
+@functools.cache
+def _markdown_text():
+    return MarkdownIt(
+        "commonmark",
+        {
+            "typographer": True,
+        },
+    ).enable(
+        [
+            "replacements",
+            "smartquotes",
+        ]
+    )
+
+
+@functools.cache
+def _typographer():
+    # Applies typographic replacements only, without parsing any Markdown
+    return MarkdownIt(
+        "zero",
+        {
+            "typographer": True,
+        },
+    ).enable(
+        [
+            "replacements",
+            "smartquotes",
+        ]
+    )
+
+
+@functools.cache
+def _re_block_tags() -> re.Pattern:
+    return re.compile(
+        r"<\s*/?\s*(?:address|article|aside|blockquote|br|dd|div|dl|dt|figcaption|"
+        r"footer|h[1-6]|header|hr|li|ol|p|pre|section|table|td|th|tr|ul)\b[^>]*>",
+        flags=re.IGNORECASE,
+    )
+
+
 @functools.cache
 def _re_extra_spaces() -> re.Pattern:
     return re.compile(r" +")
@@ -9,6 +9,7 @@ from django.forms.utils import flatatt
 from django.shortcuts import resolve_url
 from django.utils import timezone
 from django.utils.html import format_html, format_html_join
+from django.utils.safestring import SafeData
 from django.utils.timesince import timesince
 
 from radiofeed import covers, sanitizer
@@ -113,8 +114,14 @@ def absolute_uri(site: Site, path: str, *args, **kwargs) -> str:
 
 @register.inclusion_tag("markdown.html")
 def markdown(text: str) -> dict:
-    """Render content as Markdown."""
-    return {"markdown": sanitizer.markdown(text)}
+    """Render content as Markdown.
+
+    Content already rendered to safe HTML, e.g. `Podcast.rendered_description`, is
+    not rendered again.
+    """
+    if isinstance(text, SafeData):
+        return {"markdown": text}
+    return {"markdown": sanitizer.markdown_cached(text)}
 
 
 @register.inclusion_tag("cookie_banner.html", takes_context=True)
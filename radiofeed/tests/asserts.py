@@ -15,6 +15,7 @@ def assert_status(response: HttpResponse, status: http.HTTPStatus) -> None:
 
 assert200 = functools.partial(assert_status, status=http.HTTPStatus.OK)
 assert204 = functools.partial(assert_status, status=http.HTTPStatus.NO_CONTENT)
+assert304 = functools.partial(assert_status, status=http.HTTPStatus.NOT_MODIFIED)
 assert400 = functools.partial(assert_status, status=http.HTTPStatus.BAD_REQUEST)
 assert401 = functools.partial(assert_status, status=http.HTTPStatus.UNAUTHORIZED)
 assert404 = functools.partial(assert_status, status=http.HTTPStatus.NOT_FOUND)
@@ -0,0 +1,81 @@
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpResponse
+from django_htmx.middleware import HtmxDetails
+
+from radiofeed.episodes.middleware import PlayerDetails
+from radiofeed.http.decorators import conditional_page
+from radiofeed.tests.asserts import assert200, assert304
+
+
+@conditional_page(lambda _, version: version)
+def _view(request, version):
+    return HttpResponse("ok")
+
+
+class TestConditionalPage:
+    def make_request(self, rf, *, user=None, player=None, **headers):
+        req = rf.get("/", headers=headers)
+        req.user = user or AnonymousUser()
+        req.session = {"audio-player": player} if player else {}
+        req.htmx = HtmxDetails(req)
+        req.player = PlayerDetails(request=req)
+        return req
+
+    def test_etag(self, rf):
+        response = _view(self.make_request(rf), version=1)
+        assert200(response)
+        assert response.has_header("ETag")
+        assert "private" in response["Cache-Control"]
+        assert "no-cache" in response["Cache-Control"]
+
+    def test_not_modified(self, rf):
+        etag = _view(self.make_request(rf), version=1)["ETag"]
+        response = _view(self.make_request(rf, if_none_match=etag), version=1)
+        assert304(response)
+        assert response["ETag"] == etag
+        assert "no-cache" in response["Cache-Control"]
+
+    def test_version_changed(self, rf):
+        etag = _view(self.make_request(rf), version=1)["ETag"]
+        response = _view(self.make_request(rf, if_none_match=etag), version=2)
+        assert200(response)
+        assert response["ETag"] != etag
+
+    def test_htmx_target_changed(self, rf):
+        etag = _view(self.make_request(rf, hx_request="true"), version=1)["ETag"]
+        response = _view(
+            self.make_request(
+                rf, hx_request="true", hx_target="pagination", if_none_match=etag
+            ),
+            version=1,
+        )
+        assert200(response)
+
+    def test_no_version(self, rf):
+        response = _view(self.make_request(rf), version=None)
+        assert200(response)
+        assert not response.has_header("ETag")
+        assert not response.has_header("Cache-Control")
+
+    def test_player_full_page(self, rf):
+        response = _view(self.make_request(rf, player=1), version=1)
+        assert not response.has_header("ETag")
+
+    def test_player_htmx(self, rf):
+        response = _view(self.make_request(rf, player=1, hx_request="true"), version=1)
+        assert response.has_header("ETag")
+
+    def test_pending_messages(self, rf):
+        req = self.make_request(rf)
+        req._messages = ["message"]
+        response = _view(req, version=1)
+        assert not response.has_header("ETag")
+
+    @pytest.mark.django_db
+    def test_user_changed(self, rf, user):
+        etag = _view(self.make_request(rf), version=1)["ETag"]
+        response = _view(
+            self.make_request(rf, user=user, if_none_match=etag), version=1
+        )
+        assert200(response)
@@ -1,7 +1,20 @@
+import datetime
+
 import pytest
 from django.core.paginator import EmptyPage, PageNotAnInteger
+from django.db.models import F
+from django.utils import timezone
 
-from radiofeed.paginator import Paginator, validate_page_number
+from radiofeed.episodes.models import Episode
+from radiofeed.episodes.tests.factories import EpisodeFactory
+from radiofeed.paginator import (
+    Cursor,
+    CursorPaginator,
+    Paginator,
+    validate_page_number,
+)
+from radiofeed.podcasts.models import Category
+from radiofeed.podcasts.tests.factories import CategoryFactory
 
 
 class TestPage:
@@ -111,3 +124,158 @@ class TestPaginator:
         assert page.number == 1
         assert page.has_next is False
         assert page.has_previous is False
+
+
+class TestCursor:
+    def test_encode_decode(self):
+        now = timezone.now()
+        cursor = Cursor(values=(now, 1), reverse=True)
+        decoded = Cursor.decode(cursor.encode())
+        assert decoded.values == (now.isoformat(), 1)
+        assert decoded.reverse is True
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pytest.param("oops", id="not base64"),
+            pytest.param("b29wcw==", id="not json"),
+            pytest.param("W10=", id="not dict"),
+            pytest.param(Cursor(values=()).encode(), id="empty"),
+        ],
+    )
+    def test_decode_invalid(self, value):
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            Cursor.decode(value)
+
+
+@pytest.mark.django_db
+class TestCursorPaginator:
+    @pytest.fixture
+    def episodes(self, podcast):
+        # episodes with the same pub date should not be skipped
+        now = timezone.now()
+        return [
+            EpisodeFactory(
+                podcast=podcast,
+                pub_date=now - datetime.timedelta(days=num // 2),
+            )
+            for num in range(7)
+        ]
+
+    def test_pages(self, episodes):
+        queryset = Episode.objects.order_by("-pub_date")
+        expected = list(queryset.order_by("-pub_date", "-pk"))
+
+        paginator = CursorPaginator(queryset, 2)
+        page = paginator.get_page(None)
+
+        assert repr(page) == "<CursorPage None>"
+        assert page.has_previous is False
+
+        with pytest.raises(EmptyPage):
+            assert page.previous_page_number
+
+        pages = [page]
+
+        while page.has_next:
+            page = paginator.get_page(page.next_page_number)
+            pages.append(page)
+
+        assert [len(page) for page in pages] == [2, 2, 2, 1]
+        assert [item for page in pages for item in page] == expected
+        assert all(page.has_other_pages for page in pages)
+
+        with pytest.raises(EmptyPage):
+            assert page.next_page_number
+
+        # and back again to the first page
+        while page.has_previous:
+            page = paginator.get_page(page.previous_page_number)
+            assert page.has_next is True
+            assert page[:] == pages.pop(-2).object_list
+
+        assert len(pages) == 1
+
+    def test_ascending(self, episodes):
+        queryset = Episode.objects.order_by("pub_date", "id")
+        paginator = CursorPaginator(queryset, 4)
+
+        page = paginator.get_page(None)
+        next_page = paginator.get_page(page.next_page_number)
+
+        assert [*page, *next_page] == list(queryset)
+        assert next_page.has_next is False
+
+    def test_annotation(self, episodes):
+        queryset = Episode.objects.annotate(days=F("pub_date")).order_by("-days")
+        paginator = CursorPaginator(queryset, 4)
+
+        page = paginator.get_page(None)
+        next_page = paginator.get_page(page.next_page_number)
+
+        assert [*page, *next_page] == list(queryset.order_by("-days", "-pk"))
+
+    def test_related_field(self, episodes):
+        queryset = Episode.objects.order_by("podcast__pub_date", "pk")
+        paginator = CursorPaginator(queryset, 4)
+
+        page = paginator.get_page(None)
+        next_page = paginator.get_page(page.next_page_number)
+
+        assert [*page, *next_page] == list(queryset)
+
+    def test_meta_ordering(self):
+        categories = [CategoryFactory(name=name) for name in "abc"]
+        paginator = CursorPaginator(Category.objects.all(), 2)
+
+        page = paginator.get_page(None)
+        next_page = paginator.get_page(page.next_page_number)
+
+        assert [*page, *next_page] == categories
+
+    def test_not_ordered(self):
+        with pytest.raises(ValueError, match="ordered"):
+            CursorPaginator(Episode.objects.all(), 2)
+
+    def test_ordered_by_expression(self):
+        with pytest.raises(ValueError, match="ordered"):
+            CursorPaginator(Episode.objects.order_by(F("pub_date").desc()), 2)
+
+    def test_empty(self):
+        page = CursorPaginator(Episode.objects.order_by("-pub_date"), 2).get_page(None)
+        assert len(page) == 0
+        assert page.has_next is False
+        assert page.has_previous is False
+        assert page.has_other_pages is False
+
+    def test_no_items_after_cursor(self, episodes):
+        paginator = CursorPaginator(Episode.objects.order_by("pk"), 2)
+        page = paginator.get_page(Cursor(values=(episodes[-1].pk,)).encode())
+
+        assert len(page) == 0
+        assert page.has_next is False
+        assert page.has_previous is False
+
+    def test_no_items_before_cursor(self, episodes):
+        paginator = CursorPaginator(Episode.objects.order_by("pk"), 2)
+        page = paginator.get_page(
+            Cursor(values=(episodes[0].pk,), reverse=True).encode()
+        )
+
+        assert len(page) == 0
+        assert page.has_next is False
+        assert page.has_previous is False
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pytest.param("oops", id="invalid"),
+            pytest.param(Cursor(values=(1,)).encode(), id="wrong length"),
+            pytest.param(Cursor(values=("oops", 1)).encode(), id="wrong type"),
+        ],
+    )
+    def test_invalid_cursor(self, episodes, value):
+        page = CursorPaginator(Episode.objects.order_by("-pub_date"), 2).get_page(value)
+        assert page.cursor is None
+        assert page.has_previous is False
+        assert len(page) == 2
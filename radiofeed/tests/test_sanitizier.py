@@ -1,6 +1,18 @@
+import html
+
 import pytest
+from django.template.defaultfilters import striptags
 
-from radiofeed.sanitizer import markdown, strip_extra_spaces, strip_html
+from radiofeed.sanitizer import (
+    CacheStats,
+    _markdown_cached,
+    clear_markdown_cache,
+    get_markdown_cache_stats,
+    markdown,
+    markdown_cached,
+    strip_extra_spaces,
+    strip_html,
+)
 
 
 class TestMarkdown:
@@ -27,6 +39,59 @@ class TestMarkdown:
         assert markdown("<script>alert('xss ahoy!')</script>") == ""
 
 
+class TestMarkdownCached:
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self, _locmem_cache):
+        clear_markdown_cache()
+        yield
+        clear_markdown_cache()
+
+    def test_empty(self):
+        assert markdown_cached("") == ""
+        assert get_markdown_cache_stats().lookups == 0
+
+    def test_cached(self):
+        expected = "<p><strong>test</strong></p>\n"
+
+        # rendered
+        assert markdown_cached("**test**") == expected
+        # found in process
+        assert markdown_cached("**test**") == expected
+
+        # found in shared cache, e.g. by another process
+        _markdown_cached.cache_clear()
+        assert markdown_cached("**test**") == expected
+
+        stats = get_markdown_cache_stats()
+
+        assert stats.lookups == 3
+        assert stats.local_hits == 1
+        assert stats.shared_hits == 1
+        assert stats.misses == 1
+
+    def test_log_stats(self, mocker):
+        mocker.patch("radiofeed.sanitizer._MARKDOWN_CACHE_LOG_INTERVAL", 2)
+        mock_logger = mocker.patch("radiofeed.sanitizer.logger")
+
+        markdown_cached("test")
+        mock_logger.info.assert_not_called()
+
+        markdown_cached("test")
+        mock_logger.info.assert_called_once()
+
+
+class TestCacheStats:
+    def test_no_lookups(self):
+        stats = CacheStats(local_hits=0, shared_hits=0, misses=0)
+        assert stats.hit_rate == 0.0
+
+    def test_str(self):
+        stats = CacheStats(local_hits=2, shared_hits=1, misses=1)
+        assert str(stats) == (
+            "lookups=4 local_hits=2 shared_hits=1 misses=1 hit_rate=75.0%"
+        )
+
+
 class TestStripHtml:
     @pytest.mark.parametrize(
         (
@@ -37,10 +102,43 @@ class TestStripHtml:
             pytest.param("", "", id="empty"),
             pytest.param("  ", "", id="spaces"),
             pytest.param("<p>this &amp; that</p>", "this & that", id="html"),
+            pytest.param(
+                "<p>First</p><p>Second <b>bold</b></p><script>alert(1)</script>",
+                "First\nSecond bold",
+                id="html blocks",
+            ),
+            pytest.param(
+                "<div>one<br>two</div><ul><li>a</li><li>b</li></ul>",
+                "one\ntwo\na\nb",
+                id="html line breaks",
+            ),
+            pytest.param('<p>Tom\'s "show"</p>', "Tom’s “show”", id="html quotes"),
+            pytest.param(
+                "# Title\n\n**bold** and `code` -- (c)",
+                "Title\nbold and code – ©",
+                id="markdown",
+            ),
+            pytest.param(
+                "see https://example.com\n\n- one\n- two",
+                "see https://example.com\none\ntwo",
+                id="markdown links",
+            ),
+            pytest.param(
+                "![image](https://example.com/a.png) text",
+                "text",
+                id="markdown image",
+            ),
+            pytest.param(
+                "```\nfenced\n```\n\n---\nafter",
+                "fenced\nafter",
+                id="markdown code",
+            ),
         ],
     )
     def test_strip_html(self, value, expected):
         assert strip_html(value) == expected
+        # same text as rendering Markdown to HTML and stripping the tags
+        assert strip_extra_spaces(html.unescape(striptags(markdown(value)))) == expected
 
 
 class TestStripExtraSpaces:
@@ -1,9 +1,10 @@
 import pytest
 from django.contrib.sites.models import Site
 from django.template import TemplateSyntaxError
+from django.utils.safestring import mark_safe
 
 from radiofeed.http.request import RequestContext
-from radiofeed.templatetags import cookie_banner, format_duration, fragment
+from radiofeed.templatetags import cookie_banner, format_duration, fragment, markdown
 
 
 @pytest.fixture
@@ -48,6 +49,15 @@ class TestFragment:
             fragment(context, "header.html#title", "test")
 
 
+class TestMarkdown:
+    def test_render(self):
+        assert markdown("**test**")["markdown"] == "<p><strong>test</strong></p>\n"
+
+    def test_already_rendered(self):
+        html = mark_safe("<p>**test**</p>")  # noqa: S308
+        assert markdown(html)["markdown"] == html
+
+
 class TestCookieBanner:
     def test_not_accepted(self, rf):
         req = rf.get("/")
@@ -5,7 +5,11 @@ from django.db import models
 
 if TYPE_CHECKING:
     from radiofeed.episodes.models import AudioLogQuerySet, BookmarkQuerySet
-    from radiofeed.podcasts.models import PodcastQuerySet, Subscription
+    from radiofeed.podcasts.models import (
+        PodcastQuerySet,
+        Subscription,
+        UserRecommendation,
+    )
 
 
 class User(AbstractUser):
@@ -18,6 +22,7 @@ class User(AbstractUser):
         audio_logs: AudioLogQuerySet
         bookmarks: BookmarkQuerySet
         subscriptions: models.Manager[Subscription]
+        podcast_recommendations: models.Manager[UserRecommendation]
 
     @property
     def name(self):
@@ -8,7 +8,8 @@ from pytest_django.asserts import assertTemplateUsed
 
 from radiofeed.episodes.middleware import PlayerDetails
 from radiofeed.episodes.tests.factories import AudioLogFactory, BookmarkFactory
-from radiofeed.podcasts.models import Subscription
+from radiofeed.podcasts.models import Podcast, Subscription
+from radiofeed.podcasts.opml_parser import parse_opml
 from radiofeed.podcasts.tests.factories import PodcastFactory, SubscriptionFactory
 from radiofeed.tests.asserts import assert200
 from radiofeed.users.models import User
@@ -183,7 +184,72 @@ class TestImportPodcastFeeds:
         )
         assert200(response)
 
-        assert Subscription.objects.filter(subscriber=auth_user).count() == 0
+        assert Podcast.objects.count() == 11
+        assert Podcast.objects.filter(parsed__isnull=True).count() == 11
+        assert Subscription.objects.filter(subscriber=auth_user).count() == 11
+
+    @pytest.mark.django_db
+    def test_post_max_new_podcasts(self, client, auth_user, upload_file, settings):
+        settings.OPML_IMPORT_MAX_NEW_PODCASTS = 3
+
+        podcast = PodcastFactory(rss="https://changelog.com/podcast/feed")
+
+        response = client.post(self.url, data={"opml": upload_file})
+        assert response.url == self.url
+
+        assert Podcast.objects.count() == 4
+        assert Subscription.objects.filter(subscriber=auth_user).count() == 4
+        assert Subscription.objects.filter(
+            subscriber=auth_user, podcast=podcast
+        ).exists()
+
+    @pytest.mark.django_db
+    def test_post_no_new_podcasts(self, client, auth_user, upload_file, settings):
+        settings.OPML_IMPORT_MAX_NEW_PODCASTS = 0
+
+        podcast = PodcastFactory(rss="https://changelog.com/podcast/feed")
+
+        response = client.post(self.url, data={"opml": upload_file})
+        assert response.url == self.url
+
+        assert Podcast.objects.count() == 1
+        assert (
+            Subscription.objects.filter(subscriber=auth_user).get().podcast == podcast
+        )
+
+    @pytest.mark.django_db
+    def test_post_invalid_feeds(self, client, auth_user):
+        upload_file = SimpleUploadedFile(
+            "feeds.opml",
+            b"""<?xml version="1.0" encoding="UTF-8"?>
+<opml version="1.0"><body>
+<outline type="rss" xmlUrl="https://example.com/rss" />
+<outline type="rss" xmlUrl="javascript:alert(1)" />
+<outline type="rss" xmlUrl="not a url" />
+</body></opml>""",
+            content_type="text/xml",
+        )
+        response = client.post(self.url, data={"opml": upload_file})
+        assert response.url == self.url
+
+        assert list(Podcast.objects.values_list("rss", flat=True)) == [
+            "https://example.com/rss"
+        ]
+        assert Subscription.objects.filter(subscriber=auth_user).count() == 1
+
+    @pytest.mark.django_db
+    def test_post_private_and_inactive_feeds(self, client, auth_user, upload_file):
+        PodcastFactory(
+            rss="https://feeds.99percentinvisible.org/99percentinvisible",
+            private=True,
+        )
+        PodcastFactory(rss="https://feeds.fireside.fm/elixirmix/rss", active=False)
+
+        response = client.post(self.url, data={"opml": upload_file})
+        assert response.url == self.url
+
+        assert Podcast.objects.count() == 11
+        assert Subscription.objects.filter(subscriber=auth_user).count() == 9
 
     @pytest.mark.django_db
     def test_post_has_no_new_feeds(self, client, auth_user, upload_file):
@@ -225,9 +291,16 @@ class TestExportPodcastFeeds:
     url = reverse_lazy("users:export_podcast_feeds")
 
     def test_export_opml(self, client, auth_user):
-        SubscriptionFactory.create_batch(3, subscriber=auth_user)
+        subscriptions = SubscriptionFactory.create_batch(3, subscriber=auth_user)
+        SubscriptionFactory(subscriber=auth_user, podcast__private=True)
         response = client.get(self.url)
         assert response["Content-Type"] == "text/x-opml"
+        assert response.streaming
+
+        feeds = parse_opml(b"".join(response.streaming_content))
+        assert set(feeds) == {
+            subscription.podcast.rss for subscription in subscriptions
+        }
 
 
 @pytest.mark.django_db
@@ -2,10 +2,12 @@ import itertools
 from typing import TYPE_CHECKING, TypedDict
 
 from allauth.account.models import EmailAddress
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth import logout
 from django.contrib.auth.decorators import login_required
 from django.core.signing import BadSignature
+from django.http import StreamingHttpResponse
 from django.shortcuts import redirect
 from django.template.response import TemplateResponse
 from django.urls import reverse
@@ -21,6 +23,8 @@ from radiofeed.http.request import (
 from radiofeed.partials import render_partial_response
 from radiofeed.podcasts.forms import OpmlUploadForm
 from radiofeed.podcasts.models import Podcast, Subscription
+from radiofeed.podcasts.opml_writer import write_opml
+from radiofeed.podcasts.subscriptions import bump_subscriptions_version
 from radiofeed.users.forms import (
     AccountDeletionConfirmationForm,
     UserPreferencesForm,
@@ -67,22 +71,54 @@ def user_preferences(request: AuthenticatedHttpRequest) -> RenderOrRedirectRespo
 @require_form_methods
 @login_required
 def import_podcast_feeds(
-    request: AuthenticatedHttpRequest, feed_limit: int = 360
+    request: AuthenticatedHttpRequest, batch_size: int = 500
 ) -> RenderOrRedirectResponse:
-    """Imports an OPML document and subscribes user to any discovered feeds."""
+    """Imports an OPML document and subscribes user to any discovered feeds.
+
+    Feeds not already in the database are added as new podcasts, which are
+    parsed ahead of existing podcasts, up to `OPML_IMPORT_MAX_NEW_PODCASTS` per
+    import. Feeds are imported in batches as the document is parsed, so large
+    documents can be imported in one request.
+    """
     if request.method == "POST":
         form = OpmlUploadForm(request.POST, request.FILES)
         if form.is_valid():
-            feeds = itertools.islice(form.parse_opml(), feed_limit)
-            podcasts = Podcast.objects.filter(active=True, private=False, rss__in=feeds)
-
-            Subscription.objects.bulk_create(
-                (
-                    Subscription(subscriber=request.user, podcast=podcast)
-                    for podcast in podcasts
-                ),
-                ignore_conflicts=True,
-            )
+            max_new_podcasts = settings.OPML_IMPORT_MAX_NEW_PODCASTS
+
+            for batch in itertools.batched(form.parse_opml(), batch_size, strict=False):
+                feeds = list(dict.fromkeys(batch))
+
+                if max_new_podcasts > 0:
+                    existing = set(
+                        Podcast.objects.filter(rss__in=feeds).values_list(
+                            "rss", flat=True
+                        )
+                    )
+                    new_feeds = [rss for rss in feeds if rss not in existing][
+                        :max_new_podcasts
+                    ]
+                    max_new_podcasts -= len(new_feeds)
+
+                    Podcast.objects.bulk_create(
+                        (Podcast(rss=rss) for rss in new_feeds),
+                        ignore_conflicts=True,
+                    )
+
+                podcast_ids = Podcast.objects.filter(
+                    active=True,
+                    private=False,
+                    rss__in=feeds,
+                ).values_list("pk", flat=True)
+
+                Subscription.objects.bulk_create(
+                    (
+                        Subscription(subscriber=request.user, podcast_id=podcast_id)
+                        for podcast_id in podcast_ids
+                    ),
+                    ignore_conflicts=True,
+                )
+
+            bump_subscriptions_version(request.user.pk)
 
             messages.success(request, "You have been subscribed to new podcast feeds.")
             return redirect("users:import_podcast_feeds")
@@ -102,8 +138,14 @@ def import_podcast_feeds(
 
 @require_safe
 @login_required
-def export_podcast_feeds(request: AuthenticatedHttpRequest) -> TemplateResponse:
-    """Download OPML document containing public feeds from user's subscriptions."""
+def export_podcast_feeds(
+    request: AuthenticatedHttpRequest,
+) -> StreamingHttpResponse:
+    """Download OPML document containing public feeds from user's subscriptions.
+
+    The document is streamed as podcasts are fetched with a server-side cursor, so
+    large exports are not held in memory.
+    """
 
     podcasts = (
         Podcast.objects.published()
@@ -112,17 +154,16 @@ def export_podcast_feeds(request: AuthenticatedHttpRequest) -> TemplateResponse:
             private=False,
         )
         .order_by("-pub_date")
+        .only("title", "description", "description_text", "rss", "website")
     )
 
     filename = f"podcasts-{timezone.now().strftime('%Y-%m-%d')}.opml"
 
-    return TemplateResponse(
-        request,
-        "account/export.opml",
-        {
-            "site": request.site,
-            "podcasts": podcasts,
-        },
+    return StreamingHttpResponse(
+        write_opml(
+            podcasts.iterator(chunk_size=500),
+            f"Podcasts for {request.site.name}",
+        ),
         content_type="text/x-opml",
         headers={
             "Content-Disposition": f"attachment; filename={filename}",